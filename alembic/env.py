@@ -4,6 +4,8 @@ from sqlalchemy import engine_from_config, pool
 
 # Ensure all model modules are imported so Base.metadata is complete for autogenerate.
 import ai_job_aggregator.models.scoring  # noqa: F401
+import ai_job_aggregator.models.skill_index  # noqa: F401
+from ai_job_aggregator.fts import FTS_TABLE
 from ai_job_aggregator.models import Base
 from ai_job_aggregator.settings import Settings
 from alembic import context
@@ -24,6 +26,12 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    # The FTS5 table and its shadow tables are managed by ai_job_aggregator.fts.
+    return not (type_ == "table" and name.startswith(FTS_TABLE))
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -47,6 +55,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -68,7 +77,11 @@ def run_migrations_online() -> None:
     connectable = engine_from_config(section, prefix="sqlalchemy.", poolclass=pool.NullPool)
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
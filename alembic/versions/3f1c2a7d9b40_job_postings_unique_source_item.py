@@ -0,0 +1,58 @@
+"""job_postings unique (source, source_item_id)
+
+Revision ID: 3f1c2a7d9b40
+Revises: 8dcd53ce4df0
+Create Date: 2026-10-18 09:12:03.511204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2a7d9b40"
+down_revision: str | Sequence[str] | None = "8dcd53ce4df0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Overlapping ingests could have produced duplicates; keep the oldest posting per key
+    # and repoint references to it before the unique index is created.
+    keep = (
+        "SELECT MIN(k.id) FROM job_postings AS k "
+        "WHERE k.source = job_postings.source AND k.source_item_id = job_postings.source_item_id"
+    )
+    for table in ("ingestion_items", "score_items"):
+        op.execute(
+            sa.text(
+                f"UPDATE {table} SET job_id = ("
+                "SELECT MIN(k.id) FROM job_postings AS d JOIN job_postings AS k "
+                "ON k.source = d.source AND k.source_item_id = d.source_item_id "
+                f"WHERE d.id = {table}.job_id) "
+                "WHERE job_id IS NOT NULL"
+            )
+        )
+    op.execute(sa.text(f"DELETE FROM job_postings WHERE id <> ({keep})"))
+
+    op.drop_index(op.f("ix_job_postings_source_item_id"), table_name="job_postings")
+    op.drop_index(op.f("ix_job_postings_source"), table_name="job_postings")
+    op.create_index(
+        "ux_job_postings_source_item",
+        "job_postings",
+        ["source", "source_item_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ux_job_postings_source_item", table_name="job_postings")
+    op.create_index(op.f("ix_job_postings_source"), "job_postings", ["source"], unique=False)
+    op.create_index(
+        op.f("ix_job_postings_source_item_id"), "job_postings", ["source_item_id"], unique=False
+    )
@@ -0,0 +1,53 @@
+"""add score cache
+
+Revision ID: 5d0e93b4c8a2
+Revises: c27b8e5f1a63
+Create Date: 2026-10-18 13:41:09.662815
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d0e93b4c8a2"
+down_revision: str | Sequence[str] | None = "c27b8e5f1a63"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "score_cache",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("scorer_version", sa.String(length=32), nullable=False),
+        sa.Column("profile_fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("job_fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("skills_matched", sa.JSON(), nullable=False),
+        sa.Column("skills_missing", sa.JSON(), nullable=False),
+        sa.Column("reasons", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_score_cache_key",
+        "score_cache",
+        ["scorer_version", "profile_fingerprint", "job_fingerprint"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_score_cache_last_used_at"), "score_cache", ["last_used_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_score_cache_last_used_at"), table_name="score_cache")
+    op.drop_index("ux_score_cache_key", table_name="score_cache")
+    op.drop_table("score_cache")
@@ -0,0 +1,50 @@
+"""add skill index (skill_terms, skill_postings)
+
+Revision ID: 6b2d8e4a1f35
+Revises: f3b71c9e0a24
+Create Date: 2026-10-18 15:48:03.517264
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6b2d8e4a1f35"
+down_revision: str | Sequence[str] | None = "f3b71c9e0a24"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Terms are added (and backfilled) on demand when a profile first uses them.
+    op.create_table(
+        "skill_terms",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("term", sa.String(length=256), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ux_skill_terms_term", "skill_terms", ["term"], unique=True)
+    op.create_table(
+        "skill_postings",
+        sa.Column("term_id", sa.Integer(), nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["job_postings.id"]),
+        sa.ForeignKeyConstraint(["term_id"], ["skill_terms.id"]),
+        sa.PrimaryKeyConstraint("term_id", "job_id"),
+        sqlite_with_rowid=False,
+    )
+    op.create_index(op.f("ix_skill_postings_job_id"), "skill_postings", ["job_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_skill_postings_job_id"), table_name="skill_postings")
+    op.drop_table("skill_postings")
+    op.drop_index("ux_skill_terms_term", table_name="skill_terms")
+    op.drop_table("skill_terms")
@@ -0,0 +1,43 @@
+"""job_postings content hash + content_updated_at
+
+Revision ID: a9e4d1c07b3e
+Revises: 3f1c2a7d9b40
+Create Date: 2026-10-18 10:02:47.208331
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a9e4d1c07b3e"
+down_revision: str | Sequence[str] | None = "3f1c2a7d9b40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("job_postings") as batch_op:
+        batch_op.add_column(sa.Column("content_hash", sa.String(length=64), nullable=True))
+        batch_op.add_column(
+            sa.Column("content_updated_at", sa.DateTime(timezone=True), nullable=True)
+        )
+        batch_op.create_index(
+            op.f("ix_job_postings_content_updated_at"), ["content_updated_at"], unique=False
+        )
+
+    # Existing rows have no hash yet: the next sighting rewrites them once and records
+    # the hash. Stamp them now so "changed since" queries treat them as fresh.
+    op.execute(sa.text("UPDATE job_postings SET content_updated_at = CURRENT_TIMESTAMP"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("job_postings") as batch_op:
+        batch_op.drop_index(op.f("ix_job_postings_content_updated_at"))
+        batch_op.drop_column("content_updated_at")
+        batch_op.drop_column("content_hash")
@@ -0,0 +1,55 @@
+"""add profile_job_scores (latest score per profile and job)
+
+Revision ID: b5c93e1d7a48
+Revises: 6b2d8e4a1f35
+Create Date: 2026-10-18 23:12:40.581273
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5c93e1d7a48"
+down_revision: str | Sequence[str] | None = "6b2d8e4a1f35"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "profile_job_scores",
+        sa.Column("profile_id", sa.Integer(), nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["profile_id"], ["candidate_profiles.id"]),
+        sa.ForeignKeyConstraint(["job_id"], ["job_postings.id"]),
+        sa.ForeignKeyConstraint(["item_id"], ["score_items.id"]),
+        sa.PrimaryKeyConstraint("profile_id", "job_id"),
+    )
+    op.create_index(
+        "ix_profile_job_scores_profile_score",
+        "profile_job_scores",
+        ["profile_id", sa.text("score DESC"), "item_id"],
+        unique=False,
+    )
+    # Backfill from finished runs. SQLite takes the bare score column from the row
+    # holding max(i.id), i.e. each job's latest score item.
+    op.execute(
+        "INSERT INTO profile_job_scores (profile_id, job_id, item_id, score) "
+        "SELECT r.profile_id, i.job_id, max(i.id), i.score "
+        "FROM score_items AS i JOIN scoring_runs AS r ON r.id = i.scoring_run_id "
+        "WHERE r.status = 'finished' AND i.score IS NOT NULL "
+        "GROUP BY r.profile_id, i.job_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_profile_job_scores_profile_score", table_name="profile_job_scores")
+    op.drop_table("profile_job_scores")
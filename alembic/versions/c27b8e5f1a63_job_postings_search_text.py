@@ -0,0 +1,61 @@
+"""job_postings search_text
+
+Revision ID: c27b8e5f1a63
+Revises: a9e4d1c07b3e
+Create Date: 2026-10-18 11:20:15.904117
+
+"""
+
+import json
+from collections.abc import Sequence
+from typing import Any
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c27b8e5f1a63"
+down_revision: str | Sequence[str] | None = "a9e4d1c07b3e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _search_text(
+    *, title: str | None, company: str | None, url: str | None, raw: dict[str, Any] | None
+) -> str:
+    # Frozen copy of ai_job_aggregator.search_text.build_search_text as of this revision.
+    raw_text = str(raw) if raw is not None else ""
+    return "\n".join([p for p in (title, company, url, raw_text) if p]).lower()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("job_postings") as batch_op:
+        batch_op.add_column(sa.Column("search_text", sa.Text(), nullable=True))
+
+    # Backfill existing postings with the same text ingestion computes.
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, title, company, url, raw FROM job_postings")).all()
+    if rows:
+        bind.execute(
+            sa.text("UPDATE job_postings SET search_text = :search_text WHERE id = :id"),
+            [
+                {
+                    "id": row.id,
+                    "search_text": _search_text(
+                        title=row.title,
+                        company=row.company,
+                        url=row.url,
+                        raw=json.loads(row.raw) if row.raw is not None else None,
+                    ),
+                }
+                for row in rows
+            ],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("job_postings") as batch_op:
+        batch_op.drop_column("search_text")
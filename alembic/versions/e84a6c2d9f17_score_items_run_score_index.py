@@ -0,0 +1,34 @@
+"""score_items (scoring_run_id, score DESC) covering index
+
+Revision ID: e84a6c2d9f17
+Revises: 5d0e93b4c8a2
+Create Date: 2026-10-18 14:27:51.318840
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e84a6c2d9f17"
+down_revision: str | Sequence[str] | None = "5d0e93b4c8a2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_score_items_run_score",
+        "score_items",
+        ["scoring_run_id", sa.text("score DESC"), "id", "job_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_score_items_run_score", table_name="score_items")
@@ -0,0 +1,76 @@
+"""job_postings FTS5 index
+
+Revision ID: f3b71c9e0a24
+Revises: e84a6c2d9f17
+Create Date: 2026-10-18 15:02:44.271905
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b71c9e0a24"
+down_revision: str | Sequence[str] | None = "e84a6c2d9f17"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Frozen copy of the DDL in ai_job_aggregator.fts as of this revision.
+_DOCUMENT_COLUMNS = "title, company, tags, description"
+_DOCUMENT_VALUES = (
+    "{row}.title, {row}.company, "
+    "(SELECT group_concat(value, ' ') FROM json_each({row}.raw, '$.tags')), "
+    "json_extract({row}.raw, '$.description')"
+)
+
+FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS job_postings_fts USING fts5({_DOCUMENT_COLUMNS})",
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_postings_fts_ai AFTER INSERT ON job_postings BEGIN
+        INSERT INTO job_postings_fts (rowid, {_DOCUMENT_COLUMNS})
+        VALUES (new.id, {_DOCUMENT_VALUES.format(row="new")});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_postings_fts_au
+    AFTER UPDATE OF title, company, raw ON job_postings BEGIN
+        DELETE FROM job_postings_fts WHERE rowid = old.id;
+        INSERT INTO job_postings_fts (rowid, {_DOCUMENT_COLUMNS})
+        VALUES (new.id, {_DOCUMENT_VALUES.format(row="new")});
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS job_postings_fts_ad AFTER DELETE ON job_postings BEGIN
+        DELETE FROM job_postings_fts WHERE rowid = old.id;
+    END
+    """,
+)
+
+FTS_DROP_DDL = (
+    "DROP TRIGGER IF EXISTS job_postings_fts_ad",
+    "DROP TRIGGER IF EXISTS job_postings_fts_au",
+    "DROP TRIGGER IF EXISTS job_postings_fts_ai",
+    "DROP TABLE IF EXISTS job_postings_fts",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Create the table and sync triggers, then index existing postings.
+    for ddl in FTS_DDL:
+        op.execute(sa.text(ddl))
+    op.execute(
+        sa.text(
+            f"INSERT INTO job_postings_fts (rowid, {_DOCUMENT_COLUMNS}) "
+            f"SELECT id, {_DOCUMENT_VALUES.format(row='job_postings')} FROM job_postings"
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for ddl in FTS_DROP_DDL:
+        op.execute(sa.text(ddl))
@@ -0,0 +1,111 @@
+"""Pipelined vs lockstep single-source ingestion with a slow connector.
+
+A synthetic connector pays ``--fetch-ms`` per page of ``--batch-size`` postings (a
+network round trip); each mode ingests ``--runs`` runs of up to 100 postings (the
+per-run hard cap) into a fresh database, and the pipelined mode reports the
+throughput counters of its last run's stages.
+
+Usage:
+    uv run python benchmarks/bench_ingest_pipeline.py --runs 20 --fetch-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import select
+
+from ai_job_aggregator.db import create_engine_from_settings, create_session_factory
+from ai_job_aggregator.fts import create_fts_index
+from ai_job_aggregator.ingest import HARD_CAP_MAX_FETCH_PER_CONNECTOR, run_ingestion
+from ai_job_aggregator.models import Base
+from ai_job_aggregator.models.ingestion import IngestionRun
+from ai_job_aggregator.schemas.job import JobPostingIn
+from ai_job_aggregator.settings import Settings
+
+SKILLS = ["python", "sql", "django", "react", "aws", "docker", "kubernetes", "go", "rust", "java"]
+FILLER = ["we", "are", "hiring", "remote", "team", "product", "build", "data", "customers"]
+
+
+class _SlowConnector:
+    source = "bench"
+
+    def __init__(self, rng: random.Random, start: int, args: argparse.Namespace):
+        self._rng = rng
+        self._start = start
+        self._args = args
+
+    def fetch(self):
+        for i in range(self._start, self._start + HARD_CAP_MAX_FETCH_PER_CONNECTOR):
+            if i % self._args.batch_size == 0:
+                time.sleep(self._args.fetch_ms / 1000)
+            yield JobPostingIn(
+                source="bench",
+                source_item_id=str(i),
+                title=f"Engineer {i}",
+                company="Acme",
+                raw={
+                    "description": " ".join(
+                        self._rng.choice(FILLER + SKILLS) for _ in range(self._args.words)
+                    ),
+                    "tags": self._rng.sample(SKILLS, 3),
+                },
+            )
+
+
+def _bench(pipeline: bool, args: argparse.Namespace, tmp: Path) -> tuple[float, dict | None]:
+    os.environ["AJA_INGEST_PIPELINE"] = "true" if pipeline else "false"
+    settings = Settings(db_path=tmp / f"{pipeline}.sqlite3", sqlite_profile=args.profile)
+    engine = create_engine_from_settings(settings)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        create_fts_index(conn)
+
+    rng = random.Random(0)
+    with create_session_factory(engine)() as session:
+        t0 = time.perf_counter()
+        for r in range(args.runs):
+            connector = _SlowConnector(rng, r * HARD_CAP_MAX_FETCH_PER_CONNECTOR, args)
+            run_ingestion(
+                session=session,
+                connector=connector,
+                limit=HARD_CAP_MAX_FETCH_PER_CONNECTOR,
+                batch_size=args.batch_size,
+            )
+        elapsed = time.perf_counter() - t0
+        last = session.execute(select(IngestionRun).order_by(IngestionRun.id.desc())).scalar()
+        stages = (last.meta or {}).get("stages")
+    engine.dispose()
+    return args.runs * HARD_CAP_MAX_FETCH_PER_CONNECTOR / elapsed, stages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=10, help="Postings per page/commit")
+    parser.add_argument("--fetch-ms", type=float, default=20.0, help="Latency per page")
+    parser.add_argument("--words", type=int, default=300, help="Words of text per posting")
+    parser.add_argument("--profile", default="default", help="AJA_SQLITE_PROFILE preset")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        lockstep, _ = _bench(False, args, Path(tmp))
+        pipelined, stages = _bench(True, args, Path(tmp))
+
+    print(f"lockstep  {lockstep:8.0f} postings/s")
+    print(f"pipelined {pipelined:8.0f} postings/s  ({pipelined / lockstep:.2f}x)")
+    print(f"\n{'stage':<8} {'items/s':>9} {'busy':>8} {'idle':>8} {'blocked':>8}  (last run)")
+    for name, st in (stages or {}).items():
+        print(
+            f"{name:<8} {st['items_per_s'] or 0:>9.0f} {st['busy_s']:>7.3f}s "
+            f"{st['idle_s']:>7.3f}s {st['blocked_s']:>7.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Substring (heuristic) vs tokenized matching: throughput and how matches differ.
+
+Runs on a synthetic corpus by default, or on the postings of an existing database
+(``--db``) with a profile's skills (``--profile``, id or label).
+
+Usage:
+    uv run python benchmarks/bench_matchers.py --jobs 20000
+    uv run python benchmarks/bench_matchers.py --db ~/Desktop/job-aggregator/data/jobs.sqlite3 \\
+        --profile default
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections import Counter
+from collections.abc import Callable
+
+from sqlalchemy import create_engine, select
+
+from ai_job_aggregator.db import create_session_factory
+from ai_job_aggregator.models import JobPosting
+from ai_job_aggregator.profiles import find_profile
+from ai_job_aggregator.scoring.heuristic import SkillMatcher
+from ai_job_aggregator.scoring.tokens import TokenMatcher
+
+SKILLS = ["python", "go", "r", "java", "sql", "react", "c++", "machine learning", "aws", "ml"]
+# words that contain a skill as a substring without being that skill
+CONFUSABLES = ["google", "javascript", "mysql", "react-native", "html", "algorithms", "drawing"]
+FILLER = ["we", "are", "hiring", "remote", "team", "product", "build", "data", "customers"]
+
+
+def _synthetic_texts(rng: random.Random, jobs: int, words: int) -> list[str]:
+    vocab = FILLER * 4 + SKILLS + CONFUSABLES
+    return [" ".join(rng.choice(vocab) for _ in range(words)) for _ in range(jobs)]
+
+
+def _time(match: Callable[[str], tuple[list[str], list[str]]], texts: list[str]):
+    t0 = time.perf_counter()
+    matches = [set(match(text)[0]) for text in texts]
+    return time.perf_counter() - t0, matches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--words", type=int, default=300, help="Words of text per posting")
+    parser.add_argument("--db", type=str, default=None, help="Use postings of this SQLite db")
+    parser.add_argument("--profile", type=str, default=None, help="Profile for --db (id/label)")
+    parser.add_argument("--examples", type=int, default=3, help="Example jobs per difference")
+    parser.add_argument(
+        "--extra-skills",
+        type=int,
+        default=0,
+        help="Pad the profile with N synthetic skills (tokens cost ~flat in skill count)",
+    )
+    args = parser.parse_args()
+
+    skills = SKILLS
+    if args.db:
+        engine = create_engine(f"sqlite+pysqlite:///{args.db}", future=True)
+        with create_session_factory(engine)() as session:
+            if args.profile:
+                profile = find_profile(session, args.profile)
+                if profile is None:
+                    raise SystemExit(f"candidate_profile not found: {args.profile}")
+                skills = profile.skills
+            texts = [
+                text or ""
+                for text in session.execute(
+                    select(JobPosting.search_text).order_by(JobPosting.id).limit(args.jobs)
+                ).scalars()
+            ]
+        engine.dispose()
+    else:
+        texts = _synthetic_texts(random.Random(0), args.jobs, args.words)
+
+    skills = list(skills) + [f"skill{i}" for i in range(args.extra_skills)]
+    substring = SkillMatcher(skills)
+    tokens = TokenMatcher(skills)
+    sub_s, sub_matches = _time(substring.match, texts)
+    tok_s, tok_matches = _time(tokens.match, texts)
+
+    print(f"{len(texts)} jobs, {len(substring.skills)} skills")
+    for name, elapsed in (("substring", sub_s), ("tokens", tok_s)):
+        print(f"{name:<10} {elapsed:8.2f}s  {len(texts) / elapsed:10.0f} jobs/s")
+
+    only_sub: Counter[str] = Counter()
+    only_tok: Counter[str] = Counter()
+    examples: dict[tuple[str, str], list[int]] = {}
+    for i, (a, b) in enumerate(zip(sub_matches, tok_matches, strict=True)):
+        for side, counter, diff in (("substring", only_sub, a - b), ("tokens", only_tok, b - a)):
+            for sk in diff:
+                counter[sk] += 1
+                examples.setdefault((side, sk), []).append(i)
+
+    print("\nmatch differences (jobs matched by one scorer only):")
+    print(f"{'skill':<20} {'substring only':>15} {'tokens only':>12}")
+    for sk in substring.skills[: len(substring.skills) - args.extra_skills]:
+        print(f"{sk:<20} {only_sub[sk]:>15} {only_tok[sk]:>12}")
+
+    if args.examples:
+        for (side, sk), idxs in sorted(examples.items()):
+            for i in idxs[: args.examples]:
+                text = texts[i]
+                pos = text.find(sk) if side == "substring" else -1
+                snippet = text[max(0, pos - 30) : pos + len(sk) + 30] if pos >= 0 else text[:60]
+                print(f"  [{side} only] {sk!r}: ...{snippet.replace(chr(10), ' ')}...")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Scoring throughput on a synthetic job table.
+
+Usage:
+    uv run python benchmarks/bench_scoring.py --jobs 20000 --workers 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+
+from ai_job_aggregator.db import create_session_factory
+from ai_job_aggregator.models import Base, CandidateProfile, JobPosting
+from ai_job_aggregator.scoring.service import create_scoring_run, score_run
+
+SKILLS = ["python", "sql", "django", "react", "aws", "docker", "kubernetes", "go", "rust", "java"]
+FILLER = ["we", "are", "hiring", "remote", "team", "product", "build", "data", "customers"]
+
+
+def _synthetic_text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(FILLER + SKILLS[:4]) for _ in range(words))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--words", type=int, default=600, help="Words of text per posting")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite+pysqlite:///{Path(tmp) / 'bench.sqlite3'}", future=True)
+        Base.metadata.create_all(engine)
+        SessionFactory = create_session_factory(engine)
+
+        with SessionFactory() as session:
+            profile = CandidateProfile(label="bench", skills=SKILLS)
+            session.add(profile)
+            session.execute(
+                insert(JobPosting),
+                [
+                    {
+                        "source": "bench",
+                        "source_item_id": str(i),
+                        "title": f"Engineer {i}",
+                        "raw": {},
+                        "search_text": _synthetic_text(rng, args.words),
+                    }
+                    for i in range(args.jobs)
+                ],
+            )
+            session.commit()
+
+            baseline = None
+            for workers in args.workers:
+                run = create_scoring_run(
+                    session=session, profile_id=profile.id, ingestion_run_id=None
+                )
+                session.commit()
+
+                t0 = time.perf_counter()
+                score_run(
+                    session=session,
+                    run_id=run.id,
+                    full_rescore=True,
+                    chunk_size=args.chunk_size,
+                    workers=workers,
+                )
+                elapsed = time.perf_counter() - t0
+
+                rate = args.jobs / elapsed
+                baseline = baseline or rate
+                print(
+                    f"workers={workers:<3} {elapsed:8.2f}s  {rate:10.0f} jobs/s  "
+                    f"speedup={rate / baseline:.2f}x"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
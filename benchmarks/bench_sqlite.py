@@ -0,0 +1,152 @@
+"""Ingest/scoring throughput and reader latency under each SQLite profile.
+
+For every ``AJA_SQLITE_PROFILE`` preset, on a fresh database: persist synthetic
+postings through the ingest write path (one commit per batch), score them all, then
+keep a reader querying while a writer thread commits small batches, and report the
+reader's latency and any "database is locked" errors.
+
+Usage:
+    uv run python benchmarks/bench_sqlite.py --jobs 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+
+from ai_job_aggregator.db import (
+    SQLITE_PROFILES,
+    create_engine_from_settings,
+    create_session_factory,
+)
+from ai_job_aggregator.fts import create_fts_index
+from ai_job_aggregator.ingest import _persist_chunk
+from ai_job_aggregator.models import Base, CandidateProfile, JobPosting
+from ai_job_aggregator.models.ingestion import IngestionRun, RunStatus
+from ai_job_aggregator.schemas.job import JobPostingIn
+from ai_job_aggregator.scoring.service import create_scoring_run, score_run
+from ai_job_aggregator.settings import Settings
+
+SKILLS = ["python", "sql", "django", "react", "aws", "docker", "kubernetes", "go", "rust", "java"]
+FILLER = ["we", "are", "hiring", "remote", "team", "product", "build", "data", "customers"]
+
+
+def _postings(rng: random.Random, start: int, count: int, words: int) -> list[JobPostingIn]:
+    return [
+        JobPostingIn(
+            source="bench",
+            source_item_id=str(i),
+            title=f"Engineer {i}",
+            company="Acme",
+            raw={
+                "description": " ".join(rng.choice(FILLER + SKILLS) for _ in range(words)),
+                "tags": rng.sample(SKILLS, 3),
+            },
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def _ingest(session, postings: list[JobPostingIn], batch_size: int) -> None:
+    run = IngestionRun(source="bench", started_at=datetime.now(tz=UTC), status=RunStatus.started)
+    session.add(run)
+    session.commit()
+    for i in range(0, len(postings), batch_size):
+        _persist_chunk(session, run_id=run.id, chunk=postings[i : i + batch_size])
+        session.commit()
+
+
+def _bench(profile: str, args: argparse.Namespace, tmp: Path) -> dict[str, float]:
+    rng = random.Random(0)
+    settings = Settings(db_path=tmp / f"{profile}.sqlite3", sqlite_profile=profile)
+    engine = create_engine_from_settings(settings)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        create_fts_index(conn)
+    SessionFactory = create_session_factory(engine)
+    out: dict[str, float] = {}
+
+    postings = _postings(rng, 0, args.jobs, args.words)
+    with SessionFactory() as session:
+        t0 = time.perf_counter()
+        _ingest(session, postings, args.batch_size)
+        out["ingest"] = args.jobs / (time.perf_counter() - t0)
+
+        cand = CandidateProfile(label="bench", skills=SKILLS[:5])
+        session.add(cand)
+        session.commit()
+        run = create_scoring_run(session=session, profile_id=cand.id, ingestion_run_id=None)
+        session.commit()
+        t0 = time.perf_counter()
+        score_run(session=session, run_id=run.id, full_rescore=True, settings=settings)
+        out["score"] = args.jobs / (time.perf_counter() - t0)
+
+    more = _postings(rng, args.jobs, args.concurrent_jobs, args.words)
+    writing = threading.Event()
+    writing.set()
+
+    def _writer() -> None:
+        with SessionFactory() as session:
+            _ingest(session, more, 10)
+        writing.clear()
+
+    latencies: list[float] = []
+    locked = 0
+    writer = threading.Thread(target=_writer)
+    writer.start()
+    with SessionFactory() as session:
+        while writing.is_set():
+            t0 = time.perf_counter()
+            try:
+                session.execute(
+                    select(JobPosting.id, JobPosting.title).order_by(JobPosting.id.desc()).limit(20)
+                ).all()
+            except OperationalError:
+                locked += 1
+            session.rollback()  # end the read transaction so it sees the next commits
+            latencies.append(time.perf_counter() - t0)
+    writer.join()
+    engine.dispose()
+
+    out["reads"] = len(latencies)
+    out["read_p50_ms"] = statistics.median(latencies) * 1000
+    out["read_max_ms"] = max(latencies) * 1000
+    out["locked"] = locked
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--words", type=int, default=150, help="Words of text per posting")
+    parser.add_argument("--batch-size", type=int, default=100, help="Postings per ingest commit")
+    parser.add_argument(
+        "--concurrent-jobs", type=int, default=2000, help="Postings the writer adds during reads"
+    )
+    parser.add_argument("--profiles", nargs="+", default=list(SQLITE_PROFILES))
+    args = parser.parse_args()
+
+    print(
+        f"{'profile':<10} {'ingest/s':>10} {'score/s':>10} "
+        f"{'reads':>7} {'read p50':>9} {'read max':>9} {'locked':>7}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in args.profiles:
+            r = _bench(profile, args, Path(tmp))
+            print(
+                f"{profile:<10} {r['ingest']:>10.0f} {r['score']:>10.0f} {r['reads']:>7.0f} "
+                f"{r['read_p50_ms']:>7.2f}ms {r['read_max_ms']:>7.1f}ms {r['locked']:>7.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""TF-IDF scorer vs per-job ``score_job`` on synthetic postings.
+
+Reports the one-off index build, an incremental sync after new postings arrive, and
+the per-profile cost of ranking every posting (one sparse matrix-vector product)
+against calling ``score_job`` per posting.
+
+Usage:
+    uv run --extra tfidf python benchmarks/bench_tfidf.py --jobs 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert, select
+
+from ai_job_aggregator.db import create_session_factory
+from ai_job_aggregator.models import Base, JobPosting
+from ai_job_aggregator.scoring.heuristic import score_job
+from ai_job_aggregator.scoring.tfidf import TfidfIndex, TfidfMatcher, synced_index
+
+SKILLS = ["python", "sql", "django", "react", "aws", "docker", "kubernetes", "go", "rust", "java"]
+FILLER = ["we", "are", "hiring", "remote", "team", "product", "build", "data", "customers"]
+
+
+def _rows(rng: random.Random, start: int, count: int, words: int) -> list[dict]:
+    # a few hundred distinct rare words so IDF has something to tell apart
+    rare = [f"tech{i}" for i in range(500)]
+    vocab = FILLER * 8 + SKILLS + rare
+    return [
+        {
+            "source": "bench",
+            "source_item_id": str(i),
+            "title": f"Engineer {i}",
+            "raw": {},
+            "search_text": " ".join(rng.choice(vocab) for _ in range(words)),
+            "content_hash": f"{i:064d}",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--words", type=int, default=150, help="Words of text per posting")
+    parser.add_argument("--new-jobs", type=int, default=1000, help="Postings added after build")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite+pysqlite:///{Path(tmp) / 'bench.sqlite3'}", future=True)
+        Base.metadata.create_all(engine)
+        index_path = Path(tmp) / "tfidf.npz"
+
+        with create_session_factory(engine)() as session:
+            session.execute(insert(JobPosting), _rows(rng, 0, args.jobs, args.words))
+            session.commit()
+
+            t0 = time.perf_counter()
+            synced_index(session, index_path)
+            build_s = time.perf_counter() - t0
+            print(f"build     {args.jobs} postings  {build_s:8.2f}s")
+
+            session.execute(insert(JobPosting), _rows(rng, args.jobs, args.new_jobs, args.words))
+            session.commit()
+            t0 = time.perf_counter()
+            index = synced_index(session, index_path)
+            print(f"sync      +{args.new_jobs} postings  {time.perf_counter() - t0:8.2f}s")
+            print(
+                f"matrix    {len(index.indices)} non-zeros, {index_path.stat().st_size >> 20} MiB"
+            )
+
+            t0 = time.perf_counter()
+            TfidfMatcher(index, SKILLS)
+            tfidf_s = time.perf_counter() - t0
+
+            jobs = session.execute(
+                select(JobPosting.title, JobPosting.company, JobPosting.url, JobPosting.search_text)
+            ).all()
+            t0 = time.perf_counter()
+            for job in jobs:
+                score_job(
+                    profile_skills=SKILLS,
+                    job_title=job.title,
+                    company=job.company,
+                    url=job.url,
+                    raw={"text": job.search_text},
+                )
+            score_job_s = time.perf_counter() - t0
+
+        total = args.jobs + args.new_jobs
+        print(f"tfidf     rank {total} postings  {tfidf_s:8.2f}s  {total / tfidf_s:10.0f} jobs/s")
+        print(
+            f"score_job rank {total} postings  {score_job_s:8.2f}s  "
+            f"{total / score_job_s:10.0f} jobs/s  ({score_job_s / tfidf_s:.1f}x slower)"
+        )
+        assert TfidfIndex.load(index_path).live_rows == total
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Per-task latency of ``score_run_task`` with and without the worker's shared state.
+
+"cold" rebuilds settings, engine and session factory for every task (what each RQ
+job used to do); "warm" reuses the per-process state ``run_worker`` sets up. Runs
+are small so the fixed per-task cost dominates.
+
+Usage:
+    uv run python benchmarks/bench_worker_tasks.py --jobs 50 --tasks 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+
+from ai_job_aggregator.db import create_session_factory
+from ai_job_aggregator.models import Base, CandidateProfile, JobPosting
+from ai_job_aggregator.scoring.service import create_scoring_run
+from ai_job_aggregator.scoring.tasks import (
+    dispose_worker_state,
+    score_run_task,
+    warm_worker_state,
+)
+
+SKILLS = ["python", "sql", "django", "react", "aws", "docker", "kubernetes", "go", "rust", "java"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=50, help="Postings per scoring run")
+    parser.add_argument("--tasks", type=int, default=200, help="Tasks per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.sqlite3"
+        os.environ["AJA_DB_PATH"] = str(db_path)
+        os.environ["AJA_SCORE_CACHE_ENABLED"] = "false"
+        engine = create_engine(f"sqlite+pysqlite:///{db_path}", future=True)
+        Base.metadata.create_all(engine)
+
+        with create_session_factory(engine)() as session:
+            profile = CandidateProfile(label="bench", skills=SKILLS)
+            session.add(profile)
+            session.execute(
+                insert(JobPosting),
+                [
+                    {
+                        "source": "bench",
+                        "source_item_id": str(i),
+                        "title": f"Engineer {i}",
+                        "raw": {},
+                        "search_text": " ".join(SKILLS[: i % len(SKILLS)]),
+                    }
+                    for i in range(args.jobs)
+                ],
+            )
+            session.commit()
+            run_ids = {
+                mode: [
+                    create_scoring_run(
+                        session=session,
+                        profile_id=profile.id,
+                        ingestion_run_id=None,
+                        meta={"full_rescore": True},
+                    ).id
+                    for _ in range(args.tasks)
+                ]
+                for mode in ("cold", "warm")
+            }
+            session.commit()
+        engine.dispose()
+
+        results = {}
+        for mode in ("cold", "warm"):
+            if mode == "warm":
+                warm_worker_state()
+            latencies = []
+            for run_id in run_ids[mode]:
+                if mode == "cold":
+                    dispose_worker_state()
+                t0 = time.perf_counter()
+                score_run_task(run_id=run_id)
+                latencies.append(time.perf_counter() - t0)
+            results[mode] = latencies
+        dispose_worker_state()
+
+    for mode, latencies in results.items():
+        latencies.sort()
+        print(
+            f"{mode}  median {statistics.median(latencies) * 1000:7.2f}ms  "
+            f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:7.2f}ms"
+        )
+    speedup = statistics.median(results["cold"]) / statistics.median(results["warm"])
+    print(f"warm is {speedup:.1f}x faster per task")
+
+
+if __name__ == "__main__":
+    main()
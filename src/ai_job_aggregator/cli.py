@@ -3,7 +3,11 @@ from __future__ import annotations
 import argparse
 import logging
 
-from ai_job_aggregator.db import create_engine_from_settings, create_session_factory
+from ai_job_aggregator.db import (
+    create_engine_from_settings,
+    create_read_engine_from_settings,
+    create_session_factory,
+)
 from ai_job_aggregator.logging import configure_logging
 from ai_job_aggregator.settings import Settings
 
@@ -11,6 +15,8 @@ logger = logging.getLogger(__name__)
 
 
 def build_parser() -> argparse.ArgumentParser:
+    from ai_job_aggregator.connectors.registry import CONNECTORS
+
     parser = argparse.ArgumentParser(
         prog="ai-job-aggregator",
         description="AI Job Aggregator",
@@ -23,9 +29,13 @@ def build_parser() -> argparse.ArgumentParser:
     ingest = sub.add_parser("ingest", help="Run ingestion")
     ingest.add_argument(
         "--source",
-        default="remoteok",
-        choices=["remoteok"],
-        help="Connector source (default: remoteok)",
+        nargs="+",
+        default=["remoteok"],
+        choices=[*CONNECTORS, "all"],
+        help=(
+            "Connector source(s); several (or all) are fetched concurrently, one ingestion "
+            "run each (default: remoteok)"
+        ),
     )
     ingest.add_argument(
         "--limit",
@@ -39,17 +49,112 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Candidate profile selector (id or label); stored on ingestion_run",
     )
+    ingest.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Items persisted and committed per chunk (default: AJA_INGEST_BATCH_SIZE)",
+    )
 
     sub.add_parser("db-init", help="Create tables directly (dev convenience; prefer alembic)")
 
-    sub.add_parser("worker", help="Run RQ worker (listens on scoring queue)")
+    worker = sub.add_parser("worker", help="Run RQ worker (listens on scoring queue)")
+    worker.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Supervise N worker processes (default: AJA_WORKER_CONCURRENCY)",
+    )
 
     score = sub.add_parser("score", help="Run scoring synchronously for a scoring run")
-    score.add_argument("--run-id", type=int, required=True, help="Scoring run id")
+    target = score.add_mutually_exclusive_group(required=True)
+    target.add_argument(
+        "--run-id",
+        type=int,
+        action="append",
+        help="Scoring run id (repeat to score several runs in one pass over the jobs)",
+    )
+    target.add_argument(
+        "--all-profiles",
+        action="store_true",
+        help="Create a scoring run per candidate profile and rescore all jobs in one pass",
+    )
+    score.add_argument(
+        "--full",
+        action="store_true",
+        help="Rescore every job (default: only jobs new/changed for this run)",
+    )
+    score.add_argument(
+        "--scorer",
+        choices=["heuristic", "tokens", "fts", "index", "tfidf"],
+        default=None,
+        help="Scorer backend (default: the run's meta, then AJA_SCORER)",
+    )
+    score.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Score partitions in N processes (default: AJA_SCORING_WORKERS)",
+    )
+
+    results = sub.add_parser("results", help="Show the top-ranked jobs of a scoring run")
+    which = results.add_mutually_exclusive_group(required=True)
+    which.add_argument("--run-id", type=int, help="Scoring run id")
+    which.add_argument(
+        "--profile",
+        type=str,
+        help=(
+            "Candidate profile selector (id or label); ranks each job by its latest score "
+            "across the profile's finished runs"
+        ),
+    )
+    results.add_argument("--top", type=int, default=20, help="Number of jobs (default: 20)")
+    results.add_argument(
+        "--after",
+        type=str,
+        default=None,
+        help="Cursor printed by the previous page, to continue from there",
+    )
+
+    search = sub.add_parser("search", help="Full-text search over job postings (FTS5)")
+    search.add_argument("query", help="Terms that must all appear, e.g. 'python c++'")
+    search.add_argument(
+        "--fts-syntax",
+        action="store_true",
+        help="Parse the query as FTS5 syntax, e.g. 'python AND \"machine learning\"'",
+    )
+    search.add_argument("--limit", type=int, default=20, help="Max hits (default: 20)")
 
     return parser
 
 
+def _print_results(title: str, rows) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title=title)
+    table.add_column("score", justify="right")
+    table.add_column("job_id", justify="right")
+    table.add_column("title")
+    table.add_column("company")
+    table.add_column("matched")
+    table.add_column("url")
+    for row in rows:
+        table.add_row(
+            f"{row.score:.1f}",
+            str(row.job_id),
+            row.title or "",
+            row.company or "",
+            ", ".join(row.skills_matched),
+            row.url or "",
+        )
+
+    console = Console()
+    console.print(table)
+    if rows:
+        console.print(f"next page: --after {rows[-1].cursor}")
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
@@ -65,11 +170,18 @@ def main(argv: list[str] | None = None) -> int:
     settings = Settings()
     engine = create_engine_from_settings(settings)
     SessionFactory = create_session_factory(engine)
+    # results/search read through a separate read-only pool, never waiting on the writer
+    ReadSessionFactory = create_session_factory(create_read_engine_from_settings(settings))
 
     if args.cmd == "db-init":
+        import ai_job_aggregator.models.scoring
+        import ai_job_aggregator.models.skill_index  # noqa: F401
+        from ai_job_aggregator.fts import create_fts_index
         from ai_job_aggregator.models import Base
 
         Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            create_fts_index(conn)
         logger.info(
             "db_initialized",
             extra={
@@ -80,29 +192,130 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if args.cmd == "ingest":
-        from ai_job_aggregator.connectors.remoteok import RemoteOkConnector
-        from ai_job_aggregator.ingest import run_ingestion
+        from ai_job_aggregator.connectors.registry import build_connectors
+        from ai_job_aggregator.ingest import run_ingestion, run_ingestion_many
 
-        connector = RemoteOkConnector(settings)
+        connectors = build_connectors(args.source, settings)
         with SessionFactory() as session:
-            return run_ingestion(
-                session=session,
-                connector=connector,
-                limit=args.limit,
-                profile_selector=args.profile,
-            )
+            if len(connectors) == 1 and hasattr(connectors[0], "fetch"):
+                rc = run_ingestion(
+                    session=session,
+                    connector=connectors[0],  # type: ignore[arg-type]
+                    limit=args.limit,
+                    profile_selector=args.profile,
+                    batch_size=args.batch_size,
+                )
+            else:
+                rc = run_ingestion_many(
+                    session=session,
+                    connectors=connectors,
+                    limit=args.limit,
+                    profile_selector=args.profile,
+                    batch_size=args.batch_size,
+                )
+        return rc
 
     if args.cmd == "worker":
         from ai_job_aggregator.worker import run_worker
 
-        run_worker()
+        run_worker(concurrency=args.concurrency)
         return 0
 
     if args.cmd == "score":
-        from ai_job_aggregator.scoring.service import score_run
+        from sqlalchemy import select
+
+        from ai_job_aggregator.models import CandidateProfile
+        from ai_job_aggregator.scoring.service import create_scoring_run, score_run, score_runs
 
         with SessionFactory() as session:
-            score_run(session=session, run_id=args.run_id)
+            if args.all_profiles:
+                profile_ids = session.execute(select(CandidateProfile.id)).scalars().all()
+                run_ids = [
+                    create_scoring_run(
+                        session=session,
+                        profile_id=profile_id,
+                        ingestion_run_id=None,
+                        meta={"full_rescore": True},
+                    ).id
+                    for profile_id in profile_ids
+                ]
+                session.commit()
+                score_runs(
+                    session=session,
+                    run_ids=run_ids,
+                    full_rescore=True,
+                    scorer=args.scorer,
+                    workers=args.workers,
+                )
+            elif len(args.run_id) > 1:
+                score_runs(
+                    session=session,
+                    run_ids=args.run_id,
+                    full_rescore=args.full or None,
+                    scorer=args.scorer,
+                    workers=args.workers,
+                )
+            else:
+                score_run(
+                    session=session,
+                    run_id=args.run_id[0],
+                    full_rescore=args.full or None,
+                    workers=args.workers,
+                    scorer=args.scorer,
+                )
+        return 0
+
+    if args.cmd == "results":
+        from ai_job_aggregator.scoring.results import (
+            parse_cursor,
+            top_results,
+            top_results_for_profile,
+        )
+
+        after = parse_cursor(args.after) if args.after else None
+        with ReadSessionFactory() as session:
+            if args.run_id is not None:
+                title = f"scoring run {args.run_id}"
+                rows = top_results(session, run_id=args.run_id, limit=args.top, after=after)
+            else:
+                title = f"profile {args.profile} (latest score per job)"
+                rows = top_results_for_profile(session, args.profile, limit=args.top, after=after)
+        _print_results(title, rows)
+        return 0
+
+    if args.cmd == "search":
+        from rich.console import Console
+        from rich.table import Table
+        from sqlalchemy.exc import OperationalError
+
+        from ai_job_aggregator.fts import plain_query, search_jobs
+
+        query = args.query if args.fts_syntax else plain_query(args.query)
+        hits = []
+        if query is not None:
+            with ReadSessionFactory() as session:
+                try:
+                    hits = search_jobs(session, query, limit=args.limit)
+                except OperationalError as e:
+                    if not args.fts_syntax:
+                        raise
+                    parser.error(f"invalid FTS5 query {args.query!r}: {e.orig}")
+
+        table = Table(title=f"search: {args.query}")
+        table.add_column("rank", justify="right")
+        table.add_column("job_id", justify="right")
+        table.add_column("title")
+        table.add_column("company")
+        table.add_column("url")
+        for hit in hits:
+            table.add_row(
+                f"{hit.rank:.2f}",
+                str(hit.job_id),
+                hit.title or "",
+                hit.company or "",
+                hit.url or "",
+            )
+        Console().print(table)
         return 0
 
     parser.print_help()
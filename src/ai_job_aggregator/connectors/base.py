@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+import asyncio
+import itertools
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
 from ai_job_aggregator.schemas.job import JobPostingIn
 
+if TYPE_CHECKING:
+    from ai_job_aggregator.connectors.http import HttpClient
+
+# Items a wrapped sync connector yields per hop through the thread pool.
+SYNC_ADAPTER_BATCH = 100
+
 
 @dataclass(frozen=True)
 class ConnectorResult:
@@ -16,3 +24,35 @@ class JobConnector(Protocol):
     source: str
 
     def fetch(self) -> Iterable[JobPostingIn]: ...
+
+
+class AsyncJobConnector(Protocol):
+    source: str
+
+    def afetch(self, http: HttpClient) -> AsyncIterator[JobPostingIn]: ...
+
+
+class SyncConnectorAdapter:
+    """Run a sync ``JobConnector`` as an ``AsyncJobConnector``.
+
+    The connector's own ``fetch`` is driven on a worker thread in batches, so its
+    blocking I/O overlaps with other connectors instead of stalling the event loop. It
+    keeps its own HTTP client; ``http`` is unused.
+    """
+
+    def __init__(self, connector: JobConnector):
+        self.connector = connector
+        self.source = connector.source
+
+    async def afetch(self, http: HttpClient) -> AsyncIterator[JobPostingIn]:
+        it = iter(await asyncio.to_thread(self.connector.fetch))
+        while batch := await asyncio.to_thread(list, itertools.islice(it, SYNC_ADAPTER_BATCH)):
+            for job in batch:
+                yield job
+
+
+def as_async(connector: JobConnector | AsyncJobConnector) -> AsyncJobConnector:
+    """``connector`` itself if it has ``afetch``, else wrapped in ``SyncConnectorAdapter``."""
+    if hasattr(connector, "afetch"):
+        return connector  # type: ignore[return-value]
+    return SyncConnectorAdapter(connector)  # type: ignore[arg-type]
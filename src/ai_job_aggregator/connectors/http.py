@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any
+
+import httpx
+
+from ai_job_aggregator.settings import Settings
+
+USER_AGENT = "ai-job-aggregator/0.1 (+https://github.com/)"
+
+
+class HttpClient:
+    """One pooled ``httpx.AsyncClient`` shared by every async connector of a process.
+
+    Keep-alive connections are reused across requests and sources, responses are
+    requested and decoded compressed (gzip/deflate; brotli/zstd when their packages are
+    installed), and at most ``AJA_HTTP_MAX_CONNECTIONS_PER_HOST`` requests run against
+    one host at a time, whatever the number of connectors hitting it. Use as an async
+    context manager, or call ``aclose``.
+    """
+
+    def __init__(self, settings: Settings, *, transport: httpx.AsyncBaseTransport | None = None):
+        self._client = httpx.AsyncClient(
+            timeout=settings.http_timeout_s,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_connections,
+            ),
+            transport=transport,
+        )
+        self._per_host = settings.http_max_connections_per_host
+        self._hosts: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self._per_host)
+        )
+        # noise reduction: we do our own JSON logging
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        async with self._hosts[httpx.URL(url).host]:
+            return await self._client.get(url, **kwargs)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> HttpClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
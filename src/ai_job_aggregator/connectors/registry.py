@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+
+from ai_job_aggregator.connectors.base import AsyncJobConnector, JobConnector
+from ai_job_aggregator.connectors.remoteok import RemoteOkConnector
+from ai_job_aggregator.settings import Settings
+
+# `ingest --source` names -> connector factories. New sources register here.
+CONNECTORS: dict[str, Callable[[Settings], JobConnector | AsyncJobConnector]] = {
+    "remoteok": RemoteOkConnector,
+}
+
+
+def build_connectors(
+    names: Sequence[str], settings: Settings
+) -> list[JobConnector | AsyncJobConnector]:
+    """Instantiate the named connectors (``all``: every registered one), deduplicated."""
+    selected = list(CONNECTORS) if "all" in names else list(dict.fromkeys(names))
+    unknown = [name for name in selected if name not in CONNECTORS]
+    if unknown:
+        raise ValueError(
+            f"unknown source(s): {', '.join(unknown)} (choose from {', '.join(CONNECTORS)}, all)"
+        )
+    return [CONNECTORS[name](settings) for name in selected]
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable, Iterator
 from datetime import UTC, datetime
+from typing import Any
 
 import httpx
 
+from ai_job_aggregator.connectors.http import USER_AGENT, HttpClient
 from ai_job_aggregator.schemas.job import JobPostingIn
 from ai_job_aggregator.settings import Settings
 
@@ -17,7 +19,7 @@ class RemoteOkConnector:
         self._settings = settings
 
     def fetch(self) -> Iterable[JobPostingIn]:
-        headers = {"User-Agent": "ai-job-aggregator/0.1 (+https://github.com/)"}
+        headers = {"User-Agent": USER_AGENT}
         with httpx.Client(timeout=30.0, headers=headers) as client:
             # noise reduction: we do our own JSON logging
             logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -25,6 +27,15 @@ class RemoteOkConnector:
             r.raise_for_status()
             data = r.json()
 
+        yield from self._parse(data)
+
+    async def afetch(self, http: HttpClient) -> AsyncIterator[JobPostingIn]:
+        r = await http.get(self._settings.remoteok_url)
+        r.raise_for_status()
+        for job in self._parse(r.json()):
+            yield job
+
+    def _parse(self, data: Any) -> Iterator[JobPostingIn]:
         if not isinstance(data, list):
             raise ValueError("RemoteOK response is not a list")
 
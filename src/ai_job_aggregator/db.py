@@ -1,17 +1,140 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine
+import functools
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
 from ai_job_aggregator.settings import Settings
 
+# PRAGMAs set on every new SQLite connection, by AJA_SQLITE_PROFILE. busy_timeout comes
+# first so switching the journal mode waits for other connections' locks.
+SQLITE_PROFILES: dict[str, dict[str, str | int]] = {
+    # SQLite's own defaults: rollback journal (readers wait while a write commits),
+    # synchronous=FULL, ~2 MiB page cache, no mmap.
+    "default": {},
+    # WAL: readers and the writer never block each other. synchronous=NORMAL stays
+    # consistent on power loss but may lose the last commits; app crashes lose nothing.
+    "balanced": {
+        "busy_timeout": 5000,
+        "journal_mode": "wal",
+        "synchronous": "normal",
+        "cache_size": -64 * 1024,  # KiB
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "memory",
+    },
+    # No fsync at all: for bulk loads into a database that can be rebuilt.
+    "fast": {
+        "busy_timeout": 5000,
+        "journal_mode": "wal",
+        "synchronous": "off",
+        "cache_size": -256 * 1024,
+        "mmap_size": 1024 * 1024 * 1024,
+        "temp_store": "memory",
+    },
+}
+
+_PRAGMA_CHOICES = {
+    "journal_mode": {"delete", "truncate", "persist", "memory", "wal", "off"},
+    "synchronous": {"off", "normal", "full", "extra"},
+    "temp_store": {"default", "file", "memory"},
+}
+
+
+def sqlite_pragmas(settings: Settings) -> dict[str, str | int]:
+    """The PRAGMAs of ``AJA_SQLITE_PROFILE`` with the ``AJA_SQLITE_*`` overrides applied."""
+    if settings.sqlite_profile not in SQLITE_PROFILES:
+        raise ValueError(
+            f"unknown sqlite profile: {settings.sqlite_profile!r} "
+            f"(choose from {', '.join(SQLITE_PROFILES)})"
+        )
+    pragmas = dict(SQLITE_PROFILES[settings.sqlite_profile])
+    overrides: dict[str, Any] = {
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "cache_size": settings.sqlite_cache_size,
+        "mmap_size": settings.sqlite_mmap_size,
+        "temp_store": settings.sqlite_temp_store,
+    }
+    for name, value in overrides.items():
+        if value is None:
+            continue
+        if name in _PRAGMA_CHOICES:
+            value = str(value).lower()
+            if value not in _PRAGMA_CHOICES[name]:
+                raise ValueError(
+                    f"invalid sqlite {name}: {value!r} "
+                    f"(choose from {', '.join(sorted(_PRAGMA_CHOICES[name]))})"
+                )
+        pragmas[name] = value
+    return pragmas
+
+
+def _set_pragmas(dbapi_connection, connection_record, *, pragmas: dict[str, str | int]) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: dict[str, str | int]) -> None:
+    """Set ``pragmas`` on every connection ``engine`` opens (no-op for other databases)."""
+    if engine.dialect.name == "sqlite" and pragmas:
+        event.listen(engine, "connect", functools.partial(_set_pragmas, pragmas=pragmas))
+
 
 def create_engine_from_settings(settings: Settings) -> Engine:
-    return create_engine(
+    """The writer engine: ingestion, scoring and anything else that writes.
+
+    Its pool holds a single connection (no overflow), so everything writing through
+    one engine takes turns; a second checkout waits for the first to be returned.
+    Other processes writing to the same file (an RQ worker, a later ``score``) open
+    engines of their own and are serialized by SQLite's write lock and
+    ``busy_timeout`` instead. Readers use ``create_read_engine_from_settings``.
+    """
+    engine = create_engine(
         settings.sqlalchemy_database_url(),
         future=True,
+        pool_size=1,
+        max_overflow=0,
     )
+    apply_sqlite_pragmas(engine, sqlite_pragmas(settings))
+    return engine
+
+
+def create_read_engine_from_settings(settings: Settings) -> Engine:
+    """A pooled read-only engine for result, search and export queries.
+
+    Connections open the database through a ``mode=ro`` URI with ``query_only`` set, so
+    they never write or take the write lock. Under a WAL profile they read the last
+    committed state while the writer engine is mid-transaction. The journal mode is
+    left to the writer (a read-only connection cannot change it); the database must
+    already exist.
+    """
+    engine = create_engine(settings.sqlalchemy_read_database_url(), future=True)
+    pragmas = {k: v for k, v in sqlite_pragmas(settings).items() if k != "journal_mode"}
+    apply_sqlite_pragmas(engine, {**pragmas, "query_only": 1})
+    return engine
+
+
+def create_read_engine_for(engine: Engine, settings: Settings) -> Engine | None:
+    """A read-only engine (as above) on the SQLite file the writer ``engine`` opens.
+
+    None when ``engine`` is not backed by a SQLite file -- an in-memory database is
+    private to its connection, so there is nothing a second engine could read.
+    """
+    database = engine.url.database
+    if engine.dialect.name != "sqlite" or not database or database == ":memory:":
+        return None
+    if database.startswith("file:"):
+        return None
+    return create_read_engine_from_settings(settings.model_copy(update={"db_path": Path(database)}))
 
 
 def create_session_factory(engine: Engine):
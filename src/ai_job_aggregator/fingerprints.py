@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from ai_job_aggregator.schemas.job import JobPostingIn
+
+
+def _digest(payload: Any) -> str:
+    blob = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def job_content_hash(job: JobPostingIn) -> str:
+    """Stable hash of a posting's normalized fields plus its raw payload.
+
+    Key order in ``raw`` does not matter; any edited value (salary, tags, ...) does.
+    """
+    return _digest(
+        {
+            "source": job.source,
+            "source_item_id": job.source_item_id,
+            "title": job.title,
+            "company": job.company,
+            "url": job.url,
+            "published_at": job.published_at.isoformat() if job.published_at else None,
+            "raw": job.raw,
+        }
+    )
+
+
+def profile_fingerprint(normalized_skills: Iterable[str]) -> str:
+    """Hash of a profile's normalized, de-duplicated skill list (order-sensitive)."""
+    return _digest(list(normalized_skills))
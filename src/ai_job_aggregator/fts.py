@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+from sqlalchemy import Connection, Select, column, select, table, text
+from sqlalchemy.orm import Session
+
+from ai_job_aggregator.schemas.job import JobSearchHit
+
+FTS_TABLE = "job_postings_fts"
+
+# Indexed document of a posting: display fields plus tags/description from ``raw``.
+_DOCUMENT_COLUMNS = "title, company, tags, description"
+_DOCUMENT_VALUES = (
+    "{row}.title, {row}.company, "
+    "(SELECT group_concat(value, ' ') FROM json_each({row}.raw, '$.tags')), "
+    "json_extract({row}.raw, '$.description')"
+)
+
+# Triggers keep the index in step with every write to job_postings -- in particular
+# the bulk upserts of ``run_ingestion``, which only touch new or changed postings.
+FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5({_DOCUMENT_COLUMNS})",
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_postings_fts_ai AFTER INSERT ON job_postings BEGIN
+        INSERT INTO {FTS_TABLE} (rowid, {_DOCUMENT_COLUMNS})
+        VALUES (new.id, {_DOCUMENT_VALUES.format(row="new")});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_postings_fts_au
+    AFTER UPDATE OF title, company, raw ON job_postings BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+        INSERT INTO {FTS_TABLE} (rowid, {_DOCUMENT_COLUMNS})
+        VALUES (new.id, {_DOCUMENT_VALUES.format(row="new")});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_postings_fts_ad AFTER DELETE ON job_postings BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+    END
+    """,
+)
+
+FTS_DROP_DDL = (
+    "DROP TRIGGER IF EXISTS job_postings_fts_ad",
+    "DROP TRIGGER IF EXISTS job_postings_fts_au",
+    "DROP TRIGGER IF EXISTS job_postings_fts_ai",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+)
+
+
+def create_fts_index(connection: Connection) -> None:
+    """Create the FTS table and its sync triggers, then (re)index every posting."""
+    for ddl in FTS_DDL:
+        connection.execute(text(ddl))
+    connection.execute(text(f"DELETE FROM {FTS_TABLE}"))
+    connection.execute(
+        text(
+            f"INSERT INTO {FTS_TABLE} (rowid, {_DOCUMENT_COLUMNS}) "
+            f"SELECT id, {_DOCUMENT_VALUES.format(row='job_postings')} FROM job_postings"
+        )
+    )
+
+
+_fts = table(FTS_TABLE, column("rowid"), column("rank"))
+
+
+def _match(query: str):
+    return text(f"{FTS_TABLE} MATCH :fts_query").bindparams(fts_query=query)
+
+
+def phrase_query(term: str) -> str | None:
+    """FTS5 query matching ``term`` as a phrase (None when it has no indexable token)."""
+    if not re.search(r"\w", term):
+        return None
+    return '"' + term.replace('"', '""') + '"'
+
+
+def plain_query(text: str) -> str | None:
+    """FTS5 query requiring every whitespace-separated term of ``text``.
+
+    Each term is quoted with ``phrase_query``, so operators and punctuation (``c++``,
+    ``AND``) are matched as text, never parsed. None when no term is indexable.
+    """
+    terms = [query for term in text.split() if (query := phrase_query(term)) is not None]
+    return " ".join(terms) or None
+
+
+def search_jobs(session: Session, query: str, *, limit: int = 20) -> list[JobSearchHit]:
+    """Postings matching an FTS5 query, best (lowest bm25) first."""
+    rows = session.execute(
+        text(
+            f"SELECT j.id AS job_id, j.title, j.company, j.url, {FTS_TABLE}.rank AS rank "
+            f"FROM {FTS_TABLE} JOIN job_postings AS j ON j.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH :query "
+            f"ORDER BY {FTS_TABLE}.rank LIMIT :limit"
+        ),
+        {"query": query, "limit": limit},
+    ).all()
+    return [JobSearchHit.model_validate(row._mapping) for row in rows]
+
+
+def match_terms(
+    session: Session, terms: Iterable[str], *, job_ids: Select | None = None
+) -> dict[str, set[int]]:
+    """Ids of the postings containing each term, one indexed query per term.
+
+    ``job_ids`` (a ``SELECT job_postings.id ...``) restricts the postings considered.
+    """
+    postings: dict[str, set[int]] = {}
+    for term in terms:
+        query = phrase_query(term)
+        if query is None:
+            postings[term] = set()
+            continue
+        stmt = select(_fts.c.rowid).where(_match(query))
+        if job_ids is not None:
+            stmt = stmt.where(_fts.c.rowid.in_(job_ids))
+        postings[term] = set(session.execute(stmt).scalars())
+    return postings
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import dataclasses
+import itertools
 import logging
+import queue
+import threading
+import time
 import traceback as tb_mod
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from datetime import UTC, datetime
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
-from ai_job_aggregator.connectors.base import JobConnector
-from ai_job_aggregator.models.candidate_profile import CandidateProfile
+from ai_job_aggregator.connectors.base import AsyncJobConnector, JobConnector, as_async
+from ai_job_aggregator.connectors.http import HttpClient
+from ai_job_aggregator.db import create_read_engine_for
+from ai_job_aggregator.fingerprints import job_content_hash
 from ai_job_aggregator.models.ingestion import (
     IngestionError,
     IngestionItem,
@@ -17,13 +31,29 @@ from ai_job_aggregator.models.ingestion import (
     RunStatus,
 )
 from ai_job_aggregator.models.job import JobPosting
+from ai_job_aggregator.profiles import find_profile
+from ai_job_aggregator.schemas.job import JobPostingIn
+from ai_job_aggregator.search_text import build_search_text
 from ai_job_aggregator.settings import Settings
+from ai_job_aggregator.skill_index import index_jobs
 
 logger = logging.getLogger(__name__)
 
 
 HARD_CAP_MAX_FETCH_PER_CONNECTOR = 100
 
+# Columns rewritten when an already-known posting's content hash changes.
+_POSTING_CONTENT_COLUMNS = (
+    "title",
+    "company",
+    "url",
+    "published_at",
+    "raw",
+    "search_text",
+    "content_hash",
+    "content_updated_at",
+)
+
 
 def _clamp_fetch_limit(*, settings_limit: int, cli_limit: int | None) -> int:
     # Prefer explicit CLI limit if provided.
@@ -33,30 +63,220 @@ def _clamp_fetch_limit(*, settings_limit: int, cli_limit: int | None) -> int:
     return min(raw, HARD_CAP_MAX_FETCH_PER_CONNECTOR)
 
 
-def run_ingestion(
+def _chunked(items: Iterable[JobPostingIn], size: int) -> Iterator[list[JobPostingIn]]:
+    it = iter(items)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+def _lookup_postings(
+    session: Session, keys: Iterable[tuple[str, str]]
+) -> dict[tuple[str, str], tuple[int, str | None]]:
+    """Map dedup key -> (job id, content hash) for the postings that already exist."""
+    return {
+        (source, source_item_id): (job_id, content_hash)
+        for job_id, source, source_item_id, content_hash in session.execute(
+            select(
+                JobPosting.id,
+                JobPosting.source,
+                JobPosting.source_item_id,
+                JobPosting.content_hash,
+            ).where(tuple_(JobPosting.source, JobPosting.source_item_id).in_(list(keys)))
+        )
+    }
+
+
+def _upsert_postings(session: Session, rows: list[dict[str, Any]]) -> dict[tuple[str, str], int]:
+    """Insert new postings and rewrite changed ones in a single statement.
+
+    The unique (source, source_item_id) index resolves conflicts in the database; a
+    conflicting row is only rewritten when its content hash differs. Returns dedup
+    key -> job id for every row that was inserted or rewritten.
+    """
+    stmt = sqlite_insert(JobPosting).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["source", "source_item_id"],
+        set_={col: stmt.excluded[col] for col in _POSTING_CONTENT_COLUMNS},
+        where=JobPosting.content_hash.is_distinct_from(stmt.excluded.content_hash),
+    ).returning(JobPosting.id, JobPosting.source, JobPosting.source_item_id)
+    return {
+        (source, source_item_id): job_id for job_id, source, source_item_id in session.execute(stmt)
+    }
+
+
+@dataclasses.dataclass(slots=True)
+class _ParsedJob:
+    """A fetched posting with its dedup key and content hash worked out."""
+
+    job: JobPostingIn
+    item: IngestionItem
+    key: tuple[str, str] | None = None
+    content_hash: str | None = None
+    error: IngestionError | None = None
+
+
+@dataclasses.dataclass(slots=True)
+class _DedupedChunk:
+    """A chunk classified against the known postings, ready to be written."""
+
+    items: list[IngestionItem] = dataclasses.field(default_factory=list)
+    # dedup key -> posting row, for new and changed postings
+    rows: dict[tuple[str, str], dict[str, Any]] = dataclasses.field(default_factory=dict)
+    pending_links: list[tuple[IngestionItem, tuple[str, str]]] = dataclasses.field(
+        default_factory=list
+    )
+    # dedup key -> job id of postings already in the database
+    ids: dict[tuple[str, str], int] = dataclasses.field(default_factory=dict)
+    # dedup key -> content hash the posting has once this chunk is written
+    hashes: dict[tuple[str, str], str] = dataclasses.field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def _item_error(job: JobPostingIn, error: Exception) -> IngestionError:
+    # called from an except block, so the traceback is the one being handled
+    return IngestionError(
+        error_type=type(error).__name__,
+        message=str(error),
+        traceback=tb_mod.format_exc(),
+        data={"source": job.source, "source_item_id": job.source_item_id},
+    )
+
+
+def _parse_chunk(*, run_id: int, chunk: list[JobPostingIn]) -> list[_ParsedJob]:
+    """Build the ingestion items of a chunk and key and hash its postings."""
+    parsed: list[_ParsedJob] = []
+    for job in chunk:
+        entry = _ParsedJob(
+            job=job,
+            item=IngestionItem(
+                run_id=run_id,
+                source_item_id=job.source_item_id,
+                status=ItemStatus.ok,
+                raw=job.raw,
+            ),
+        )
+        try:
+            entry.key = (job.source, job.source_item_id)
+            entry.content_hash = job_content_hash(job)
+        except Exception as e:  # noqa: BLE001
+            entry.error = _item_error(job, e)
+        parsed.append(entry)
+    return parsed
+
+
+def _dedup_chunk(
+    parsed: list[_ParsedJob],
     *,
+    known: dict[tuple[str, str], tuple[int | None, str | None]],
+) -> _DedupedChunk:
+    """Classify parsed postings against ``known`` (dedup key -> job id, content hash).
+
+    Known postings are unchanged (``skipped``) or ``updated`` by content hash; only new
+    and changed ones get a row (and search text) to write. A job id of ``None`` marks a
+    posting not committed yet; its id is looked up when the chunk is written.
+    """
+    out = _DedupedChunk()
+    now = datetime.now(tz=UTC)
+    seen: set[tuple[str, str]] = set()
+
+    for entry in parsed:
+        job, item, key = entry.job, entry.item, entry.key
+        out.items.append(item)
+        if key is not None and key in seen:
+            # repeated within the same chunk: first occurrence wins
+            item.status = ItemStatus.skipped
+            out.pending_links.append((item, key))
+            continue
+        if key is not None:
+            seen.add(key)
+        if entry.error is not None or key is None:
+            item.status = ItemStatus.error
+            item.error = entry.error
+            continue
+
+        try:
+            if key in known:
+                job_id, known_hash = known[key]
+                if job_id is not None:
+                    out.ids[key] = job_id
+                changed = known_hash != entry.content_hash
+                item.status = ItemStatus.updated if changed else ItemStatus.skipped
+            else:
+                changed = True
+            if changed:
+                out.rows[key] = {
+                    "source": job.source,
+                    "source_item_id": job.source_item_id,
+                    "title": job.title,
+                    "company": job.company,
+                    "url": job.url,
+                    "published_at": job.published_at,
+                    "raw": job.raw,
+                    "search_text": build_search_text(
+                        title=job.title, company=job.company, url=job.url, raw=job.raw
+                    ),
+                    "content_hash": entry.content_hash,
+                    "content_updated_at": now,
+                }
+        except Exception as e:  # noqa: BLE001
+            item.status = ItemStatus.error
+            item.error = _item_error(job, e)
+            continue
+        out.hashes[key] = entry.content_hash
+        out.pending_links.append((item, key))
+    return out
+
+
+def _write_chunk(session: Session, chunk: _DedupedChunk) -> Counter[ItemStatus]:
+    """Upsert a classified chunk's postings and add its items, without committing."""
+    rows = chunk.rows
+    written = _upsert_postings(session, list(rows.values())) if rows else {}
+    index_jobs(session, {job_id: rows[key]["search_text"] for key, job_id in written.items()})
+    ids = chunk.ids | written
+
+    # A concurrent ingest may have inserted an identical posting since the lookup, and
+    # in a pipelined run an earlier chunk may have (see ``_PipelineDedup``).
+    missing = {key for _, key in chunk.pending_links} - ids.keys()
+    if missing:
+        ids |= {key: job_id for key, (job_id, _) in _lookup_postings(session, missing).items()}
+
+    for item, key in chunk.pending_links:
+        item.job_id = ids.get(key)
+
+    session.add_all(chunk.items)
+    session.flush()
+    return Counter(item.status for item in chunk.items)
+
+
+def _persist_chunk(
     session: Session,
-    connector: JobConnector,
-    limit: int | None = None,
-    profile_selector: str | None = None,
-) -> int:
+    *,
+    run_id: int,
+    chunk: list[JobPostingIn],
+) -> Counter[ItemStatus]:
+    """Persist one chunk of fetched jobs without committing.
+
+    Existing postings are fetched with one lookup and classified by content hash as
+    unchanged (``skipped``) or ``updated``; new and changed postings are then written
+    by a single upsert (and re-indexed), and items and errors in bulk by one flush.
+    """
+    parsed = _parse_chunk(run_id=run_id, chunk=chunk)
+    known = _lookup_postings(session, {entry.key for entry in parsed if entry.key is not None})
+    return _write_chunk(session, _dedup_chunk(parsed, known=known))
+
+
+def _start_run(session: Session, *, source: str, profile_selector: str | None) -> IngestionRun:
     run = IngestionRun(
-        source=connector.source,
+        source=source,
         started_at=datetime.now(tz=UTC),
         status=RunStatus.started,
         meta={},
     )
     # Candidate profile selection (optional)
     if profile_selector:
-        # selector can be numeric id or string label
-        prof = None
-        if profile_selector.isdigit():
-            prof = session.get(CandidateProfile, int(profile_selector))
-        if prof is None:
-            prof = session.execute(
-                select(CandidateProfile).where(CandidateProfile.label == profile_selector)
-            ).scalar_one_or_none()
-
+        prof = find_profile(session, profile_selector)
         if prof is not None:
             run.profile_id = prof.id
             run.meta = {
@@ -78,12 +298,349 @@ def run_ingestion(
 
     logger.info(
         "ingestion_run_started",
-        extra={"run_id": run.id, "source": connector.source, "profile": profile_selector},
+        extra={"run_id": run.id, "source": source, "profile": profile_selector},
     )
+    return run
+
+
+def _run_counts(counts: Counter[ItemStatus]) -> dict[str, int]:
+    return {
+        "ok": counts[ItemStatus.ok],
+        "skipped": counts[ItemStatus.skipped],
+        "updated": counts[ItemStatus.updated],
+        "error": counts[ItemStatus.error],
+    }
+
+
+def _finish_run(
+    session: Session,
+    run: IngestionRun,
+    *,
+    counts: Counter[ItemStatus],
+    fetch_limit: int,
+    meta: dict[str, Any] | None = None,
+) -> int | None:
+    """Mark ``run`` finished; returns the id of its scoring run if it is profile-bound.
+
+    The scoring run is only created here: ``_hand_off_scoring`` enqueues it once the
+    ingest is done writing.
+    """
+    run.status = RunStatus.finished
+    run.finished_at = datetime.now(tz=UTC)
+    run.meta = {**(run.meta or {}), **(meta or {}), **_run_counts(counts), "limit": fetch_limit}
+    session.commit()
+    logger.info(
+        "ingestion_run_finished",
+        extra={"run_id": run.id, "source": run.source, **_run_counts(counts)},
+    )
+
+    if run.profile_id is None:
+        return None
+    try:
+        from ai_job_aggregator.scoring.service import create_scoring_run
+
+        scoring_run = create_scoring_run(
+            session=session,
+            profile_id=run.profile_id,
+            ingestion_run_id=run.id,
+            meta={"source": run.source},
+        )
+        session.commit()
+        return scoring_run.id
+    except Exception:  # noqa: BLE001
+        session.rollback()
+        logger.warning(
+            "scoring_enqueue_failed",
+            extra={"ingestion_run_id": run.id, "profile_id": run.profile_id},
+            exc_info=True,
+        )
+        return None
+
+
+def _hand_off_scoring(session: Session, scoring_run_ids: Sequence[int | None]) -> None:
+    """Enqueue the scoring runs of finished ingestion runs, after the last ingest commit.
+
+    Scoring runs asynchronously (see ``enqueue_scoring_run``); with the in-process
+    backend it starts now, so it never competes with the ingest for the write lock.
+    """
+    from ai_job_aggregator.scoring.enqueue import enqueue_scoring_run
+
+    for scoring_run_id in scoring_run_ids:
+        if scoring_run_id is None:
+            continue
+        try:
+            enqueue_scoring_run(run_id=scoring_run_id, session=session)
+        except Exception:  # noqa: BLE001
+            logger.warning(
+                "scoring_enqueue_failed", extra={"scoring_run_id": scoring_run_id}, exc_info=True
+            )
+
+
+def _fail_run(
+    session: Session,
+    run: IngestionRun,
+    error: BaseException,
+    *,
+    counts: Counter[ItemStatus],
+    fetch_limit: int | None,
+    meta: dict[str, Any] | None = None,
+) -> None:
+    # Drop any half-built chunk so only fully persisted chunks survive a fatal error.
+    session.rollback()
+    run.status = RunStatus.failed
+    run.finished_at = datetime.now(tz=UTC)
+    run.meta = {
+        **(run.meta or {}),
+        **(meta or {}),
+        **_run_counts(counts),
+        "fatal": {"error_type": type(error).__name__, "message": str(error)},
+        "limit": fetch_limit,
+    }
+    session.commit()
+    logger.error(
+        "ingestion_run_failed",
+        extra={"run_id": run.id, "source": run.source, "error_type": type(error).__name__},
+        exc_info=error,
+    )
+
+
+# Ends a pipeline stage's stream; a stage that fails sends its exception instead.
+_END = object()
+
+# How often a pipeline stage blocked on a queue checks whether the run was abandoned.
+_PIPELINE_POLL_S = 0.1
+
+
+@dataclasses.dataclass(slots=True)
+class _StageStats:
+    """Throughput counters of one ingest pipeline stage."""
+
+    chunks: int = 0
+    items: int = 0
+    busy_s: float = 0.0  # doing the stage's own work
+    idle_s: float = 0.0  # waiting for the previous stage
+    blocked_s: float = 0.0  # waiting for room in the next stage's queue (backpressure)
+
+    def to_meta(self) -> dict[str, Any]:
+        return {
+            "chunks": self.chunks,
+            "items": self.items,
+            "busy_s": round(self.busy_s, 4),
+            "idle_s": round(self.idle_s, 4),
+            "blocked_s": round(self.blocked_s, 4),
+            "items_per_s": round(self.items / self.busy_s, 1) if self.busy_s else None,
+        }
+
+
+class _Pipeline:
+    """Stages running on their own threads, joined by queues of ``queue_chunks`` chunks.
+
+    A full queue blocks the stage feeding it, so memory stays bounded whichever stage
+    is the slowest. The last stage runs on the calling thread (``sink``).
+    """
+
+    def __init__(self, *, queue_chunks: int, stats: dict[str, _StageStats]):
+        self._queue_chunks = max(1, queue_chunks)
+        self._stats = stats
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def _start(self, name: str, target: Callable[[_StageStats, queue.Queue], None]) -> queue.Queue:
+        out: queue.Queue = queue.Queue(maxsize=self._queue_chunks)
+        self._stats[name] = stats = _StageStats()
+        thread = threading.Thread(
+            target=target, args=(stats, out), name=f"aja-ingest-{name}", daemon=True
+        )
+        self._threads.append(thread)
+        thread.start()
+        return out
+
+    def _put(self, q: queue.Queue, message: Any, stats: _StageStats) -> bool:
+        t0 = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                try:
+                    q.put(message, timeout=_PIPELINE_POLL_S)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            stats.blocked_s += time.perf_counter() - t0
+
+    def _get(self, q: queue.Queue, stats: _StageStats) -> Any:
+        t0 = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                try:
+                    return q.get(timeout=_PIPELINE_POLL_S)
+                except queue.Empty:
+                    continue
+            return _END
+        finally:
+            stats.idle_s += time.perf_counter() - t0
+
+    def source(self, name: str, chunks: Iterator[list[Any]]) -> queue.Queue:
+        def _run(stats: _StageStats, out: queue.Queue) -> None:
+            message: Any = _END
+            try:
+                while True:
+                    t0 = time.perf_counter()
+                    chunk = next(chunks, None)
+                    stats.busy_s += time.perf_counter() - t0
+                    if chunk is None:
+                        break
+                    stats.chunks += 1
+                    stats.items += len(chunk)
+                    if not self._put(out, chunk, stats):
+                        return
+            except Exception as e:  # noqa: BLE001
+                message = e
+            self._put(out, message, stats)
+
+        return self._start(name, _run)
+
+    def stage(self, name: str, upstream: queue.Queue, fn: Callable[[Any], Any]) -> queue.Queue:
+        def _run(stats: _StageStats, out: queue.Queue) -> None:
+            message: Any = _END
+            try:
+                while (chunk := self._get(upstream, stats)) is not _END:
+                    if isinstance(chunk, BaseException):
+                        message = chunk
+                        break
+                    t0 = time.perf_counter()
+                    result = fn(chunk)
+                    stats.busy_s += time.perf_counter() - t0
+                    stats.chunks += 1
+                    stats.items += len(chunk)
+                    if not self._put(out, result, stats):
+                        return
+            except Exception as e:  # noqa: BLE001
+                message = e
+            self._put(out, message, stats)
+
+        return self._start(name, _run)
+
+    def sink(self, name: str, upstream: queue.Queue, fn: Callable[[Any], None]) -> None:
+        """Feed every chunk to ``fn`` on this thread; re-raise a failed stage's error."""
+        self._stats[name] = stats = _StageStats()
+        while (chunk := self._get(upstream, stats)) is not _END:
+            if isinstance(chunk, BaseException):
+                raise chunk
+            t0 = time.perf_counter()
+            fn(chunk)
+            stats.busy_s += time.perf_counter() - t0
+            stats.chunks += 1
+            stats.items += len(chunk)
+
+    def close(self) -> None:
+        """Stop the stages (after a failure downstream) and wait for their threads."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+
 
-    ok_count = 0
-    err_count = 0
-    skipped_count = 0
+class _PipelineDedup:
+    """Dedup stage of a pipelined run, looking postings up on its own session.
+
+    Chunks ahead of this one may still be on their way to the writer, so postings this
+    run already classified are resolved from their hashes here rather than from the
+    database (their ids are looked up once the chunk is written).
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+        self._hashes: dict[tuple[str, str], str] = {}
+
+    def __call__(self, parsed: list[_ParsedJob]) -> _DedupedChunk:
+        keys = {entry.key for entry in parsed if entry.key is not None}
+        known: dict[tuple[str, str], tuple[int | None, str | None]] = {
+            key: (None, self._hashes[key]) for key in keys & self._hashes.keys()
+        }
+        known |= _lookup_postings(self._session, keys - self._hashes.keys())
+        # end the read transaction so the next lookup sees the writer's commits
+        self._session.rollback()
+        chunk = _dedup_chunk(parsed, known=known)
+        self._hashes |= chunk.hashes
+        return chunk
+
+
+def _run_pipeline(
+    session: Session,
+    *,
+    run_id: int,
+    chunks: Iterator[list[JobPostingIn]],
+    counts: Counter[ItemStatus],
+    stats: dict[str, _StageStats],
+    queue_chunks: int,
+    read_engine: Engine,
+) -> None:
+    """Ingest ``chunks`` through fetch -> parse -> dedup -> persist stages.
+
+    Only the persist stage, on this thread, writes to ``session`` and commits each
+    chunk; the dedup stage looks postings up through ``read_engine``, a read-only
+    engine on the same database file.
+    """
+
+    def _persist(chunk: _DedupedChunk) -> None:
+        counts.update(_write_chunk(session, chunk))
+        session.commit()
+
+    pipeline = _Pipeline(queue_chunks=queue_chunks, stats=stats)
+    lookup_session = Session(bind=read_engine)
+    try:
+        fetched = pipeline.source("fetch", chunks)
+        parsed = pipeline.stage(
+            "parse", fetched, lambda chunk: _parse_chunk(run_id=run_id, chunk=chunk)
+        )
+        deduped = pipeline.stage("dedup", parsed, _PipelineDedup(lookup_session))
+        pipeline.sink("persist", deduped, _persist)
+    finally:
+        pipeline.close()
+        lookup_session.close()
+        logger.info(
+            "ingestion_pipeline_stats",
+            extra={"run_id": run_id, "stages": {name: st.to_meta() for name, st in stats.items()}},
+        )
+
+
+def _pipeline_read_engine(session: Session, settings: Settings) -> Engine | None:
+    """Read-only engine for the pipeline's dedup stage, or None to ingest in lockstep.
+
+    The stage reads on another thread while this one writes, so it needs connections
+    of its own: a session bound to a caller-managed ``Connection`` (or to an in-memory
+    database) has no second connection to give, and runs in lockstep instead.
+    """
+    bind = session.get_bind()
+    read_engine = create_read_engine_for(bind, settings) if isinstance(bind, Engine) else None
+    if read_engine is None:
+        logger.info("ingestion_pipeline_unavailable", extra={"bind": type(bind).__name__})
+    return read_engine
+
+
+def _stages_meta(stats: dict[str, _StageStats]) -> dict[str, Any]:
+    return {"stages": {name: st.to_meta() for name, st in stats.items()}} if stats else {}
+
+
+def run_ingestion(
+    *,
+    session: Session,
+    connector: JobConnector,
+    limit: int | None = None,
+    profile_selector: str | None = None,
+    batch_size: int | None = None,
+) -> int:
+    """Ingest one source, persisting and committing it in chunks of ``batch_size``.
+
+    With ``AJA_INGEST_PIPELINE`` (default) fetching, parsing, dedup lookups and writes
+    run as overlapping stages (see ``_run_pipeline``) and each stage's throughput is
+    recorded in ``meta["stages"]``; otherwise -- or when ``session`` is not bound to an
+    engine on a SQLite file -- each chunk goes through them in turn.
+    """
+    run = _start_run(session, source=connector.source, profile_selector=profile_selector)
+    counts: Counter[ItemStatus] = Counter()
+    fetch_limit: int | None = None
+    stages: dict[str, _StageStats] = {}
 
     try:
         settings = Settings()
@@ -99,128 +656,211 @@ def run_ingestion(
             )
             run.status = RunStatus.finished
             run.finished_at = datetime.now(tz=UTC)
-            run.meta = {
-                **(run.meta or {}),
-                "ok": ok_count,
-                "skipped": skipped_count,
-                "error": err_count,
-                "limit": fetch_limit,
-            }
+            run.meta = {**(run.meta or {}), **_run_counts(counts), "limit": fetch_limit}
             session.commit()
             return 0
 
-        for idx, job in enumerate(connector.fetch()):
-            if idx >= fetch_limit:
-                break
-            source_item_id = job.source_item_id
-            item = IngestionItem(
-                run_id=run.id,
-                source_item_id=source_item_id,
-                status=ItemStatus.ok,
-                raw=job.raw,
-            )
-            session.add(item)
-            session.flush()  # to get item.id
-
+        chunk_size = max(1, batch_size if batch_size is not None else settings.ingest_batch_size)
+        chunks = _chunked(itertools.islice(connector.fetch(), fetch_limit), chunk_size)
+        read_engine = _pipeline_read_engine(session, settings) if settings.ingest_pipeline else None
+        if read_engine is not None:
             try:
-                existing = session.execute(
-                    select(JobPosting).where(
-                        JobPosting.source == job.source,
-                        JobPosting.source_item_id == job.source_item_id,
-                    )
-                ).scalar_one_or_none()
-
-                if existing is not None:
-                    item.status = ItemStatus.skipped
-                    item.job_id = existing.id
-                    skipped_count += 1
-                else:
-                    jp = JobPosting(
-                        source=job.source,
-                        source_item_id=job.source_item_id,
-                        title=job.title,
-                        company=job.company,
-                        url=job.url,
-                        published_at=job.published_at,
-                        raw=job.raw,
-                    )
-                    session.add(jp)
-                    session.flush()
-                    item.job_id = jp.id
-                    ok_count += 1
-            except Exception as e:  # noqa: BLE001
-                item.status = ItemStatus.error
-                err = IngestionError(
-                    item_id=item.id,
-                    error_type=type(e).__name__,
-                    message=str(e),
-                    traceback=tb_mod.format_exc(),
-                    data={"source": job.source, "source_item_id": job.source_item_id},
+                _run_pipeline(
+                    session,
+                    run_id=run.id,
+                    chunks=chunks,
+                    counts=counts,
+                    stats=stages,
+                    queue_chunks=settings.ingest_queue_chunks,
+                    read_engine=read_engine,
                 )
-                session.add(err)
-                err_count += 1
+            finally:
+                read_engine.dispose()
+        else:
+            for chunk in chunks:
+                counts += _persist_chunk(session, run_id=run.id, chunk=chunk)
+                session.commit()
 
-            session.commit()
+        scoring_run_id = _finish_run(
+            session, run, counts=counts, fetch_limit=fetch_limit, meta=_stages_meta(stages)
+        )
 
-        run.status = RunStatus.finished
-        run.finished_at = datetime.now(tz=UTC)
-        run.meta = {
-            **(run.meta or {}),
-            "ok": ok_count,
-            "skipped": skipped_count,
-            "error": err_count,
-            "limit": fetch_limit,
-        }
+    except Exception as e:  # noqa: BLE001
+        _fail_run(
+            session, run, e, counts=counts, fetch_limit=fetch_limit, meta=_stages_meta(stages)
+        )
+        return 2
+
+    _hand_off_scoring(session, [scoring_run_id])
+    return 0
+
+
+# Queue messages from the fetching connectors to the writer: a chunk of postings, the
+# end of a source (None) or the error that ended it.
+_SourceMessage = tuple[str, list[JobPostingIn] | BaseException | None]
+
+
+async def _produce_source(
+    connector: JobConnector | AsyncJobConnector,
+    http: HttpClient,
+    out: queue.Queue[_SourceMessage],
+    *,
+    fetch_limit: int,
+    chunk_size: int,
+) -> None:
+    source = connector.source
+    try:
+        chunk: list[JobPostingIn] = []
+        fetched = 0
+        async with contextlib.aclosing(as_async(connector).afetch(http)) as jobs:
+            async for job in jobs:
+                chunk.append(job)
+                fetched += 1
+                if len(chunk) >= chunk_size:
+                    # blocks (off the event loop) while the writer is behind
+                    await asyncio.to_thread(out.put, (source, chunk))
+                    chunk = []
+                if fetched >= fetch_limit:
+                    break
+        if chunk:
+            await asyncio.to_thread(out.put, (source, chunk))
+        await asyncio.to_thread(out.put, (source, None))
+    except Exception as e:  # noqa: BLE001
+        await asyncio.to_thread(out.put, (source, e))
+
+
+async def _produce_all(
+    connectors: Sequence[JobConnector | AsyncJobConnector],
+    out: queue.Queue[_SourceMessage],
+    *,
+    settings: Settings,
+    fetch_limit: int,
+    chunk_size: int,
+) -> None:
+    async with HttpClient(settings) as http:
+        await asyncio.gather(
+            *(
+                _produce_source(c, http, out, fetch_limit=fetch_limit, chunk_size=chunk_size)
+                for c in connectors
+            )
+        )
+
+
+def _fetch_all(
+    connectors: Sequence[JobConnector | AsyncJobConnector],
+    out: queue.Queue[_SourceMessage],
+    *,
+    settings: Settings,
+    fetch_limit: int,
+    chunk_size: int,
+) -> None:
+    """Body of the fetcher thread: run ``_produce_all`` on an event loop of its own.
+
+    A failure outside any one source's fetch (opening the shared ``HttpClient``, say)
+    ends every source with that error, so the writer never waits for a source that will
+    not report back; it ignores the message for sources already ended.
+    """
+    try:
+        asyncio.run(
+            _produce_all(
+                connectors, out, settings=settings, fetch_limit=fetch_limit, chunk_size=chunk_size
+            )
+        )
+    except BaseException as e:  # noqa: BLE001
+        logger.error("ingestion_fetcher_failed", exc_info=True)
+        for connector in connectors:
+            out.put((connector.source, e))
+
+
+def run_ingestion_many(
+    *,
+    session: Session,
+    connectors: Sequence[JobConnector | AsyncJobConnector],
+    limit: int | None = None,
+    profile_selector: str | None = None,
+    batch_size: int | None = None,
+) -> int:
+    """Ingest several sources at once, one ``IngestionRun`` per source.
+
+    Connectors fetch concurrently on an event loop in a background thread (async ones
+    through the shared ``HttpClient``, sync ones via ``SyncConnectorAdapter``), so wall
+    time approaches the slowest source rather than the sum. Their postings reach this
+    thread in chunks of ``batch_size`` through a queue bounded by
+    ``AJA_INGEST_QUEUE_CHUNKS``; this thread is the only writer and persists and
+    commits each chunk as ``run_ingestion`` does. A source that fails -- fetching or
+    persisting -- fails its own run; the others carry on. Returns 2 if any run failed.
+    """
+    sources = [c.source for c in connectors]
+    if len(set(sources)) != len(sources):
+        raise ValueError(f"duplicate connector sources: {sources}")
+
+    settings = Settings()
+    fetch_limit = _clamp_fetch_limit(
+        settings_limit=settings.max_fetch_per_connector, cli_limit=limit
+    )
+    chunk_size = max(1, batch_size if batch_size is not None else settings.ingest_batch_size)
+    runs = {
+        source: _start_run(session, source=source, profile_selector=profile_selector)
+        for source in sources
+    }
+    counts: dict[str, Counter[ItemStatus]] = {source: Counter() for source in sources}
+
+    if fetch_limit == 0:
+        for run in runs.values():
+            logger.info(
+                "ingestion_run_noop_limit",
+                extra={"run_id": run.id, "source": run.source, "limit": fetch_limit},
+            )
+            run.status = RunStatus.finished
+            run.finished_at = datetime.now(tz=UTC)
+            run.meta = {**(run.meta or {}), **_run_counts(Counter()), "limit": fetch_limit}
         session.commit()
+        return 0
+
+    inbox: queue.Queue[_SourceMessage] = queue.Queue(maxsize=max(1, settings.ingest_queue_chunks))
+    fetcher = threading.Thread(
+        target=_fetch_all,
+        args=(connectors, inbox),
+        kwargs={"settings": settings, "fetch_limit": fetch_limit, "chunk_size": chunk_size},
+        name="aja-ingest-fetch",
+        daemon=True,
+    )
+    fetcher.start()
 
-        # enqueue scoring asynchronously for profile-bound ingestion runs
-        if run.profile_id is not None:
+    failed: set[str] = set()
+    scoring_run_ids: list[int | None] = []
+    open_sources = set(sources)
+    while open_sources:
+        source, message = inbox.get()
+        if source not in open_sources:
+            continue  # a fetcher failure reported after the source had ended
+        run = runs[source]
+        if source in failed:
+            # persisting an earlier chunk failed: drain the source's remaining chunks
+            if not isinstance(message, list):
+                open_sources.discard(source)
+            continue
+        if message is None:
+            open_sources.discard(source)
             try:
-                from ai_job_aggregator.scoring.enqueue import enqueue_scoring_run
-                from ai_job_aggregator.scoring.service import create_scoring_run
-
-                scoring_run = create_scoring_run(
-                    session=session,
-                    profile_id=run.profile_id,
-                    ingestion_run_id=run.id,
-                    meta={"source": connector.source},
+                scoring_run_ids.append(
+                    _finish_run(session, run, counts=counts[source], fetch_limit=fetch_limit)
                 )
+            except Exception as e:  # noqa: BLE001
+                failed.add(source)
+                _fail_run(session, run, e, counts=counts[source], fetch_limit=fetch_limit)
+        elif isinstance(message, BaseException):
+            open_sources.discard(source)
+            failed.add(source)
+            _fail_run(session, run, message, counts=counts[source], fetch_limit=fetch_limit)
+        else:
+            try:
+                counts[source] += _persist_chunk(session, run_id=run.id, chunk=message)
                 session.commit()
-                enqueue_scoring_run(run_id=scoring_run.id)
-            except Exception:  # noqa: BLE001
-                logger.warning(
-                    "scoring_enqueue_failed",
-                    extra={"ingestion_run_id": run.id, "profile_id": run.profile_id},
-                    exc_info=True,
-                )
-
-        logger.info(
-            "ingestion_run_finished",
-            extra={
-                "run_id": run.id,
-                "source": connector.source,
-                "ok": ok_count,
-                "skipped": skipped_count,
-                "error": err_count,
-            },
-        )
-        return 0
+            except Exception as e:  # noqa: BLE001
+                failed.add(source)
+                _fail_run(session, run, e, counts=counts[source], fetch_limit=fetch_limit)
 
-    except Exception as e:  # noqa: BLE001
-        run.status = RunStatus.failed
-        run.finished_at = datetime.now(tz=UTC)
-        run.meta = {
-            **(run.meta or {}),
-            "ok": ok_count,
-            "skipped": skipped_count,
-            "error": err_count,
-            "fatal": {"error_type": type(e).__name__, "message": str(e)},
-            "limit": locals().get("fetch_limit", None),
-        }
-        session.commit()
-        logger.error(
-            "ingestion_run_failed",
-            extra={"run_id": run.id, "source": connector.source, "error_type": type(e).__name__},
-            exc_info=True,
-        )
-        return 2
+    fetcher.join()
+    _hand_off_scoring(session, scoring_run_ids)
+    return 2 if failed else 0
@@ -20,6 +20,7 @@ class ItemStatus(enum.StrEnum):
     ok = "ok"
     error = "error"
     skipped = "skipped"
+    updated = "updated"
 
 
 class IngestionRun(Base):
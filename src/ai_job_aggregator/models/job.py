@@ -2,20 +2,26 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, String
+from sqlalchemy import DateTime, Index, Integer, String, Text
 from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
+from ai_job_aggregator.search_text import default_search_text
+
 from .base import Base
 
 
 class JobPosting(Base):
     __tablename__ = "job_postings"
+    __table_args__ = (
+        # Dedup key; ingestion relies on it for INSERT ... ON CONFLICT.
+        Index("ux_job_postings_source_item", "source", "source_item_id", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
-    source: Mapped[str] = mapped_column(String(64), index=True)
-    source_item_id: Mapped[str] = mapped_column(String(128), index=True)
+    source: Mapped[str] = mapped_column(String(64))
+    source_item_id: Mapped[str] = mapped_column(String(128))
 
     title: Mapped[str | None] = mapped_column(String(512), nullable=True)
     company: Mapped[str | None] = mapped_column(String(256), nullable=True)
@@ -24,3 +30,15 @@ class JobPosting(Base):
     published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     raw: Mapped[dict] = mapped_column(JSON, default=dict)
+
+    # Normalized text scorers match against; precomputed so scoring never loads `raw`.
+    search_text: Mapped[str | None] = mapped_column(
+        Text, nullable=True, default=default_search_text
+    )
+
+    # Change detection: sha256 of the normalized fields + raw (see fingerprints.job_content_hash)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # Last time the posting was inserted or its content changed
+    content_updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
@@ -3,7 +3,7 @@ from __future__ import annotations
 import enum
 from datetime import datetime
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.types import JSON
 
@@ -69,3 +69,69 @@ class ScoreItem(Base):
     error_id: Mapped[int | None] = mapped_column(
         ForeignKey("scoring_errors.id"), index=True, nullable=True
     )
+
+
+# Ranked reads ("best N jobs of a run") walk this index in order with keyset pagination
+# on (score, id); no sort step, and only the N returned rows are looked up.
+Index(
+    "ix_score_items_run_score",
+    ScoreItem.scoring_run_id,
+    ScoreItem.score.desc(),
+    ScoreItem.id,
+    ScoreItem.job_id,
+)
+
+
+class ProfileJobScore(Base):
+    """Latest score of a job for a profile, across the profile's finished runs.
+
+    Incremental runs only score new/changed postings, so no single run holds a
+    profile's ranking; the writer upserts this table as each run finishes (see
+    ``scoring.results.record_latest_scores``). Failed scores are never recorded.
+    """
+
+    __tablename__ = "profile_job_scores"
+
+    profile_id: Mapped[int] = mapped_column(ForeignKey("candidate_profiles.id"), primary_key=True)
+    job_id: Mapped[int] = mapped_column(ForeignKey("job_postings.id"), primary_key=True)
+    item_id: Mapped[int] = mapped_column(ForeignKey("score_items.id"))
+    score: Mapped[float]
+
+
+# Ranked reads of a profile ("best N jobs") walk this index like ix_score_items_run_score.
+Index(
+    "ix_profile_job_scores_profile_score",
+    ProfileJobScore.profile_id,
+    ProfileJobScore.score.desc(),
+    ProfileJobScore.item_id,
+)
+
+
+class ScoreCacheEntry(Base):
+    """Memoized ScoreResult for (scorer version, profile skills, job content)."""
+
+    __tablename__ = "score_cache"
+    __table_args__ = (
+        Index(
+            "ux_score_cache_key",
+            "scorer_version",
+            "profile_fingerprint",
+            "job_fingerprint",
+            unique=True,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    scorer_version: Mapped[str] = mapped_column(String(32))
+    profile_fingerprint: Mapped[str] = mapped_column(String(64))
+    job_fingerprint: Mapped[str] = mapped_column(String(64))
+
+    score: Mapped[float]
+    skills_matched: Mapped[list[str]] = mapped_column(JSON, default=list)
+    skills_missing: Mapped[list[str]] = mapped_column(JSON, default=list)
+    reasons: Mapped[dict] = mapped_column(JSON, default=dict)
+
+    created_at: Mapped[datetime]
+    # Retention is based on last use, see scoring.cache.prune_score_cache
+    last_used_at: Mapped[datetime] = mapped_column(index=True)
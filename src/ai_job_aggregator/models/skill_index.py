@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ai_job_aggregator.models.base import Base
+
+
+class SkillTerm(Base):
+    """A skill tracked by the inverted index (normalized like profile skills)."""
+
+    __tablename__ = "skill_terms"
+    __table_args__ = (Index("ux_skill_terms_term", "term", unique=True),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    term: Mapped[str] = mapped_column(String(256))
+    created_at: Mapped[datetime]
+
+
+class SkillPosting(Base):
+    """Job ``job_id`` mentions skill ``term_id`` (see ``skill_index.index_jobs``)."""
+
+    __tablename__ = "skill_postings"
+    # Clustered on (term, job): a term's postings list is one contiguous range scan.
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    term_id: Mapped[int] = mapped_column(ForeignKey("skill_terms.id"), primary_key=True)
+    job_id: Mapped[int] = mapped_column(ForeignKey("job_postings.id"), primary_key=True, index=True)
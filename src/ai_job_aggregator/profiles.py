@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ai_job_aggregator.models.candidate_profile import CandidateProfile
+
+
+def find_profile(session: Session, selector: str) -> CandidateProfile | None:
+    """Resolve a candidate profile selector: numeric id or string label."""
+    prof = None
+    if selector.isdigit():
+        prof = session.get(CandidateProfile, int(selector))
+    if prof is None:
+        prof = session.execute(
+            select(CandidateProfile).where(CandidateProfile.label == selector)
+        ).scalar_one_or_none()
+    return prof
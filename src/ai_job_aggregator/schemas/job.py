@@ -31,3 +31,12 @@ class JobPostingOut(BaseModel):
     url: str | None
     published_at: datetime | None
     raw: dict[str, Any]
+
+
+class JobSearchHit(BaseModel):
+    job_id: int
+    title: str | None
+    company: str | None
+    url: str | None
+    # FTS5 bm25 rank: lower is a better match
+    rank: float
@@ -38,3 +38,22 @@ class ScoreResult(BaseModel):
     skills_matched: list[str]
     skills_missing: list[str]
     reasons: dict
+
+
+class RankedResult(BaseModel):
+    """One row of a ranked scoring run: score plus the job's display columns."""
+
+    item_id: int
+    job_id: int
+    score: float
+    skills_matched: list[str]
+    skills_missing: list[str]
+    title: str | None
+    company: str | None
+    url: str | None
+    published_at: datetime | None
+
+    @property
+    def cursor(self) -> str:
+        """Keyset cursor for the page after this row (see ``parse_cursor``)."""
+        return f"{self.score!r}:{self.item_id}"
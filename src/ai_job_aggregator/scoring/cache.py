@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from ai_job_aggregator.fingerprints import profile_fingerprint
+from ai_job_aggregator.models.scoring import ScoreCacheEntry
+from ai_job_aggregator.schemas.scoring import ScoreResult
+from ai_job_aggregator.scoring.engines import SCORER_VERSIONS, RowMatcher
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ScoreCacheKey:
+    """The profile side of a cache key; jobs contribute their content hash."""
+
+    scorer_version: str
+    profile_fingerprint: str
+
+    @classmethod
+    def for_matcher(cls, matcher: RowMatcher) -> ScoreCacheKey:
+        return cls(
+            scorer_version=matcher.version,
+            profile_fingerprint=profile_fingerprint(matcher.skills),
+        )
+
+    def _where(self, job_fingerprints: Iterable[str]):
+        return (
+            ScoreCacheEntry.scorer_version == self.scorer_version,
+            ScoreCacheEntry.profile_fingerprint == self.profile_fingerprint,
+            ScoreCacheEntry.job_fingerprint.in_(list(job_fingerprints)),
+        )
+
+
+def lookup_scores(
+    session: Session, key: ScoreCacheKey, job_fingerprints: Iterable[str]
+) -> dict[str, ScoreResult]:
+    """Cached results for the given job content hashes (missing hashes are misses)."""
+    rows = session.execute(
+        select(
+            ScoreCacheEntry.job_fingerprint,
+            ScoreCacheEntry.score,
+            ScoreCacheEntry.skills_matched,
+            ScoreCacheEntry.skills_missing,
+            ScoreCacheEntry.reasons,
+        ).where(*key._where(job_fingerprints))
+    )
+    return {
+        row.job_fingerprint: ScoreResult(
+            score=row.score,
+            skills_matched=row.skills_matched,
+            skills_missing=row.skills_missing,
+            reasons=row.reasons,
+        )
+        for row in rows
+    }
+
+
+def store_scores(session: Session, key: ScoreCacheKey, results: Mapping[str, ScoreResult]) -> None:
+    """Insert freshly computed results; entries written concurrently are kept.
+
+    One parameterized statement executed for every row (executemany), so the number
+    of bound variables does not grow with ``results`` past SQLite's limit.
+    """
+    if not results:
+        return
+    now = datetime.now(tz=UTC)
+    stmt = sqlite_insert(ScoreCacheEntry).on_conflict_do_nothing(
+        index_elements=["scorer_version", "profile_fingerprint", "job_fingerprint"]
+    )
+    session.execute(
+        stmt,
+        [
+            {
+                "scorer_version": key.scorer_version,
+                "profile_fingerprint": key.profile_fingerprint,
+                "job_fingerprint": job_fingerprint,
+                "score": res.score,
+                "skills_matched": res.skills_matched,
+                "skills_missing": res.skills_missing,
+                "reasons": res.reasons,
+                "created_at": now,
+                "last_used_at": now,
+            }
+            for job_fingerprint, res in results.items()
+        ],
+    )
+
+
+def touch_scores(session: Session, key: ScoreCacheKey, job_fingerprints: Iterable[str]) -> None:
+    """Mark cache hits as used so retention keeps them."""
+    job_fingerprints = list(job_fingerprints)
+    if job_fingerprints:
+        session.execute(
+            update(ScoreCacheEntry)
+            .where(*key._where(job_fingerprints))
+            .values(last_used_at=datetime.now(tz=UTC))
+        )
+
+
+def prune_score_cache(session: Session, *, older_than: datetime) -> int:
+    """Evict entries not used since ``older_than`` (or from a retired scorer version)."""
+    result = session.execute(
+        delete(ScoreCacheEntry).where(
+            (ScoreCacheEntry.last_used_at < older_than)
+            | ScoreCacheEntry.scorer_version.not_in(SCORER_VERSIONS)
+        )
+    )
+    deleted = result.rowcount or 0
+    if deleted:
+        logger.info("score_cache_pruned", extra={"deleted": deleted})
+    return deleted
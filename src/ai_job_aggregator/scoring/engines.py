@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, Protocol
+
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+from ai_job_aggregator.schemas.scoring import ScoreResult
+from ai_job_aggregator.scoring.heuristic import SCORER_VERSION, PostingsMatcher, SkillMatcher
+from ai_job_aggregator.scoring.tokens import TOKENS_SCORER_VERSION, TokenMatcher
+from ai_job_aggregator.settings import Settings
+
+# Bump whenever the FTS tokenization or document columns change.
+FTS_SCORER_VERSION = "fts5-1"
+# Bump whenever the skill index's matching rules change.
+INDEX_SCORER_VERSION = "skill-index-1"
+
+# Bump with the tfidf module's format (kept here so numpy stays optional).
+TFIDF_SCORER_VERSION = "tfidf-1"
+
+SCORERS = ("heuristic", "tokens", "fts", "index", "tfidf")
+# versions whose cached scores are still live
+SCORER_VERSIONS = (
+    SCORER_VERSION,
+    TOKENS_SCORER_VERSION,
+    FTS_SCORER_VERSION,
+    INDEX_SCORER_VERSION,
+    TFIDF_SCORER_VERSION,
+)
+
+
+class RowMatcher(Protocol):
+    """What scoring needs from a scorer backend."""
+
+    # cache namespace; differs per backend and scoring formula
+    version: str
+    # whether a result depends only on the job's content and the profile's skills
+    cacheable: bool
+    # normalized, de-duplicated profile skills
+    skills: list[str]
+    # job_postings columns score_row reads besides ``id`` and ``content_hash``
+    columns: tuple[str, ...]
+
+    def score_row(self, row: Any) -> ScoreResult: ...
+
+
+def build_matcher(
+    name: str,
+    *,
+    session: Session,
+    profile_skills: Iterable[str],
+    job_ids: Select | None = None,
+    settings: Settings | None = None,
+    sync_index: bool = True,
+) -> RowMatcher:
+    """Prepare scorer backend ``name`` for one profile.
+
+    - ``heuristic``: substring scan of each job's ``search_text``
+    - ``tokens``: whole-token match against each job's n-grams (no partial words)
+    - ``fts``: one FTS5 query per skill over the postings selected by ``job_ids``;
+      jobs are then scored by set membership
+    - ``index``: the persistent skill -> job postings index (same matches as
+      ``heuristic``); scoring reads only the profile's postings lists
+    - ``tfidf``: cosine similarity of hashed TF-IDF vectors, all jobs at once with a
+      sparse matrix-vector product (needs the ``tfidf`` extra, i.e. numpy); its
+      on-disk index is synced with the database first unless ``sync_index`` is False
+      (shards of a run load the index ``prepare_scorer`` synced when it was planned,
+      and vectorize only their selected postings changed since)
+    """
+    if name == "heuristic":
+        return SkillMatcher(profile_skills)
+    if name == "tokens":
+        return TokenMatcher(profile_skills)
+    if name == "fts":
+        from ai_job_aggregator.fts import match_terms
+
+        skills = SkillMatcher(profile_skills).skills
+        return PostingsMatcher(
+            skills,
+            match_terms(session, skills, job_ids=job_ids),
+            version=FTS_SCORER_VERSION,
+        )
+    if name == "index":
+        from ai_job_aggregator.skill_index import ensure_terms, term_postings
+
+        skills = SkillMatcher(profile_skills).skills
+        vocab = ensure_terms(session, skills)
+        return PostingsMatcher(
+            skills,
+            term_postings(session, vocab, job_ids=job_ids),
+            version=INDEX_SCORER_VERSION,
+        )
+    if name == "tfidf":
+        tfidf = _tfidf()
+        path = (settings or Settings()).resolved_tfidf_index_path()
+        if sync_index:
+            return tfidf.TfidfMatcher(tfidf.synced_index(session, path), profile_skills)
+        index = tfidf.TfidfIndex.load(path)
+        return tfidf.TfidfMatcher(
+            index, profile_skills, tfidf.changed_texts(session, index, job_ids)
+        )
+    raise ValueError(f"unknown scorer: {name!r} (expected one of: {', '.join(SCORERS)})")
+
+
+def prepare_scorer(name: str, *, session: Session, settings: Settings | None = None) -> None:
+    """Work scorer backend ``name`` needs once per run rather than once per shard.
+
+    ``tfidf`` syncs its on-disk index, so the run's shards can load it as is.
+    """
+    if name == "tfidf":
+        _tfidf().synced_index(session, (settings or Settings()).resolved_tfidf_index_path())
+
+
+def _tfidf():
+    try:
+        from ai_job_aggregator.scoring import tfidf
+    except ImportError as e:
+        raise RuntimeError("the tfidf scorer needs numpy: install ai-job-aggregator[tfidf]") from e
+    return tfidf
@@ -1,21 +1,116 @@
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 
 from rq import Queue
+from rq.job import Dependency
+from sqlalchemy.orm import Session
 
 from ai_job_aggregator.rq import redis_available, redis_connection
-from ai_job_aggregator.scoring.tasks import score_run_task
+from ai_job_aggregator.scoring.tasks import (
+    finalize_scoring_run_task,
+    score_run_task,
+    score_shard_task,
+)
+from ai_job_aggregator.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Shard results must outlive the slowest shard of a run so the finalizer can read them.
+SHARD_RESULT_TTL = 24 * 60 * 60
+
+# Where queued scoring runs execute: "rq" (Redis queue + `worker` processes),
+# "inprocess" (a background thread of the enqueuing process) or "auto" (rq when Redis
+# answers, else inprocess).
+TASK_BACKENDS = ("auto", "rq", "inprocess")
+
+
+def resolve_task_backend(name: str) -> str:
+    if name not in TASK_BACKENDS:
+        raise ValueError(f"unknown task backend: {name!r} (choose from {', '.join(TASK_BACKENDS)})")
+    if name == "auto":
+        return "rq" if redis_available() else "inprocess"
+    return name
+
+
+def _db_path(session: Session | None, settings: Settings) -> Path:
+    if session is None:
+        return settings.resolved_db_path()
+    database = session.get_bind().engine.url.database
+    if not database or database == ":memory:":
+        raise ValueError("in-process scoring needs a database file, not an in-memory database")
+    return Path(database)
+
+
+def _plan(*, run_id: int, shards: int, session: Session | None) -> list[tuple[int, int]]:
+    from ai_job_aggregator.scoring.shards import plan_shards
+
+    if session is not None:
+        return plan_shards(session=session, run_id=run_id, shards=shards)
+
+    from ai_job_aggregator.db import create_engine_from_settings, create_session_factory
+
+    engine = create_engine_from_settings(Settings())
+    try:
+        with create_session_factory(engine)() as own_session:
+            return plan_shards(session=own_session, run_id=run_id, shards=shards)
+    finally:
+        engine.dispose()
+
+
+def enqueue_scoring_run(
+    *,
+    run_id: int,
+    shards: int | None = None,
+    session: Session | None = None,
+    backend: str | None = None,
+) -> bool:
+    """Hand a scoring run to a task backend (default: ``AJA_TASK_BACKEND``).
+
+    ``rq`` queues it on the ``scoring`` queue. With ``shards`` > 1 (default:
+    ``AJA_SCORING_SHARDS``) the run's jobs are split into id ranges (planned with
+    ``session``, or a session of its own), each scored by its own RQ job so any number
+    of workers share the run; a finalizer job depending on all of them (failed ones
+    included) marks the run finished or failed.
+
+    ``inprocess`` scores it on a background thread of this process, against the
+    database ``session`` is bound to (default: ``AJA_DB_PATH``); see
+    ``scoring.inprocess``. Shards do not apply there.
+
+    Returns False when the run was not handed off (``rq`` without Redis).
+    """
+    settings = Settings()
+    backend = resolve_task_backend(backend or settings.task_backend)
+    if backend == "inprocess":
+        from ai_job_aggregator.scoring.inprocess import submit_scoring_run
+
+        submit_scoring_run(run_id=run_id, db_path=_db_path(session, settings))
+        return True
 
-def enqueue_scoring_run(*, run_id: int) -> bool:
     if not redis_available():
         logger.warning("redis_unavailable_scoring_skipped", extra={"run_id": run_id})
         return False
 
+    if shards is None:
+        shards = settings.scoring_shards
+
     q = Queue("scoring", connection=redis_connection())
-    q.enqueue(score_run_task, run_id=run_id)
-    logger.info("scoring_enqueued", extra={"run_id": run_id})
+    if shards <= 1:
+        q.enqueue(score_run_task, run_id=run_id)
+        logger.info("scoring_enqueued", extra={"run_id": run_id})
+        return True
+
+    ranges = _plan(run_id=run_id, shards=shards, session=session)
+    shard_job_ids = [
+        q.enqueue(score_shard_task, run_id=run_id, shard=i, result_ttl=SHARD_RESULT_TTL).id
+        for i in range(len(ranges))
+    ]
+    q.enqueue(
+        finalize_scoring_run_task,
+        run_id=run_id,
+        shard_job_ids=shard_job_ids,
+        depends_on=Dependency(jobs=shard_job_ids, allow_failure=True) if shard_job_ids else None,
+    )
+    logger.info("scoring_enqueued", extra={"run_id": run_id, "shards": len(shard_job_ids)})
     return True
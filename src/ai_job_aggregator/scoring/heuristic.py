@@ -1,8 +1,21 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Mapping, Set
+from typing import Any
 
 from ai_job_aggregator.schemas.scoring import ScoreResult
+from ai_job_aggregator.search_text import build_search_text
+
+# Bump whenever scoring output changes; cached scores from other versions are ignored.
+SCORER_VERSION = "heuristic-1"
+
+# job_postings columns read by matchers that scan each job's text (besides ``id`` and
+# ``content_hash``, which scoring always selects)
+TEXT_COLUMNS = ("title", "company", "search_text")
+
+SENIOR_TITLE_KEYWORDS = ("senior", "lead", "staff", "principal")
+JUNIOR_TITLE_KEYWORDS = ("junior", "intern")
 
 
 def _norm_skill(s: str) -> str:
@@ -15,6 +28,174 @@ def _haystack(*parts: str | None) -> str:
     return "\n".join([p for p in parts if p]).lower()
 
 
+def title_bonus(job_title: str | None) -> float:
+    """Score adjustment for seniority keywords in a job title (shared by all scorers)."""
+    # Small qualitative signals; keep simple + explainable.
+    bonus = 0.0
+    if job_title:
+        t = job_title.lower()
+        if any(k in t for k in SENIOR_TITLE_KEYWORDS):
+            bonus -= 5.0
+        if any(k in t for k in JUNIOR_TITLE_KEYWORDS):
+            bonus += 2.0
+    return bonus
+
+
+def build_result(
+    *,
+    skills: list[str],
+    matched: list[str],
+    missing: list[str],
+    job_title: str | None,
+    company: str | None,
+) -> ScoreResult:
+    """The result for a job matching ``matched`` of the profile's ``skills``."""
+    ratio = (len(matched) / len(skills)) if skills else 0.0
+    base = ratio * 100.0
+    score = max(0.0, min(100.0, base + title_bonus(job_title)))
+
+    reasons = {
+        "match_ratio": ratio,
+        "counts": {"skills_total": len(skills), "matched": len(matched), "missing": len(missing)},
+        "signals": {"title": job_title, "company": company},
+    }
+
+    return ScoreResult(score=score, skills_matched=matched, skills_missing=missing, reasons=reasons)
+
+
+class SkillMatcher:
+    """Profile skills compiled once and reused for every job of a scoring run.
+
+    Produces exactly what ``score_job`` does, without re-normalizing the profile per
+    job. Skills contained in a longer matched skill ("java" in "javascript") are
+    resolved without scanning the haystack again.
+    """
+
+    version = SCORER_VERSION
+    cacheable = True
+    columns = TEXT_COLUMNS
+
+    def __init__(self, profile_skills: Iterable[str]):
+        skills = [_norm_skill(s) for s in profile_skills if s and s.strip()]
+        self.skills: list[str] = list(dict.fromkeys(skills))  # stable unique
+
+        # Scan longest first so shorter skills can be implied by an earlier match.
+        self._scan_order = sorted(self.skills, key=len, reverse=True)
+        self._contained_in = {
+            sk: [other for other in self.skills if other != sk and sk in other]
+            for sk in self.skills
+        }
+
+    def match(self, haystack: str) -> tuple[list[str], list[str]]:
+        """Split skills into (matched, missing) for a lowercased haystack."""
+        found: set[str] = set()
+        for sk in self._scan_order:
+            if any(other in found for other in self._contained_in[sk]) or sk in haystack:
+                found.add(sk)
+
+        matched = [sk for sk in self.skills if sk in found]
+        missing = [sk for sk in self.skills if sk not in found]
+        return matched, missing
+
+    def score(
+        self,
+        *,
+        job_title: str | None,
+        company: str | None,
+        url: str | None,
+        raw: dict,
+    ) -> ScoreResult:
+        search_text = build_search_text(title=job_title, company=company, url=url, raw=raw)
+        return self.score_text(job_title=job_title, company=company, search_text=search_text)
+
+    def score_text(
+        self,
+        *,
+        job_title: str | None,
+        company: str | None,
+        search_text: str,
+    ) -> ScoreResult:
+        """Score a posting from its precomputed ``job_postings.search_text``."""
+        matched, missing = self.match(search_text)
+        return build_result(
+            skills=self.skills,
+            matched=matched,
+            missing=missing,
+            job_title=job_title,
+            company=company,
+        )
+
+    def score_row(self, row: Any) -> ScoreResult:
+        """Score a ``job_rows_select`` row."""
+        return self.score_text(
+            job_title=row.title, company=row.company, search_text=row.search_text or ""
+        )
+
+
+class PostingsMatcher:
+    """Profile skills matched by job id against precomputed per-skill postings.
+
+    ``postings`` maps each normalized skill to the ids of the jobs containing it (e.g.
+    from a full-text index), so scoring a job is a set lookup per skill instead of a
+    scan of its text. Results are scored like ``SkillMatcher``'s.
+    """
+
+    # matching needs only the job id: the text is never read
+    columns = ("title", "company")
+
+    def __init__(
+        self, profile_skills: Iterable[str], postings: Mapping[str, Set[int]], *, version: str
+    ):
+        self.skills = SkillMatcher(profile_skills).skills
+        self.postings = postings
+        self.version = version
+        self.cacheable = True
+
+    def score_row(self, row: Any) -> ScoreResult:
+        matched = [sk for sk in self.skills if row.id in self.postings.get(sk, ())]
+        missing = [sk for sk in self.skills if row.id not in self.postings.get(sk, ())]
+        return build_result(
+            skills=self.skills,
+            matched=matched,
+            missing=missing,
+            job_title=row.title,
+            company=row.company,
+        )
+
+
+class MultiSkillMatcher:
+    """Several profiles' matchers (keyed e.g. by scoring run id) evaluated with one scan
+    of each job's text.
+
+    The union of all profiles' skills is matched once per job; each profile's
+    matched/missing split is then read off that shared set, so P profiles cost one
+    text scan instead of P.
+    """
+
+    def __init__(self, matchers: Mapping[int, SkillMatcher]):
+        self.matchers = dict(matchers)
+        self._union = SkillMatcher(sk for m in self.matchers.values() for sk in m.skills)
+
+    def score_text(
+        self,
+        *,
+        job_title: str | None,
+        company: str | None,
+        search_text: str,
+    ) -> dict[int, ScoreResult]:
+        found = set(self._union.match(search_text)[0])
+        results: dict[int, ScoreResult] = {}
+        for key, matcher in self.matchers.items():
+            results[key] = build_result(
+                skills=matcher.skills,
+                matched=[sk for sk in matcher.skills if sk in found],
+                missing=[sk for sk in matcher.skills if sk not in found],
+                job_title=job_title,
+                company=company,
+            )
+        return results
+
+
 def score_job(
     *,
     profile_skills: list[str],
@@ -26,6 +207,7 @@ def score_job(
     """Heuristic scorer.
 
     Uses profile skills and a text blob built from job fields + raw JSON.
+    For many jobs against one profile prefer ``SkillMatcher``.
     """
 
     skills = [_norm_skill(s) for s in profile_skills if s and s.strip()]
@@ -43,24 +225,10 @@ def score_job(
         else:
             missing.append(sk)
 
-    ratio = (len(matched) / len(skills)) if skills else 0.0
-    base = ratio * 100.0
-
-    # Small qualitative signals; keep simple + explainable.
-    bonus = 0.0
-    if job_title:
-        t = job_title.lower()
-        if any(k in t for k in ["senior", "lead", "staff", "principal"]):
-            bonus -= 5.0
-        if any(k in t for k in ["junior", "intern"]):
-            bonus += 2.0
-
-    score = max(0.0, min(100.0, base + bonus))
-
-    reasons = {
-        "match_ratio": ratio,
-        "counts": {"skills_total": len(skills), "matched": len(matched), "missing": len(missing)},
-        "signals": {"title": job_title, "company": company},
-    }
-
-    return ScoreResult(score=score, skills_matched=matched, skills_missing=missing, reasons=reasons)
+    return build_result(
+        skills=skills,
+        matched=matched,
+        missing=missing,
+        job_title=job_title,
+        company=company,
+    )
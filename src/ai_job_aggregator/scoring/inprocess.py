@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+
+from sqlalchemy.orm import sessionmaker
+
+from ai_job_aggregator.db import create_engine_from_settings, create_session_factory
+from ai_job_aggregator.models.scoring import ScoringRun, ScoringRunStatus
+from ai_job_aggregator.scoring.service import score_run
+from ai_job_aggregator.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Submitted (database file, scoring run id) pairs, scored in order by _thread.
+_pending: list[tuple[Path, int]] = []
+_lock = threading.Lock()
+_thread: threading.Thread | None = None
+
+
+def submit_scoring_run(*, run_id: int, db_path: Path) -> None:
+    """Score ``run_id`` of the database at ``db_path`` on a background thread.
+
+    Runs are scored one at a time, in submission order, by a thread started on demand
+    that exits once nothing is queued. Callers submit runs when they are done writing
+    (ingestion does after its last commit), so the thread is then the only writer. It
+    is not a daemon: the interpreter waits for queued runs before exiting.
+    """
+    global _thread
+    with _lock:
+        _pending.append((db_path, run_id))
+        if _thread is None:
+            _thread = threading.Thread(target=_drain, name="aja-inprocess-scoring")
+            _thread.start()
+    logger.info("scoring_submitted_inprocess", extra={"run_id": run_id, "db_path": str(db_path)})
+
+
+def wait_for_scoring() -> None:
+    """Block until every submitted run has been scored."""
+    while True:
+        with _lock:
+            thread = _thread
+        if thread is None:
+            return
+        thread.join()
+
+
+def _drain() -> None:
+    global _thread
+    while True:
+        with _lock:
+            if not _pending:
+                _thread = None
+                return
+            db_path, run_id = _pending.pop(0)
+        _score(run_id, db_path=db_path)
+
+
+def _score(run_id: int, *, db_path: Path) -> None:
+    # an engine per run, on the database the run was submitted for
+    settings = Settings().model_copy(update={"db_path": db_path})
+    engine = create_engine_from_settings(settings)
+    try:
+        session_factory = create_session_factory(engine)
+        logger.info("inprocess_scoring_started", extra={"run_id": run_id})
+        try:
+            with session_factory() as session:
+                score_run(session=session, run_id=run_id, settings=settings)
+            logger.info("inprocess_scoring_completed", extra={"run_id": run_id})
+        except Exception as e:  # noqa: BLE001
+            logger.error("inprocess_scoring_failed", extra={"run_id": run_id}, exc_info=True)
+            _mark_failed(run_id, e, session_factory=session_factory)
+    finally:
+        engine.dispose()
+
+
+def _mark_failed(run_id: int, error: Exception, *, session_factory: sessionmaker) -> None:
+    with session_factory() as session:
+        run = session.get(ScoringRun, run_id)
+        if run is not None:
+            run.status = ScoringRunStatus.failed
+            run.finished_at = datetime.now(tz=UTC)
+            run.meta = {
+                **(run.meta or {}),
+                "fatal": {"error_type": type(error).__name__, "message": str(error)},
+            }
+            session.commit()
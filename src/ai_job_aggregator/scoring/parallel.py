@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any
+
+from sqlalchemy import create_engine
+
+from ai_job_aggregator.db import apply_sqlite_pragmas, create_session_factory, sqlite_pragmas
+from ai_job_aggregator.models import JobPosting
+from ai_job_aggregator.scoring.cache import ScoreCacheKey
+from ai_job_aggregator.scoring.engines import RowMatcher
+from ai_job_aggregator.scoring.service import (
+    JobOutcome,
+    JobSelection,
+    job_rows_select,
+    score_chunk_cached,
+)
+from ai_job_aggregator.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Per worker process: engine/session factory, the run's matcher and job selection.
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(
+    db_url: str,
+    matcher: RowMatcher,
+    selection: JobSelection,
+    cache_key: ScoreCacheKey | None,
+) -> None:
+    # workers only read; results are written by the caller's (single) writer
+    engine = create_engine(db_url, future=True)
+    apply_sqlite_pragmas(engine, {**sqlite_pragmas(Settings()), "query_only": 1})
+    _worker_state.update(
+        session_factory=create_session_factory(engine),
+        matcher=matcher,
+        selection=selection,
+        cache_key=cache_key,
+    )
+
+
+def _score_partition(lo: int, hi: int) -> list[JobOutcome]:
+    with _worker_state["session_factory"]() as session:
+        rows = session.execute(
+            job_rows_select(_worker_state["selection"], _worker_state["matcher"].columns)
+            .where(JobPosting.id.between(lo, hi))
+            .order_by(JobPosting.id)
+        ).all()
+        return score_chunk_cached(
+            session, _worker_state["matcher"], rows, _worker_state["cache_key"]
+        )
+
+
+def score_partitions(
+    *,
+    db_url: str,
+    matcher: RowMatcher,
+    selection: JobSelection,
+    cache_key: ScoreCacheKey | None,
+    partitions: Iterable[list[int]],
+    workers: int,
+) -> Iterator[tuple[list[int], list[JobOutcome]]]:
+    """Score job-id partitions in a process pool, yielding ``(job_ids, outcomes)``.
+
+    Workers read their own id range (and score cache hits) from the database, so only
+    ids and results cross process boundaries; cache writes stay with the caller. At
+    most ``2 * workers`` partitions are in flight, which keeps memory bounded and lets
+    the caller write results while workers keep scoring. Results are yielded in
+    completion order.
+    """
+    logger.info("scoring_pool_starting", extra={"workers": workers})
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(db_url, matcher, selection, cache_key),
+    ) as pool:
+        pending: dict[Future[list[JobOutcome]], list[int]] = {}
+        for job_ids in partitions:
+            pending[pool.submit(_score_partition, job_ids[0], job_ids[-1])] = job_ids
+            if len(pending) >= 2 * workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield pending.pop(fut), fut.result()
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                yield pending.pop(fut), fut.result()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from sqlalchemy import Select, and_, literal, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from ai_job_aggregator.models import JobPosting
+from ai_job_aggregator.models.scoring import ProfileJobScore, ScoreItem, ScoringRun
+from ai_job_aggregator.profiles import find_profile
+from ai_job_aggregator.schemas.scoring import RankedResult
+
+
+def parse_cursor(cursor: str) -> tuple[float, int]:
+    """Parse a ``"<score>:<item id>"`` keyset cursor (``RankedResult.cursor``)."""
+    score, sep, item_id = cursor.rpartition(":")
+    if not sep:
+        raise ValueError(f"invalid results cursor: {cursor!r}")
+    return float(score), int(item_id)
+
+
+def record_latest_scores(session: Session, run: ScoringRun) -> None:
+    """Upsert ``run``'s scores into ``profile_job_scores`` (no commit).
+
+    Called by the writer as the run is marked finished. A job keeps the score item with
+    the highest id, so a run finishing after a newer one does not overwrite its scores.
+    """
+    stmt = sqlite_insert(ProfileJobScore).from_select(
+        ["profile_id", "job_id", "item_id", "score"],
+        select(literal(run.profile_id), ScoreItem.job_id, ScoreItem.id, ScoreItem.score).where(
+            ScoreItem.scoring_run_id == run.id, ScoreItem.score.is_not(None)
+        ),
+    )
+    session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["profile_id", "job_id"],
+            set_={"item_id": stmt.excluded.item_id, "score": stmt.excluded.score},
+            where=stmt.excluded.item_id > ProfileJobScore.item_id,
+        )
+    )
+
+
+def _display_columns() -> Select:
+    return select(
+        ScoreItem.id,
+        ScoreItem.job_id,
+        ScoreItem.score,
+        ScoreItem.skills_matched,
+        ScoreItem.skills_missing,
+        JobPosting.title,
+        JobPosting.company,
+        JobPosting.url,
+        JobPosting.published_at,
+    ).join(JobPosting, JobPosting.id == ScoreItem.job_id)
+
+
+def _ranked(stmt: Select, score, item_id, *, limit: int, after: tuple[float, int] | None) -> Select:
+    """Order ``stmt`` by ``(score DESC, item_id)`` and apply the keyset cursor."""
+    stmt = stmt.order_by(score.desc(), item_id).limit(limit)
+    if after is not None:
+        after_score, after_id = after
+        stmt = stmt.where(or_(score < after_score, and_(score == after_score, item_id > after_id)))
+    return stmt
+
+
+def _results(session: Session, stmt: Select) -> list[RankedResult]:
+    return [
+        RankedResult(
+            item_id=row.id,
+            job_id=row.job_id,
+            score=row.score,
+            skills_matched=row.skills_matched,
+            skills_missing=row.skills_missing,
+            title=row.title,
+            company=row.company,
+            url=row.url,
+            published_at=row.published_at,
+        )
+        for row in session.execute(stmt)
+    ]
+
+
+def top_results(
+    session: Session,
+    *,
+    run_id: int,
+    limit: int = 20,
+    after: tuple[float, int] | None = None,
+) -> list[RankedResult]:
+    """Best-scored jobs of a scoring run, highest score first (ties: lowest item id).
+
+    Pages with keyset pagination: pass the last row's ``(score, item_id)`` as
+    ``after`` to get the next page. Served by ``ix_score_items_run_score``, so cost
+    depends on ``limit``, not on how many items the run has.
+    """
+    stmt = _display_columns().where(
+        ScoreItem.scoring_run_id == run_id, ScoreItem.score.is_not(None)
+    )
+    return _results(session, _ranked(stmt, ScoreItem.score, ScoreItem.id, limit=limit, after=after))
+
+
+def top_results_for_profile(
+    session: Session,
+    profile_selector: str,
+    *,
+    limit: int = 20,
+    after: tuple[float, int] | None = None,
+) -> list[RankedResult]:
+    """Best-scored jobs of a profile (selector: id or label), paged like ``top_results``.
+
+    Each job is ranked by its latest score across the profile's finished runs, read
+    from ``profile_job_scores`` through ``ix_profile_job_scores_profile_score``; like
+    ``top_results``, cost depends on ``limit``, not on how many scores the profile has.
+    """
+    prof = find_profile(session, profile_selector)
+    if prof is None:
+        raise ValueError(f"candidate_profile not found: {profile_selector}")
+
+    stmt = (
+        _display_columns()
+        .join(ProfileJobScore, ProfileJobScore.item_id == ScoreItem.id)
+        .where(ProfileJobScore.profile_id == prof.id)
+    )
+    return _results(
+        session,
+        _ranked(stmt, ProfileJobScore.score, ProfileJobScore.item_id, limit=limit, after=after),
+    )
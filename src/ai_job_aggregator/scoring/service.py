@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import logging
 import traceback as tb
-from datetime import datetime
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, insert, select, update
 from sqlalchemy.orm import Session
 
-from ai_job_aggregator.models import CandidateProfile, JobPosting
+from ai_job_aggregator.models import CandidateProfile, IngestionItem, JobPosting
 from ai_job_aggregator.models.scoring import (
     ScoreItem,
     ScoreItemStatus,
@@ -15,7 +17,18 @@ from ai_job_aggregator.models.scoring import (
     ScoringRun,
     ScoringRunStatus,
 )
-from ai_job_aggregator.scoring.heuristic import score_job
+from ai_job_aggregator.schemas.scoring import ScoreResult
+from ai_job_aggregator.scoring.cache import (
+    ScoreCacheKey,
+    lookup_scores,
+    prune_score_cache,
+    store_scores,
+    touch_scores,
+)
+from ai_job_aggregator.scoring.engines import RowMatcher, build_matcher
+from ai_job_aggregator.scoring.heuristic import TEXT_COLUMNS, MultiSkillMatcher, SkillMatcher
+from ai_job_aggregator.scoring.results import record_latest_scores
+from ai_job_aggregator.settings import Settings
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +44,7 @@ def create_scoring_run(
         profile_id=profile_id,
         ingestion_run_id=ingestion_run_id,
         status=ScoringRunStatus.started,
-        started_at=datetime.utcnow(),
+        started_at=datetime.now(tz=UTC),
         finished_at=None,
         meta=meta or {},
     )
@@ -40,7 +53,318 @@ def create_scoring_run(
     return run
 
 
-def score_run(*, session: Session, run_id: int) -> None:
+@dataclass(frozen=True)
+class JobSelection:
+    """Which job postings a scoring run covers (no filters = every posting).
+
+    ``id_range`` further restricts it to job ids in ``[lo, hi]`` (one shard of a run).
+    """
+
+    ingestion_run_id: int | None = None
+    changed_since: datetime | None = None
+    id_range: tuple[int, int] | None = None
+
+    @property
+    def mode(self) -> str:
+        if self.ingestion_run_id is not None:
+            return "ingestion_run"
+        if self.changed_since is not None:
+            return "changed_since"
+        return "full"
+
+    def apply(self, stmt: Select) -> Select:
+        if self.ingestion_run_id is not None:
+            stmt = stmt.where(
+                JobPosting.id.in_(
+                    select(IngestionItem.job_id).where(
+                        IngestionItem.run_id == self.ingestion_run_id,
+                        IngestionItem.job_id.is_not(None),
+                    )
+                )
+            )
+        if self.changed_since is not None:
+            stmt = stmt.where(JobPosting.content_updated_at > self.changed_since)
+        if self.id_range is not None:
+            stmt = stmt.where(JobPosting.id.between(*self.id_range))
+        return stmt
+
+    def to_meta(self) -> dict:
+        meta = {
+            "mode": self.mode,
+            "ingestion_run_id": self.ingestion_run_id,
+            "changed_since": self.changed_since.isoformat() if self.changed_since else None,
+        }
+        if self.id_range is not None:
+            meta["id_range"] = list(self.id_range)
+        return meta
+
+    @classmethod
+    def from_meta(cls, meta: dict) -> JobSelection:
+        changed_since = meta.get("changed_since")
+        id_range = meta.get("id_range")
+        return cls(
+            ingestion_run_id=meta.get("ingestion_run_id"),
+            changed_since=datetime.fromisoformat(changed_since) if changed_since else None,
+            id_range=(id_range[0], id_range[1]) if id_range else None,
+        )
+
+
+def select_jobs_for_run(
+    *, session: Session, run: ScoringRun, full_rescore: bool = False
+) -> JobSelection:
+    """Pick the postings an incremental scoring run needs to look at.
+
+    - ``full_rescore``: every posting (use after the scorer or profile changed)
+    - run bound to an ingestion run: postings linked to that run's items
+    - otherwise: postings new/changed since the start of the profile's last finished
+      run that covered the whole table (a full or ``changed_since`` one -- a run bound
+      to an ingestion run only saw that run's postings), falling back to every posting
+      when there is none
+    """
+    if full_rescore:
+        return JobSelection()
+    if run.ingestion_run_id is not None:
+        return JobSelection(ingestion_run_id=run.ingestion_run_id)
+
+    last_started_at = session.execute(
+        select(ScoringRun.started_at)
+        .where(
+            ScoringRun.profile_id == run.profile_id,
+            ScoringRun.status == ScoringRunStatus.finished,
+            ScoringRun.id != run.id,
+            ScoringRun.meta[("selection", "mode")].as_string().in_(("full", "changed_since")),
+        )
+        .order_by(ScoringRun.started_at.desc())
+        .limit(1)
+    ).scalar_one_or_none()
+    if last_started_at is None:
+        return JobSelection()
+    return JobSelection(changed_since=last_started_at)
+
+
+def job_rows_select(selection: JobSelection, columns: Sequence[str]) -> Select:
+    """Selected postings: ``id``, ``content_hash`` and the matcher's ``columns``.
+
+    Only what the scorer reads is loaded -- never ``raw``, and no text at all for
+    the postings-based backends.
+    """
+    return selection.apply(
+        select(
+            JobPosting.id,
+            JobPosting.content_hash,
+            *(getattr(JobPosting, column) for column in columns),
+        )
+    )
+
+
+def iter_job_chunks(
+    *, session: Session, selection: JobSelection, columns: Sequence[str], chunk_size: int
+) -> Iterator[Sequence[Row]]:
+    """Yield the selected postings in id order, ``chunk_size`` rows at a time.
+
+    Each chunk is its own keyset query (``id > last id``), so the caller may commit
+    between chunks and at most one chunk is held in memory.
+    """
+    last_id = 0
+    while True:
+        chunk = session.execute(
+            job_rows_select(selection, columns)
+            .where(JobPosting.id > last_id)
+            .order_by(JobPosting.id)
+            .limit(chunk_size)
+        ).all()
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1].id
+
+
+@dataclass(frozen=True)
+class JobOutcome:
+    """Result of scoring one job; exactly one of ``result``/``error`` is set."""
+
+    job_id: int
+    result: ScoreResult | None = None
+    error: dict | None = None
+    # job content hash (score cache key) and whether the result came from the cache
+    job_hash: str | None = None
+    cached: bool = False
+
+
+def iter_id_partitions(
+    *, session: Session, selection: JobSelection, chunk_size: int
+) -> Iterator[list[int]]:
+    """Yield the selected job ids in ascending runs of at most ``chunk_size``.
+
+    Each partition covers the id range ``[ids[0], ids[-1]]`` of the selection.
+    """
+    last_id = 0
+    while True:
+        job_ids = list(
+            session.execute(
+                selection.apply(select(JobPosting.id))
+                .where(JobPosting.id > last_id)
+                .order_by(JobPosting.id)
+                .limit(chunk_size)
+            ).scalars()
+        )
+        if not job_ids:
+            return
+        yield job_ids
+        last_id = job_ids[-1]
+
+
+def score_chunk(matcher: RowMatcher, chunk: Sequence[Row]) -> list[JobOutcome]:
+    outcomes: list[JobOutcome] = []
+    for job in chunk:
+        try:
+            res = matcher.score_row(job)
+            outcomes.append(JobOutcome(job_id=job.id, result=res, job_hash=job.content_hash))
+        except Exception as e:  # noqa: BLE001
+            outcomes.append(
+                JobOutcome(
+                    job_id=job.id,
+                    job_hash=job.content_hash,
+                    error={
+                        "error_type": type(e).__name__,
+                        "message": str(e),
+                        "traceback": "".join(tb.format_exc()),
+                    },
+                )
+            )
+    return outcomes
+
+
+def score_chunk_cached(
+    session: Session,
+    matcher: RowMatcher,
+    chunk: Sequence[Row],
+    cache_key: ScoreCacheKey | None,
+) -> list[JobOutcome]:
+    """``score_chunk`` that first serves unchanged jobs from the score cache.
+
+    Jobs without a content hash are always scored.
+    """
+    if cache_key is None:
+        return score_chunk(matcher, chunk)
+
+    hits = lookup_scores(
+        session, cache_key, {job.content_hash for job in chunk if job.content_hash}
+    )
+    scored = {
+        o.job_id: o
+        for o in score_chunk(matcher, [job for job in chunk if job.content_hash not in hits])
+    }
+    return [
+        JobOutcome(
+            job_id=job.id, result=hits[job.content_hash], job_hash=job.content_hash, cached=True
+        )
+        if job.content_hash in hits
+        else scored[job.id]
+        for job in chunk
+    ]
+
+
+def _update_cache(
+    session: Session, cache_key: ScoreCacheKey | None, outcomes: list[JobOutcome]
+) -> None:
+    if cache_key is None:
+        return
+    store_scores(
+        session,
+        cache_key,
+        {o.job_hash: o.result for o in outcomes if o.result and o.job_hash and not o.cached},
+    )
+    touch_scores(session, cache_key, {o.job_hash for o in outcomes if o.cached and o.job_hash})
+
+
+def _insert_started_items(session: Session, *, run_id: int, job_ids: list[int]) -> dict[int, int]:
+    """Bulk insert ``started`` items; returns job id -> item id."""
+    rows = session.execute(
+        insert(ScoreItem).returning(ScoreItem.job_id, ScoreItem.id),
+        [
+            {
+                "scoring_run_id": run_id,
+                "job_id": job_id,
+                "status": ScoreItemStatus.started,
+                "score": None,
+                "skills_matched": [],
+                "skills_missing": [],
+                "reasons": {},
+                "error_id": None,
+            }
+            for job_id in job_ids
+        ],
+    )
+    return {job_id: item_id for job_id, item_id in rows}
+
+
+def _write_outcomes(
+    session: Session,
+    *,
+    run_id: int,
+    outcomes: list[JobOutcome],
+    started_ids: dict[int, int] | None = None,
+) -> None:
+    """Persist a chunk of outcomes with bulk statements (no commit).
+
+    Items are inserted in one statement (or, when traced, their ``started`` rows are
+    updated by primary key); errors are inserted in a second statement and linked to
+    their items afterwards.
+    """
+    rows = []
+    for o in outcomes:
+        row = {
+            "scoring_run_id": run_id,
+            "job_id": o.job_id,
+            "status": ScoreItemStatus.finished if o.result else ScoreItemStatus.failed,
+            "score": float(o.result.score) if o.result else None,
+            "skills_matched": o.result.skills_matched if o.result else [],
+            "skills_missing": o.result.skills_missing if o.result else [],
+            "reasons": o.result.reasons if o.result else {},
+            "error_id": None,
+        }
+        if started_ids is not None:
+            row["id"] = started_ids[o.job_id]
+        rows.append(row)
+
+    if started_ids is not None:
+        session.execute(update(ScoreItem), rows)
+        item_ids = started_ids
+    else:
+        ok_rows = [r for r in rows if r["status"] == ScoreItemStatus.finished]
+        failed_rows = [r for r in rows if r["status"] == ScoreItemStatus.failed]
+        if ok_rows:
+            session.execute(insert(ScoreItem), ok_rows)
+        item_ids = {}
+        if failed_rows:
+            item_ids = {
+                job_id: item_id
+                for job_id, item_id in session.execute(
+                    insert(ScoreItem).returning(ScoreItem.job_id, ScoreItem.id), failed_rows
+                )
+            }
+
+    errors = [o for o in outcomes if o.error is not None]
+    if errors:
+        links = session.execute(
+            insert(ScoringError).returning(ScoringError.item_id, ScoringError.id),
+            [
+                {
+                    "item_id": item_ids[o.job_id],
+                    **o.error,
+                    "data": {"job_id": o.job_id, "run_id": run_id},
+                }
+                for o in errors
+            ],
+        )
+        session.execute(
+            update(ScoreItem),
+            [{"id": item_id, "error_id": error_id} for item_id, error_id in links],
+        )
+
+
+def _load_run(session: Session, run_id: int) -> tuple[ScoringRun, CandidateProfile]:
     run = session.get(ScoringRun, run_id)
     if not run:
         raise ValueError(f"scoring_run not found: {run_id}")
@@ -48,54 +372,362 @@ def score_run(*, session: Session, run_id: int) -> None:
     profile = session.get(CandidateProfile, run.profile_id)
     if not profile:
         raise ValueError(f"candidate_profile not found: {run.profile_id}")
+    return run, profile
 
-    jobs = session.execute(select(JobPosting)).scalars().all()
-
-    for job in jobs:
-        item = ScoreItem(
-            scoring_run_id=run.id,
-            job_id=job.id,
-            status=ScoreItemStatus.started,
-            score=None,
-            skills_matched=[],
-            skills_missing=[],
-            reasons={},
-            error_id=None,
-        )
-        session.add(item)
-        session.flush()
 
-        try:
-            res = score_job(
-                profile_skills=profile.skills,
-                job_title=job.title,
-                company=job.company,
-                url=job.url,
-                raw=job.raw,
-            )
-            item.status = ScoreItemStatus.finished
-            item.score = float(res.score)
-            item.skills_matched = res.skills_matched
-            item.skills_missing = res.skills_missing
-            item.reasons = res.reasons
-        except Exception as e:  # noqa: BLE001
-            err = ScoringError(
-                item_id=item.id,
-                error_type=type(e).__name__,
-                message=str(e),
-                traceback="".join(tb.format_exc()),
-                data={"job_id": job.id, "run_id": run.id},
-            )
-            session.add(err)
-            session.flush()
+def _finish_run(
+    session: Session,
+    run: ScoringRun,
+    *,
+    selection: JobSelection,
+    scorer: str,
+    workers: int,
+    total: int,
+    failed: int,
+    cache_hits: int,
+    cache_enabled: bool,
+) -> None:
+    run.status = ScoringRunStatus.finished
+    run.finished_at = datetime.now(tz=UTC)
+    run.meta = {
+        **(run.meta or {}),
+        "selection": selection.to_meta(),
+        "scorer": scorer,
+        "workers": workers,
+        "jobs": total,
+        "failed": failed,
+        "cache": {
+            "enabled": cache_enabled,
+            "hits": cache_hits,
+            "misses": total - cache_hits,
+        },
+    }
+    record_latest_scores(session, run)
+    session.commit()
+
+    logger.info(
+        "scoring_finished",
+        extra={
+            "run_id": run.id,
+            "profile_id": run.profile_id,
+            "selection": selection.mode,
+            "jobs": total,
+            "failed": failed,
+            "cache_hits": cache_hits,
+        },
+    )
+
+
+def _prune_cache(session: Session, settings: Settings) -> None:
+    prune_score_cache(
+        session,
+        older_than=datetime.now(tz=UTC) - timedelta(days=settings.score_cache_retention_days),
+    )
+
+
+def score_run(
+    *,
+    session: Session,
+    run_id: int,
+    full_rescore: bool | None = None,
+    chunk_size: int | None = None,
+    trace_items: bool | None = None,
+    workers: int | None = None,
+    scorer: str | None = None,
+    settings: Settings | None = None,
+) -> None:
+    """Score the postings selected for a scoring run.
+
+    ``full_rescore`` defaults to the run's ``meta["full_rescore"]`` flag (False when
+    unset), i.e. scoring is incremental unless asked otherwise. Jobs are streamed in
+    chunks of ``chunk_size`` (default: ``AJA_SCORING_BATCH_SIZE``) so memory stays flat
+    regardless of table size; each chunk's results are bulk inserted and committed once.
+
+    ``trace_items`` (default: ``AJA_SCORING_TRACE_ITEMS``) first commits a ``started``
+    ScoreItem per job of the chunk, so a crash mid-chunk leaves evidence of which jobs
+    were being scored.
+
+    ``workers`` > 1 (default: ``AJA_SCORING_WORKERS``) scores id-range partitions in a
+    process pool; this process stays the only writer.
+
+    ``scorer`` picks the backend (see ``build_matcher``); it defaults to the run's
+    ``meta["scorer"]``, then ``AJA_SCORER``.
+
+    ``settings`` defaults to a fresh ``Settings()``; long-lived callers (the RQ
+    worker) pass the one they hold.
+    """
+    run, profile = _load_run(session, run_id)
+
+    if full_rescore is None:
+        full_rescore = bool((run.meta or {}).get("full_rescore", False))
+    selection = select_jobs_for_run(session=session, run=run, full_rescore=full_rescore)
+
+    if settings is None:
+        settings = Settings()
+    if workers is None:
+        workers = settings.scoring_workers
+    if scorer is None:
+        scorer = (run.meta or {}).get("scorer") or settings.scorer
+    matcher, cache_key = _prepare_matcher(
+        session, profile=profile, selection=selection, scorer=scorer, settings=settings
+    )
+
+    total, failed, cache_hits = score_selection(
+        session,
+        run=run,
+        selection=selection,
+        matcher=matcher,
+        cache_key=cache_key,
+        chunk_size=chunk_size,
+        trace_items=trace_items,
+        workers=workers,
+        settings=settings,
+    )
+
+    if cache_key is not None:
+        _prune_cache(session, settings)  # committed with the run below
+    _finish_run(
+        session,
+        run,
+        selection=selection,
+        scorer=scorer,
+        workers=workers,
+        total=total,
+        failed=failed,
+        cache_hits=cache_hits,
+        cache_enabled=cache_key is not None,
+    )
+
+
+def _prepare_matcher(
+    session: Session,
+    *,
+    profile: CandidateProfile,
+    selection: JobSelection,
+    scorer: str,
+    settings: Settings,
+    sync_index: bool = True,
+) -> tuple[RowMatcher, ScoreCacheKey | None]:
+    matcher = build_matcher(
+        scorer,
+        session=session,
+        profile_skills=profile.skills,
+        job_ids=selection.apply(select(JobPosting.id)),
+        settings=settings,
+        sync_index=sync_index,
+    )
+    cache_key = (
+        ScoreCacheKey.for_matcher(matcher)
+        if settings.score_cache_enabled and matcher.cacheable
+        else None
+    )
+    return matcher, cache_key
+
 
-            item.status = ScoreItemStatus.failed
-            item.error_id = err.id
+def score_selection(
+    session: Session,
+    *,
+    run: ScoringRun,
+    selection: JobSelection,
+    matcher: RowMatcher,
+    cache_key: ScoreCacheKey | None,
+    chunk_size: int | None = None,
+    trace_items: bool | None = None,
+    workers: int = 1,
+    settings: Settings | None = None,
+) -> tuple[int, int, int]:
+    """Score ``selection`` into ``run`` chunk by chunk, committing after each chunk.
 
+    Leaves the run's status alone; returns (jobs, failed, cache hits).
+    """
+    if settings is None:
+        settings = Settings()
+    chunk_size = max(1, chunk_size if chunk_size is not None else settings.scoring_batch_size)
+    if trace_items is None:
+        trace_items = settings.scoring_trace_items
+    total = 0
+    failed = 0
+    cache_hits = 0
+
+    def _started(job_ids: list[int]) -> dict[int, int] | None:
+        if not trace_items:
+            return None
+        started_ids = _insert_started_items(session, run_id=run.id, job_ids=job_ids)
         session.commit()
+        return started_ids
 
-    run.status = ScoringRunStatus.finished
-    run.finished_at = datetime.utcnow()
-    session.commit()
+    def _sequential() -> Iterator[tuple[dict[int, int] | None, list[JobOutcome]]]:
+        for chunk in iter_job_chunks(
+            session=session, selection=selection, columns=matcher.columns, chunk_size=chunk_size
+        ):
+            started_ids = _started([job.id for job in chunk])
+            yield started_ids, score_chunk_cached(session, matcher, chunk, cache_key)
+
+    def _parallel() -> Iterator[tuple[dict[int, int] | None, list[JobOutcome]]]:
+        from ai_job_aggregator.scoring.parallel import score_partitions
+
+        started_by_partition: dict[int, dict[int, int] | None] = {}
+
+        def _partitions() -> Iterator[list[int]]:
+            for job_ids in iter_id_partitions(
+                session=session, selection=selection, chunk_size=chunk_size
+            ):
+                started_by_partition[job_ids[0]] = _started(job_ids)
+                yield job_ids
+
+        for job_ids, outcomes in score_partitions(
+            db_url=session.get_bind().url.render_as_string(hide_password=False),
+            matcher=matcher,
+            selection=selection,
+            cache_key=cache_key,
+            partitions=_partitions(),
+            workers=workers,
+        ):
+            # Postings that started matching the selection after the partition was
+            # planned are left for the next incremental run.
+            planned = set(job_ids)
+            outcomes = [o for o in outcomes if o.job_id in planned]
+            yield started_by_partition.pop(job_ids[0]), outcomes
+
+    # Single writer: whichever way chunks are scored, results are persisted here.
+    for started_ids, outcomes in _parallel() if workers > 1 else _sequential():
+        _write_outcomes(session, run_id=run.id, outcomes=outcomes, started_ids=started_ids)
+        _update_cache(session, cache_key, outcomes)
+        session.commit()
 
-    logger.info("scoring_finished", extra={"run_id": run.id, "profile_id": run.profile_id})
+        total += len(outcomes)
+        failed += sum(1 for o in outcomes if o.error is not None)
+        cache_hits += sum(1 for o in outcomes if o.cached)
+
+    return total, failed, cache_hits
+
+
+def score_runs(
+    *,
+    session: Session,
+    run_ids: list[int],
+    full_rescore: bool | None = None,
+    chunk_size: int | None = None,
+    scorer: str | None = None,
+    workers: int | None = None,
+) -> None:
+    """Score several scoring runs (typically one per profile) in a single pass.
+
+    ``full_rescore``, ``scorer`` and ``workers`` default per run as in ``score_run``
+    (the run's meta, then settings). Runs sharing a job selection -- all of them for a
+    full rescore -- are scored together: each posting is read and scanned once and
+    scored against every profile, writing one set of ScoreItems per run. The shared
+    pass is implemented for the ``heuristic`` scorer in a single process; runs with any
+    other scorer, or all runs when ``workers`` > 1, are scored one after the other.
+    """
+    settings = Settings()
+    if workers is None:
+        workers = settings.scoring_workers
+    chunk_size = max(1, chunk_size if chunk_size is not None else settings.scoring_batch_size)
+
+    shared: list[tuple[ScoringRun, CandidateProfile, bool]] = []
+    for run_id in run_ids:
+        run, profile = _load_run(session, run_id)
+        meta = run.meta or {}
+        run_scorer = scorer or meta.get("scorer") or settings.scorer
+        run_full = (
+            full_rescore if full_rescore is not None else bool(meta.get("full_rescore", False))
+        )
+        if run_scorer == "heuristic" and workers <= 1:
+            shared.append((run, profile, run_full))
+        else:
+            score_run(
+                session=session,
+                run_id=run_id,
+                full_rescore=run_full,
+                chunk_size=chunk_size,
+                workers=workers,
+                scorer=run_scorer,
+                settings=settings,
+            )
+
+    groups: dict[JobSelection, list[tuple[ScoringRun, CandidateProfile]]] = {}
+    for run, profile, run_full in shared:
+        selection = select_jobs_for_run(session=session, run=run, full_rescore=run_full)
+        groups.setdefault(selection, []).append((run, profile))
+
+    for selection, members in groups.items():
+        runs = {run.id: run for run, _ in members}
+        matchers = {run.id: SkillMatcher(profile.skills) for run, profile in members}
+        multi = MultiSkillMatcher(matchers)
+        cache_keys = {
+            run_id: ScoreCacheKey.for_matcher(matcher) if settings.score_cache_enabled else None
+            for run_id, matcher in matchers.items()
+        }
+        totals = dict.fromkeys(runs, 0)
+        failures = dict.fromkeys(runs, 0)
+        hits_total = dict.fromkeys(runs, 0)
+
+        for chunk in iter_job_chunks(
+            session=session, selection=selection, columns=TEXT_COLUMNS, chunk_size=chunk_size
+        ):
+            hashes = {job.content_hash for job in chunk if job.content_hash}
+            hits = {
+                run_id: lookup_scores(session, key, hashes) if key else {}
+                for run_id, key in cache_keys.items()
+            }
+            per_run: dict[int, list[JobOutcome]] = {run_id: [] for run_id in runs}
+            for job in chunk:
+                cached = {
+                    run_id: hits[run_id][job.content_hash]
+                    for run_id in runs
+                    if job.content_hash in hits[run_id]
+                }
+                try:
+                    # scan the job only when some profile missed the cache
+                    results = (
+                        {}
+                        if len(cached) == len(runs)
+                        else multi.score_text(
+                            job_title=job.title,
+                            company=job.company,
+                            search_text=job.search_text or "",
+                        )
+                    )
+                    for run_id in runs:
+                        per_run[run_id].append(
+                            JobOutcome(
+                                job_id=job.id,
+                                result=cached.get(run_id) or results[run_id],
+                                job_hash=job.content_hash,
+                                cached=run_id in cached,
+                            )
+                        )
+                except Exception as e:  # noqa: BLE001
+                    error = {
+                        "error_type": type(e).__name__,
+                        "message": str(e),
+                        "traceback": "".join(tb.format_exc()),
+                    }
+                    for run_id in runs:
+                        per_run[run_id].append(
+                            JobOutcome(job_id=job.id, error=error, job_hash=job.content_hash)
+                        )
+
+            for run_id, outcomes in per_run.items():
+                _write_outcomes(session, run_id=run_id, outcomes=outcomes)
+                _update_cache(session, cache_keys[run_id], outcomes)
+                totals[run_id] += len(outcomes)
+                failures[run_id] += sum(1 for o in outcomes if o.error is not None)
+                hits_total[run_id] += sum(1 for o in outcomes if o.cached)
+            session.commit()
+
+        if settings.score_cache_enabled:
+            _prune_cache(session, settings)  # committed with the runs below
+        for run_id, run in runs.items():
+            _finish_run(
+                session,
+                run,
+                selection=selection,
+                scorer="heuristic",
+                workers=1,
+                total=totals[run_id],
+                failed=failures[run_id],
+                cache_hits=hits_total[run_id],
+                cache_enabled=cache_keys[run_id] is not None,
+            )
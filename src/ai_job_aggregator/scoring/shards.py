@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import math
+from datetime import UTC, datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ai_job_aggregator.models import JobPosting
+from ai_job_aggregator.models.scoring import ScoringRunStatus
+from ai_job_aggregator.scoring.engines import prepare_scorer
+from ai_job_aggregator.scoring.service import (
+    JobSelection,
+    _finish_run,
+    _load_run,
+    _prepare_matcher,
+    _prune_cache,
+    iter_id_partitions,
+    score_selection,
+    select_jobs_for_run,
+)
+from ai_job_aggregator.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+def plan_shards(*, session: Session, run_id: int, shards: int) -> list[tuple[int, int]]:
+    """Split a scoring run's job selection into at most ``shards`` job-id ranges.
+
+    The plan -- selection, scorer and ranges -- is stored in ``meta["plan"]`` and
+    committed, so every shard scores exactly the jobs selected here, whenever it runs.
+    Ranges hold roughly equal numbers of selected jobs. Per-run scorer work (syncing
+    the TF-IDF index) is done here once, not by each shard.
+    """
+    run, _ = _load_run(session, run_id)
+    meta = run.meta or {}
+    selection = select_jobs_for_run(
+        session=session, run=run, full_rescore=bool(meta.get("full_rescore", False))
+    )
+    settings = Settings()
+    scorer = meta.get("scorer") or settings.scorer
+    prepare_scorer(scorer, session=session, settings=settings)
+
+    total = session.execute(
+        selection.apply(select(func.count()).select_from(JobPosting))
+    ).scalar_one()
+    size = max(1, math.ceil(total / max(1, shards)))
+    ranges = [
+        (job_ids[0], job_ids[-1])
+        for job_ids in iter_id_partitions(session=session, selection=selection, chunk_size=size)
+    ]
+
+    run.meta = {
+        **meta,
+        "scorer": scorer,
+        "plan": {
+            "selection": selection.to_meta(),
+            "scorer": scorer,
+            "shards": [list(r) for r in ranges],
+        },
+    }
+    session.commit()
+    logger.info(
+        "scoring_shards_planned", extra={"run_id": run.id, "jobs": total, "shards": len(ranges)}
+    )
+    return ranges
+
+
+def score_shard(
+    *, session: Session, run_id: int, shard: int, settings: Settings | None = None
+) -> dict:
+    """Score shard ``shard`` of a planned run; the run itself stays ``started``.
+
+    Returns the shard's stats for the finalizer.
+    """
+    run, profile = _load_run(session, run_id)
+    plan = (run.meta or {})["plan"]
+    lo, hi = plan["shards"][shard]
+    selection = dataclasses.replace(JobSelection.from_meta(plan["selection"]), id_range=(lo, hi))
+    if settings is None:
+        settings = Settings()
+
+    matcher, cache_key = _prepare_matcher(
+        session,
+        profile=profile,
+        selection=selection,
+        scorer=plan["scorer"],
+        settings=settings,
+        sync_index=False,
+    )
+    total, failed, cache_hits = score_selection(
+        session,
+        run=run,
+        selection=selection,
+        matcher=matcher,
+        cache_key=cache_key,
+        settings=settings,
+    )
+    logger.info(
+        "scoring_shard_finished",
+        extra={"run_id": run.id, "shard": shard, "jobs": total, "failed": failed},
+    )
+    return {
+        "shard": shard,
+        "id_range": [lo, hi],
+        "jobs": total,
+        "failed": failed,
+        "cache_hits": cache_hits,
+        "cache_enabled": cache_key is not None,
+    }
+
+
+def finish_sharded_run(
+    *,
+    session: Session,
+    run_id: int,
+    shard_results: list[dict | None],
+    settings: Settings | None = None,
+) -> None:
+    """Aggregate shard stats into the run and mark it finished.
+
+    ``shard_results`` holds one entry per planned shard, ``None`` for shards that
+    failed or never reported; any such shard fails the whole run.
+    """
+    run, _ = _load_run(session, run_id)
+    plan = (run.meta or {})["plan"]
+    selection = JobSelection.from_meta(plan["selection"])
+    missing = [i for i, result in enumerate(shard_results) if result is None]
+    done = [result for result in shard_results if result is not None]
+    run.meta = {**(run.meta or {}), "shards": done}
+
+    if missing:
+        run.status = ScoringRunStatus.failed
+        run.finished_at = datetime.now(tz=UTC)
+        run.meta = {**run.meta, "failed_shards": missing}
+        session.commit()
+        logger.warning("scoring_shards_failed", extra={"run_id": run.id, "failed_shards": missing})
+        return
+
+    cache_enabled = any(result["cache_enabled"] for result in done)
+    if cache_enabled:
+        _prune_cache(session, settings or Settings())  # committed with the run below
+    _finish_run(
+        session,
+        run,
+        selection=selection,
+        scorer=plan["scorer"],
+        workers=len(done),
+        total=sum(result["jobs"] for result in done),
+        failed=sum(result["failed"] for result in done),
+        cache_hits=sum(result["cache_hits"] for result in done),
+        cache_enabled=cache_enabled,
+    )
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
+import dataclasses
 import logging
+import os
+
+from rq import get_current_job
+from rq.job import Job, JobStatus
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
 
 from ai_job_aggregator.db import create_engine_from_settings, create_session_factory
 from ai_job_aggregator.scoring.service import score_run
@@ -9,12 +16,111 @@ from ai_job_aggregator.settings import Settings
 logger = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass(frozen=True)
+class WorkerState:
+    settings: Settings
+    engine: Engine
+    session_factory: sessionmaker
+
+
+_state: WorkerState | None = None
+
+
+def worker_state() -> WorkerState:
+    """Settings, engine and session factory shared by every task of this process.
+
+    Built on first use (or by ``warm_worker_state``); settings are read once, so a
+    worker picks up changed ``AJA_*`` variables on restart.
+    """
+    global _state
+    if _state is None:
+        settings = Settings()
+        engine = create_engine_from_settings(settings)
+        _state = WorkerState(
+            settings=settings, engine=engine, session_factory=create_session_factory(engine)
+        )
+    return _state
+
+
+def warm_worker_state() -> WorkerState:
+    """Build the shared state before the worker starts forking work horses.
+
+    Connects once so the dialect is initialized, and imports the scorer modules tasks
+    load lazily (numpy for ``tfidf`` when installed); every forked horse inherits all
+    of it. The pool is emptied afterwards so no connection crosses a fork.
+    """
+    state = worker_state()
+    with state.engine.connect():
+        pass
+
+    import ai_job_aggregator.scoring.shards  # noqa: F401
+
+    try:
+        import ai_job_aggregator.scoring.tfidf  # noqa: F401
+    except ImportError:
+        pass
+
+    state.engine.dispose()
+    logger.info("rq_worker_state_warmed", extra={"db": str(state.engine.url)})
+    return state
+
+
+def dispose_worker_state() -> None:
+    """Close the shared engine's connections and forget the state (worker shutdown)."""
+    global _state
+    if _state is not None:
+        _state.engine.dispose()
+        _state = None
+
+
+def _reset_pool_after_fork() -> None:
+    # A forked work horse must not reuse the parent's pooled connections; it opens its
+    # own, leaving the parent's untouched.
+    if _state is not None:
+        _state.engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_reset_pool_after_fork)
+
+
 def score_run_task(*, run_id: int) -> None:
-    settings = Settings()
-    engine = create_engine_from_settings(settings)
-    SessionFactory = create_session_factory(engine)
+    state = worker_state()
 
-    with SessionFactory() as session:
-        score_run(session=session, run_id=run_id)
+    with state.session_factory() as session:
+        score_run(session=session, run_id=run_id, settings=state.settings)
 
     logger.info("rq_score_run_completed", extra={"run_id": run_id})
+
+
+def score_shard_task(*, run_id: int, shard: int) -> dict:
+    from ai_job_aggregator.scoring.shards import score_shard
+
+    state = worker_state()
+
+    with state.session_factory() as session:
+        result = score_shard(session=session, run_id=run_id, shard=shard, settings=state.settings)
+
+    logger.info("rq_score_shard_completed", extra={"run_id": run_id, "shard": shard})
+    return result
+
+
+def finalize_scoring_run_task(*, run_id: int, shard_job_ids: list[str]) -> None:
+    """Fan-in: runs once every shard job finished or failed (see enqueue)."""
+    from ai_job_aggregator.scoring.shards import finish_sharded_run
+
+    connection = get_current_job().connection
+    shard_results: list[dict | None] = []
+    for job in Job.fetch_many(shard_job_ids, connection=connection):
+        if job is not None and job.get_status() == JobStatus.FINISHED:
+            shard_results.append(job.return_value())
+        else:
+            shard_results.append(None)
+
+    state = worker_state()
+
+    with state.session_factory() as session:
+        finish_sharded_run(
+            session=session, run_id=run_id, shard_results=shard_results, settings=state.settings
+        )
+
+    logger.info("rq_scoring_run_finalized", extra={"run_id": run_id})
@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import logging
+import os
+import tempfile
+import zlib
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from ai_job_aggregator.models import JobPosting
+from ai_job_aggregator.schemas.scoring import ScoreResult
+from ai_job_aggregator.scoring.engines import TFIDF_SCORER_VERSION
+from ai_job_aggregator.scoring.heuristic import SkillMatcher, title_bonus
+from ai_job_aggregator.scoring.tokens import tokenize
+
+logger = logging.getLogger(__name__)
+
+
+# Hashed feature space; collisions are rare at this size for job vocabularies.
+N_FEATURES = 2**20
+
+# Postings (re)vectorized per query while syncing with the database.
+SYNC_CHUNK_SIZE = 1000
+
+# Rewrite the matrix without replaced/deleted rows once they make up this share.
+COMPACT_DEAD_RATIO = 0.25
+
+
+def feature(token: str, n_features: int = N_FEATURES) -> int:
+    """Stable hashed feature of a token (``hash()`` is salted per process)."""
+    return zlib.crc32(token.encode()) % n_features
+
+
+def vectorize(
+    text: str, n_features: int = N_FEATURES, features: dict[str, int] | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Sorted feature indices and sublinear term frequencies (1 + log tf) of a text.
+
+    ``features`` memoizes token -> feature across calls (hashing dominates otherwise).
+    """
+    if features is None:
+        features = {}
+    counts = Counter(tokenize(text))
+    idx = np.fromiter(
+        (
+            features[t] if t in features else features.setdefault(t, feature(t, n_features))
+            for t in counts
+        ),
+        dtype=np.int64,
+        count=len(counts),
+    )
+    tf = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+    # distinct tokens may share a feature
+    indices, inverse = np.unique(idx, return_inverse=True)
+    merged = np.bincount(inverse, weights=tf, minlength=len(indices))
+    return indices.astype(np.int32), (1.0 + np.log(merged)).astype(np.float32)
+
+
+@dataclass
+class TfidfIndex:
+    """Hashed term-frequency matrix of every posting, in CSR layout (one row per job).
+
+    Only raw (sublinear) term frequencies and per-feature document frequencies are
+    stored; IDF weights and row norms are applied at query time, so adding or
+    replacing postings never requires refitting the rows already indexed.
+    Replaced and deleted postings leave dead rows (``job_ids == -1``) until the next
+    compaction.
+    """
+
+    n_features: int
+    indptr: np.ndarray  # int64, rows + 1
+    indices: np.ndarray  # int32, features of each row (sorted)
+    data: np.ndarray  # float32, 1 + log(tf)
+    job_ids: np.ndarray  # int64, -1 for dead rows
+    hashes: np.ndarray  # S64, content hash the row was built from
+    df: np.ndarray  # int32, live rows containing each feature
+
+    @classmethod
+    def empty(cls, n_features: int = N_FEATURES) -> TfidfIndex:
+        return cls(
+            n_features=n_features,
+            indptr=np.zeros(1, dtype=np.int64),
+            indices=np.zeros(0, dtype=np.int32),
+            data=np.zeros(0, dtype=np.float32),
+            job_ids=np.zeros(0, dtype=np.int64),
+            hashes=np.zeros(0, dtype="S64"),
+            df=np.zeros(n_features, dtype=np.int32),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> TfidfIndex:
+        """Load a saved index; a missing file or other format version gives an empty one."""
+        if not path.exists():
+            return cls.empty()
+        with np.load(path) as f:
+            if str(f["version"]) != TFIDF_SCORER_VERSION:
+                return cls.empty()
+            return cls(
+                n_features=int(f["n_features"]),
+                indptr=f["indptr"],
+                indices=f["indices"],
+                data=f["data"],
+                job_ids=f["job_ids"],
+                hashes=f["hashes"],
+                df=f["df"],
+            )
+
+    def save(self, path: Path) -> None:
+        """Write the index atomically (readers see the old or the new file).
+
+        The new file is written under a name of its own, so concurrent saves never
+        share a temporary file; the last one to finish wins.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False
+        ) as fh:
+            tmp = Path(fh.name)
+            np.savez(
+                fh,
+                version=np.array(TFIDF_SCORER_VERSION),
+                n_features=np.array(self.n_features),
+                indptr=self.indptr,
+                indices=self.indices,
+                data=self.data,
+                job_ids=self.job_ids,
+                hashes=self.hashes,
+                df=self.df,
+            )
+        try:
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    @property
+    def live_rows(self) -> int:
+        return int(np.count_nonzero(self.job_ids >= 0))
+
+    def rows_by_job(self) -> dict[int, int]:
+        live = np.flatnonzero(self.job_ids >= 0)
+        return dict(zip(self.job_ids[live].tolist(), live.tolist(), strict=True))
+
+    def append(self, docs: Iterable[tuple[int, str | None, str]]) -> int:
+        """Add rows for (job id, content hash, text); returns the number added."""
+        indptr = [self.indptr]
+        indices = [self.indices]
+        data = [self.data]
+        job_ids: list[int] = []
+        hashes: list[bytes] = []
+        features: dict[str, int] = {}
+        end = int(self.indptr[-1])
+        for job_id, content_hash, text in docs:
+            idx, tf = vectorize(text, self.n_features, features)
+            end += len(idx)
+            indptr.append(np.array([end], dtype=np.int64))
+            indices.append(idx)
+            data.append(tf)
+            job_ids.append(job_id)
+            hashes.append((content_hash or "").encode())
+        if not job_ids:
+            return 0
+        new = np.concatenate(indices[1:])
+        self.df += np.bincount(new, minlength=self.n_features).astype(np.int32)
+        self.indptr = np.concatenate(indptr)
+        self.indices = np.concatenate(indices)
+        self.data = np.concatenate(data)
+        self.job_ids = np.concatenate([self.job_ids, np.array(job_ids, dtype=np.int64)])
+        self.hashes = np.concatenate([self.hashes, np.array(hashes, dtype="S64")])
+        return len(job_ids)
+
+    def kill(self, rows: Iterable[int]) -> None:
+        """Mark rows dead and drop them from the document frequencies."""
+        for row in rows:
+            np.subtract.at(self.df, self.indices[self.indptr[row] : self.indptr[row + 1]], 1)
+            self.job_ids[row] = -1
+
+    def compact(self) -> None:
+        """Drop dead rows from the matrix."""
+        live = self.job_ids >= 0
+        lengths = np.diff(self.indptr)
+        keep = np.repeat(live, lengths)
+        self.indices = self.indices[keep]
+        self.data = self.data[keep]
+        self.indptr = np.concatenate([[0], np.cumsum(lengths[live])]).astype(np.int64)
+        self.job_ids = self.job_ids[live]
+        self.hashes = self.hashes[live]
+
+    def sync(self, session: Session) -> dict[str, int]:
+        """Bring the index up to date with ``job_postings``.
+
+        Only new postings, changed postings (different content hash) and deleted
+        postings are touched; the rest of the matrix is reused as is.
+        """
+        rows = self.rows_by_job()
+        stale: list[int] = []
+        pending: list[int] = []
+        seen: set[int] = set()
+        for job_id, content_hash in session.execute(
+            select(JobPosting.id, JobPosting.content_hash).order_by(JobPosting.id)
+        ):
+            seen.add(job_id)
+            row = rows.get(job_id)
+            if row is None:
+                pending.append(job_id)
+            elif self.hashes[row] != (content_hash or "").encode():
+                stale.append(row)
+                pending.append(job_id)
+        stale.extend(row for job_id, row in rows.items() if job_id not in seen)
+
+        self.kill(stale)
+        added = self.append(self._texts(session, pending))
+
+        total = len(self.job_ids)
+        if total and (total - self.live_rows) / total >= COMPACT_DEAD_RATIO:
+            self.compact()
+        return {"added": added, "removed": len(stale)}
+
+    @staticmethod
+    def _texts(session: Session, job_ids: list[int]) -> Iterator[tuple[int, str | None, str]]:
+        for start in range(0, len(job_ids), SYNC_CHUNK_SIZE):
+            yield from (
+                (job.id, job.content_hash, job.search_text or "")
+                for job in session.execute(
+                    select(JobPosting.id, JobPosting.content_hash, JobPosting.search_text).where(
+                        JobPosting.id.in_(job_ids[start : start + SYNC_CHUNK_SIZE])
+                    )
+                )
+            )
+
+    def idf(self) -> np.ndarray:
+        """Smoothed inverse document frequency per feature, from the live rows."""
+        n = self.live_rows
+        return (np.log((1.0 + n) / (1.0 + self.df)) + 1.0).astype(np.float32)
+
+    def cosine(self, query: np.ndarray, idf: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every row's TF-IDF vector with a dense query vector.
+
+        One pass over the stored non-zeros: the CSR matrix-vector product and the
+        row norms are both segmented sums over each row's slice.
+        """
+        n_rows = len(self.job_ids)
+        weights = self.data * idf[self.indices]
+        dots = np.zeros(n_rows)
+        norms = np.zeros(n_rows)
+        # reduceat sums each row's slice; empty rows would pick up a neighbour's value
+        nonempty = np.diff(self.indptr) > 0
+        starts = self.indptr[:-1][nonempty]
+        if len(starts):
+            dots[nonempty] = np.add.reduceat(weights * query[self.indices], starts)
+            norms[nonempty] = np.sqrt(np.add.reduceat(weights * weights, starts))
+        qnorm = float(np.linalg.norm(query))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sims = dots / (norms * qnorm)
+        return np.nan_to_num(sims, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+@contextlib.contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``<path>.lock`` (between processes too)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.with_name(path.name + ".lock").open("a") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def synced_index(session: Session, path: Path) -> TfidfIndex:
+    """Load the on-disk index, apply changes since it was saved, and save it back.
+
+    Syncs of the same file take turns, so a second one starts from the first one's
+    result instead of redoing (and racing) its work. Readers that must not sync use
+    ``TfidfIndex.load``.
+    """
+    with _locked(path):
+        index = TfidfIndex.load(path)
+        stats = index.sync(session)
+        if stats["added"] or stats["removed"]:
+            index.save(path)
+    logger.info("tfidf_index_synced", extra={"path": str(path), "rows": index.live_rows, **stats})
+    return index
+
+
+def changed_texts(
+    session: Session, index: TfidfIndex, job_ids: Select | None = None
+) -> dict[int, tuple[str | None, str]]:
+    """Content hash and text of the selected postings ``index`` has no current row for.
+
+    Reads only ids and hashes of the selection, and text just for those postings: what
+    a shard that loads the index without syncing it needs.
+    """
+    rows = index.rows_by_job()
+    stmt = select(JobPosting.id, JobPosting.content_hash)
+    if job_ids is not None:
+        stmt = stmt.where(JobPosting.id.in_(job_ids))
+    changed = [
+        job_id
+        for job_id, content_hash in session.execute(stmt)
+        if (row := rows.get(job_id)) is None or index.hashes[row] != (content_hash or "").encode()
+    ]
+    return {
+        job_id: (content_hash, text)
+        for job_id, content_hash, text in index._texts(session, changed)
+    }
+
+
+class TfidfMatcher:
+    """Ranks jobs by cosine similarity between TF-IDF vectors of the job and profile.
+
+    Skills weigh by how distinctive they are across the corpus: a skill every
+    posting mentions adds little, a rare one a lot. All rows are scored by a single
+    sparse matrix-vector product when the matcher is built; ``score_row`` only looks
+    the result up. A skill counts as matched when all of its tokens occur in the job.
+
+    Scores depend on the whole corpus (IDF), so they are never served from the score
+    cache. Job text is never read while scoring: postings missing from the index or
+    changed since it was built are vectorized up front from ``changed`` (see
+    ``changed_texts``); a posting that changes after that fails to score, and is
+    picked up by the next incremental run.
+    """
+
+    version = TFIDF_SCORER_VERSION
+    cacheable = False
+    columns = ("title", "company")
+
+    def __init__(
+        self,
+        index: TfidfIndex,
+        profile_skills: Iterable[str],
+        changed: Mapping[int, tuple[str | None, str]] | None = None,
+    ):
+        self.skills = SkillMatcher(profile_skills).skills
+        self._index = index
+        self._idf = index.idf()
+        self._skill_features = {
+            sk: {feature(tok, index.n_features) for tok in tokenize(sk)} for sk in self.skills
+        }
+
+        self._query = np.zeros(index.n_features, dtype=np.float32)
+        for features in self._skill_features.values():
+            for f in features:
+                self._query[f] += self._idf[f]
+        self._qnorm = float(np.linalg.norm(self._query))
+
+        self._rows = index.rows_by_job()
+        self._sims = index.cosine(self._query, self._idf) if self._rows else np.zeros(0)
+        self._changed = {
+            job_id: ((content_hash or "").encode(), *vectorize(text, index.n_features))
+            for job_id, (content_hash, text) in (changed or {}).items()
+        }
+
+    def _similarity(self, indices: np.ndarray, tf: np.ndarray) -> float:
+        weights = tf * self._idf[indices]
+        norm = float(np.linalg.norm(weights))
+        if not norm or not self._qnorm:
+            return 0.0
+        return float(weights @ self._query[indices]) / (norm * self._qnorm)
+
+    def score_row(self, row: Any) -> ScoreResult:
+        content_hash = (row.content_hash or "").encode()
+        r = self._rows.get(row.id)
+        changed = self._changed.get(row.id)
+        if changed is not None and changed[0] == content_hash:
+            _, indices, tf = changed
+            sim = self._similarity(indices, tf)
+            present = set(indices.tolist())
+        elif r is not None and self._index.hashes[r] == content_hash:
+            sim = float(self._sims[r])
+            present = set(
+                self._index.indices[self._index.indptr[r] : self._index.indptr[r + 1]].tolist()
+            )
+        else:
+            raise ValueError(f"job {row.id} changed after the TF-IDF index was synced")
+
+        found = {sk for sk, fs in self._skill_features.items() if fs and fs <= present}
+        matched = [sk for sk in self.skills if sk in found]
+        missing = [sk for sk in self.skills if sk not in found]
+        score = max(0.0, min(100.0, sim * 100.0 + title_bonus(row.title)))
+        return ScoreResult(
+            score=score,
+            skills_matched=matched,
+            skills_missing=missing,
+            reasons={
+                "tfidf_cosine": sim,
+                "counts": {
+                    "skills_total": len(self.skills),
+                    "matched": len(matched),
+                    "missing": len(missing),
+                },
+                "signals": {"title": row.title, "company": row.company},
+            },
+        )
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+def build_search_text(
+    *,
+    title: str | None,
+    company: str | None,
+    url: str | None,
+    raw: dict[str, Any] | None,
+) -> str:
+    """Lowercased text blob scorers match against (job fields + the raw payload).
+
+    Computed once at ingest time and stored on ``job_postings.search_text``.
+    """
+    raw_text = str(raw) if raw is not None else ""
+    return "\n".join([p for p in (title, company, url, raw_text) if p]).lower()
+
+
+def default_search_text(context: Any) -> str:
+    """Column default so postings inserted outside ingestion still get search text."""
+    params = context.get_current_parameters()
+    return build_search_text(
+        title=params.get("title"),
+        company=params.get("company"),
+        url=params.get("url"),
+        raw=params.get("raw"),
+    )
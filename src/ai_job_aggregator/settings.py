@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from urllib.parse import quote
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,18 +19,91 @@ class Settings(BaseSettings):
     # SQLite database path inside storage_dir by default
     db_path: Path | None = None
 
+    # PRAGMA preset set on every SQLite connection: "default" (SQLite's own),
+    # "balanced" (WAL, synchronous=NORMAL, 64 MiB cache, 256 MiB mmap) or "fast"
+    # (WAL, synchronous=OFF: may lose recent commits on power loss).
+    sqlite_profile: str = "balanced"
+    # Per-PRAGMA overrides of the preset (unset = the preset's value).
+    sqlite_journal_mode: str | None = None
+    sqlite_synchronous: str | None = None
+    sqlite_cache_size: int | None = None  # pages, or -KiB when negative
+    sqlite_mmap_size: int | None = None  # bytes
+    sqlite_temp_store: str | None = None
+    sqlite_busy_timeout_ms: int | None = None
+
     # RemoteOK API endpoint
     remoteok_url: str = "https://remoteok.com/api"
 
+    # Shared HTTP client of the async connectors: pooled keep-alive connections in
+    # total, concurrent requests per host, and the per-request timeout.
+    http_max_connections: int = 20
+    http_max_connections_per_host: int = 4
+    http_timeout_s: float = 30.0
+
     # Ingestion limits
     # Default max number of items to fetch per connector call.
     # Can be overridden per-run via CLI --limit, but will be clamped to hard cap.
     max_fetch_per_connector: int = 50
 
+    # Number of fetched items persisted (and committed) together during ingestion.
+    ingest_batch_size: int = 100
+
+    # Chunks buffered between ingest stages: between the fetching connectors and the
+    # single DB writer of a multi-source ingest, and between each pair of pipeline stages
+    # (a stage pauses while the buffer after it is full).
+    ingest_queue_chunks: int = 8
+
+    # Run single-source ingestion as overlapping fetch -> parse -> dedup -> persist
+    # stages (per-stage throughput lands in the run's meta["stages"]).
+    ingest_pipeline: bool = True
+
+    # Number of job postings read (and released) together while scoring.
+    scoring_batch_size: int = 500
+
+    # Commit a `started` score item per job before scoring it (crash forensics; slower).
+    scoring_trace_items: bool = False
+
+    # Scorer backend: "heuristic" (substring scan), "tokens" (whole-token match),
+    # "fts" (SQLite FTS5 index), "index" (persistent skill -> job postings index) or
+    # "tfidf" (TF-IDF cosine similarity; needs numpy).
+    scorer: str = "heuristic"
+
+    # On-disk TF-IDF matrix of the "tfidf" scorer (default: next to the database, named
+    # after it, so each database gets its own).
+    tfidf_index_path: Path | None = None
+
+    # Processes scoring partitions in parallel (1 = score in the writing process).
+    scoring_workers: int = 1
+
+    # RQ jobs a queued scoring run is split into (job-id range shards + a finalizer);
+    # 1 = one job scores the whole run.
+    scoring_shards: int = 1
+
+    # Where queued scoring runs execute: "rq" (Redis + `worker`), "inprocess" (the
+    # ingesting process, after it has finished ingesting) or "auto" (rq if Redis is
+    # reachable).
+    task_backend: str = "auto"
+
+    # RQ worker processes `worker` supervises (1 = a single worker, no supervisor).
+    worker_concurrency: int = 1
+
+    # Memoize scores per (scorer version, profile skills, job content hash).
+    score_cache_enabled: bool = True
+    # Cache entries unused for this many days are evicted after each scoring run.
+    score_cache_retention_days: int = 30
+
     def resolved_db_path(self) -> Path:
         return self.db_path or (self.storage_dir / "data" / "jobs.sqlite3")
 
+    def resolved_tfidf_index_path(self) -> Path:
+        return self.tfidf_index_path or self.resolved_db_path().with_suffix(".tfidf.npz")
+
     def sqlalchemy_database_url(self) -> str:
         p = self.resolved_db_path()
         p.parent.mkdir(parents=True, exist_ok=True)
         return f"sqlite+pysqlite:///{p}"
+
+    def sqlalchemy_read_database_url(self) -> str:
+        # SQLite URI filename opened read-only: connections cannot take the write lock.
+        p = self.resolved_db_path().resolve()
+        return f"sqlite+pysqlite:///file:{quote(str(p))}?mode=ro&uri=true"
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime
+
+from sqlalchemy import Select, delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from ai_job_aggregator.models.job import JobPosting
+from ai_job_aggregator.models.skill_index import SkillPosting, SkillTerm
+from ai_job_aggregator.scoring.heuristic import SkillMatcher
+
+logger = logging.getLogger(__name__)
+
+# Postings scanned per keyset query when backfilling new terms.
+BACKFILL_CHUNK_SIZE = 1000
+
+
+def _vocabulary(session: Session, terms: Iterable[str] | None = None) -> dict[str, int]:
+    stmt = select(SkillTerm.term, SkillTerm.id)
+    if terms is not None:
+        stmt = stmt.where(SkillTerm.term.in_(list(terms)))
+    return {term: term_id for term, term_id in session.execute(stmt)}
+
+
+def _insert_postings(session: Session, vocab: Mapping[str, int], jobs: Mapping[int, str]) -> int:
+    matcher = SkillMatcher(vocab)
+    rows = [
+        {"term_id": vocab[term], "job_id": job_id}
+        for job_id, search_text in jobs.items()
+        for term in matcher.match(search_text)[0]
+    ]
+    if rows:
+        session.execute(sqlite_insert(SkillPosting).on_conflict_do_nothing(), rows)
+    return len(rows)
+
+
+def index_jobs(session: Session, jobs: Mapping[int, str]) -> None:
+    """(Re)build the postings of new/changed jobs (job id -> ``search_text``; no commit).
+
+    Jobs are matched against every known term with the heuristic scorer's substring
+    rules, so the index agrees with scanning the text.
+    """
+    if not jobs:
+        return
+    session.execute(delete(SkillPosting).where(SkillPosting.job_id.in_(list(jobs))))
+    vocab = _vocabulary(session)
+    if vocab:
+        _insert_postings(session, vocab, jobs)
+
+
+def ensure_terms(session: Session, skills: Iterable[str]) -> dict[str, int]:
+    """Term ids for normalized ``skills``; unknown terms are added and backfilled.
+
+    Backfilling scans every posting's ``search_text`` once per batch of new terms;
+    afterwards ingestion keeps their postings current. No commit.
+    """
+    skills = list(skills)
+    vocab = _vocabulary(session, skills)
+    new_terms = [sk for sk in skills if sk not in vocab]
+    if not new_terms:
+        return vocab
+
+    now = datetime.now(tz=UTC)
+    session.execute(
+        sqlite_insert(SkillTerm).on_conflict_do_nothing(),
+        [{"term": term, "created_at": now} for term in new_terms],
+    )
+    new_vocab = _vocabulary(session, new_terms)
+
+    scanned = 0
+    postings = 0
+    last_id = 0
+    while True:
+        chunk = session.execute(
+            select(JobPosting.id, JobPosting.search_text)
+            .where(JobPosting.id > last_id)
+            .order_by(JobPosting.id)
+            .limit(BACKFILL_CHUNK_SIZE)
+        ).all()
+        if not chunk:
+            break
+        postings += _insert_postings(
+            session, new_vocab, {job_id: text or "" for job_id, text in chunk}
+        )
+        scanned += len(chunk)
+        last_id = chunk[-1].id
+
+    logger.info(
+        "skill_terms_backfilled",
+        extra={"terms": len(new_terms), "jobs": scanned, "postings": postings},
+    )
+    return vocab | new_vocab
+
+
+def term_postings(
+    session: Session, vocab: Mapping[str, int], *, job_ids: Select | None = None
+) -> dict[str, set[int]]:
+    """Postings list (job ids) per term, restricted to ``job_ids`` when given."""
+    stmt = select(SkillPosting.term_id, SkillPosting.job_id).where(
+        SkillPosting.term_id.in_(list(vocab.values()))
+    )
+    if job_ids is not None:
+        stmt = stmt.where(SkillPosting.job_id.in_(job_ids))
+
+    terms = {term_id: term for term, term_id in vocab.items()}
+    postings: dict[str, set[int]] = {term: set() for term in vocab}
+    for term_id, job_id in session.execute(stmt):
+        postings[terms[term_id]].add(job_id)
+    return postings
@@ -1,18 +1,199 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
 from typing import Any
 
 from rq import Worker
 
 from ai_job_aggregator.rq import redis_connection
+from ai_job_aggregator.scoring.tasks import dispose_worker_state, warm_worker_state
 
 logger = logging.getLogger(__name__)
 
+QUEUES = ["scoring"]
 
-def run_worker() -> None:
+# A child that dies sooner than this after starting is restarted only after a pause,
+# so a worker that cannot start (bad config, Redis down) does not spin.
+MIN_UPTIME_S = 5.0
+RESTART_BACKOFF_S = 5.0
+
+
+def _work(name: str) -> None:
     conn: Any = redis_connection()
     with conn:
-        worker = Worker(["scoring"])
-        logger.info("rq_worker_starting", extra={"queues": ["scoring"]})
+        worker = Worker(QUEUES, name=name)
+        logger.info("rq_worker_starting", extra={"queues": QUEUES, "worker": name})
         worker.work(with_scheduler=False)
+
+
+def _child_main(target: Callable[[str], None], name: str) -> None:
+    # Children handle signals themselves (RQ: warm shutdown on the first SIGTERM/SIGINT,
+    # cold on the second); drop the supervisor's handlers inherited through fork.
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    target(f"{name}.{os.getpid()}")
+
+
+class WorkerPool:
+    """Supervise ``concurrency`` forked worker processes.
+
+    Children are forked from this process, so whatever it imported and warmed is
+    shared. A child exiting non-zero is restarted (after ``restart_backoff`` if it
+    died within ``MIN_UPTIME_S``); one exiting cleanly leaves its slot empty. SIGTERM
+    or SIGINT is forwarded to every child, which drains (finishes its current job)
+    before exiting; ``run`` returns once all children are gone.
+
+    Every ``report_interval`` seconds (``None``: never) per-process throughput is
+    logged from the RQ worker registry. ``target`` receives the worker name and runs
+    in the child (default: an RQ worker on the ``scoring`` queue).
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int,
+        target: Callable[[str], None] = _work,
+        report_interval: float | None = 60.0,
+        restart_backoff: float = RESTART_BACKOFF_S,
+        poll_interval: float = 1.0,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self.concurrency = concurrency
+        self.target = target
+        self.report_interval = report_interval
+        self.restart_backoff = restart_backoff
+        self.poll_interval = poll_interval
+        self.name = f"aja-{socket.gethostname()}-{os.getpid()}"
+        self.restarts = 0
+        self._ctx = multiprocessing.get_context("fork")
+        self._children: dict[int, tuple[BaseProcess, float]] = {}  # slot -> (process, started)
+        self._restart_at: dict[int, float] = {}
+        self._stop_signal: int | None = None
+
+    def _spawn(self, slot: int) -> None:
+        process = self._ctx.Process(
+            target=_child_main, args=(self.target, f"{self.name}.{slot}"), daemon=False
+        )
+        process.start()
+        self._children[slot] = (process, time.monotonic())
+        logger.info("rq_worker_process_started", extra={"slot": slot, "pid": process.pid})
+        if self._stop_signal is not None:
+            # the stop request arrived while this child was being forked
+            self._kill(process, self._stop_signal)
+
+    @staticmethod
+    def _kill(process: BaseProcess, signum: int) -> None:
+        if process.is_alive() and process.pid is not None:
+            try:
+                os.kill(process.pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def stop(self, signum: int = signal.SIGTERM, frame: Any = None) -> None:
+        """Ask every child to drain and exit; repeated calls are forwarded again."""
+        self._stop_signal = signum
+        self._restart_at.clear()
+        for process, _ in list(self._children.values()):
+            self._kill(process, signum)
+        logger.info(
+            "rq_worker_pool_stopping", extra={"signal": signum, "children": len(self._children)}
+        )
+
+    def _reap(self) -> None:
+        now = time.monotonic()
+        for slot, (process, started) in list(self._children.items()):
+            if process.is_alive():
+                continue
+            process.join()
+            del self._children[slot]
+            extra = {"slot": slot, "pid": process.pid, "exitcode": process.exitcode}
+            if self._stop_signal is not None or process.exitcode == 0:
+                logger.info("rq_worker_process_exited", extra=extra)
+                continue
+            logger.warning("rq_worker_process_died", extra=extra)
+            self.restarts += 1
+            backoff = self.restart_backoff if now - started < MIN_UPTIME_S else 0.0
+            self._restart_at[slot] = now + backoff
+
+        for slot, at in list(self._restart_at.items()):
+            if at <= now and self._stop_signal is None:
+                self._restart_at.pop(slot, None)
+                self._spawn(slot)
+
+    def report(self) -> list[dict]:
+        """Log and return jobs done and jobs/s per live child, from RQ's worker registry."""
+        stats = []
+        now = datetime.now(UTC)
+        try:
+            workers = Worker.all(connection=redis_connection())
+        except Exception:  # noqa: BLE001
+            logger.warning("rq_worker_pool_report_failed", exc_info=True)
+            return stats
+        for worker in workers:
+            if not worker.name.startswith(f"{self.name}."):
+                continue
+            born = worker.birth_date
+            uptime = (now - born.replace(tzinfo=UTC)).total_seconds() if born else 0.0
+            stat = {
+                "worker": worker.name,
+                "jobs": worker.successful_job_count,
+                "failed": worker.failed_job_count,
+                "working_s": round(worker.total_working_time, 3),
+                "uptime_s": round(uptime, 1),
+                "jobs_per_s": round(worker.successful_job_count / uptime, 3) if uptime else 0.0,
+            }
+            logger.info("rq_worker_throughput", extra=stat)
+            stats.append(stat)
+        return stats
+
+    def run(self) -> None:
+        previous = {sig: signal.signal(sig, self.stop) for sig in (signal.SIGTERM, signal.SIGINT)}
+        logger.info(
+            "rq_worker_pool_starting", extra={"concurrency": self.concurrency, "pool": self.name}
+        )
+        try:
+            for slot in range(self.concurrency):
+                if self._stop_signal is None:
+                    self._spawn(slot)
+            next_report = time.monotonic() + self.report_interval if self.report_interval else None
+            while self._children or self._restart_at:
+                wait([p.sentinel for p, _ in self._children.values()], timeout=self.poll_interval)
+                self._reap()
+                if (
+                    next_report is not None
+                    and time.monotonic() >= next_report
+                    and self._stop_signal is None
+                ):
+                    self.report()
+                    next_report = time.monotonic() + (self.report_interval or 0)
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+        logger.info("rq_worker_pool_stopped", extra={"restarts": self.restarts})
+
+
+def run_worker(*, concurrency: int | None = None) -> None:
+    """Run one RQ worker, or supervise ``concurrency`` of them (default:
+    ``AJA_WORKER_CONCURRENCY``)."""
+    # Settings, engine and scorer imports are set up once here; every process forked
+    # from here (pool children, work horses) inherits them instead of rebuilding them.
+    state = warm_worker_state()
+    if concurrency is None:
+        concurrency = state.settings.worker_concurrency
+    try:
+        if concurrency > 1:
+            WorkerPool(concurrency=concurrency).run()
+        else:
+            _work(f"aja-{socket.gethostname()}-{os.getpid()}")
+    finally:
+        dispose_worker_state()
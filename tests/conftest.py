@@ -7,10 +7,29 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from ai_job_aggregator.schemas.job import JobPostingIn
 from alembic import command
 from alembic.config import Config
 
 
+class StubConnector:
+    """A connector that yields ``items`` for ``source``."""
+
+    def __init__(self, items, *, source: str = "stub"):
+        self.source = source
+        self._items = items
+
+    def fetch(self):
+        yield from self._items
+
+
+def stub_job(i: int, text: str = "", *, title: str | None = None, **raw) -> JobPostingIn:
+    """Posting ``i`` of the ``stub`` source; ``raw`` defaults to ``{"d": text}``."""
+    return JobPostingIn(
+        source="stub", source_item_id=str(i), title=title or f"Job {i}", raw=raw or {"d": text}
+    )
+
+
 @pytest.fixture()
 def db_path(tmp_path: Path) -> Path:
     return tmp_path / "test.sqlite3"
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+
+from ai_job_aggregator.connectors.base import SyncConnectorAdapter, as_async
+from ai_job_aggregator.connectors.http import HttpClient
+from ai_job_aggregator.connectors.remoteok import RemoteOkConnector
+from ai_job_aggregator.schemas.job import JobPostingIn
+from ai_job_aggregator.settings import Settings
+
+
+def test_http_client_limits_concurrent_requests_per_host():
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200)
+
+    settings = Settings(http_max_connections_per_host=2)
+
+    async def _run() -> None:
+        async with HttpClient(settings, transport=httpx.MockTransport(_handler)) as http:
+            await asyncio.gather(
+                *(http.get(f"https://{host}.test/{i}") for host in ("a", "b") for i in range(6))
+            )
+
+    asyncio.run(_run())
+
+    assert peak == {"a.test": 2, "b.test": 2}
+
+
+class _SyncConnector:
+    source = "sync"
+
+    def __init__(self, count: int):
+        self.count = count
+        self.threads: set[int] = set()
+
+    def fetch(self):
+        for i in range(self.count):
+            self.threads.add(threading.get_ident())
+            yield JobPostingIn(source=self.source, source_item_id=str(i))
+
+
+def test_sync_connector_adapter_fetches_off_the_event_loop():
+    connector = _SyncConnector(250)
+    adapted = as_async(connector)
+    assert isinstance(adapted, SyncConnectorAdapter)
+    assert as_async(RemoteOkConnector(Settings())).__class__ is RemoteOkConnector
+
+    async def _fetch():
+        async with HttpClient(Settings()) as http:
+            return [job.source_item_id async for job in adapted.afetch(http)]
+
+    assert asyncio.run(_fetch()) == [str(i) for i in range(250)]
+    assert threading.get_ident() not in connector.threads
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from ai_job_aggregator.db import (
+    create_engine_from_settings,
+    create_read_engine_from_settings,
+    sqlite_pragmas,
+)
+from ai_job_aggregator.settings import Settings
+
+
+def _pragmas(engine, *names: str) -> dict[str, object]:
+    with engine.connect() as conn:
+        return {name: conn.execute(text(f"PRAGMA {name}")).scalar_one() for name in names}
+
+
+def test_sqlite_profile_is_applied_to_every_connection(tmp_path):
+    engine = create_engine_from_settings(
+        Settings(
+            db_path=tmp_path / "db.sqlite3", sqlite_profile="balanced", sqlite_cache_size=-2048
+        )
+    )
+    try:
+        for _ in range(2):
+            assert _pragmas(
+                engine, "journal_mode", "synchronous", "cache_size", "temp_store", "busy_timeout"
+            ) == {
+                "journal_mode": "wal",
+                "synchronous": 1,  # NORMAL
+                "cache_size": -2048,  # override wins over the preset
+                "temp_store": 2,  # MEMORY
+                "busy_timeout": 5000,
+            }
+            engine.dispose()  # next round opens a fresh connection
+    finally:
+        engine.dispose()
+
+
+def test_default_sqlite_profile_leaves_sqlite_defaults(tmp_path):
+    engine = create_engine_from_settings(
+        Settings(db_path=tmp_path / "db.sqlite3", sqlite_profile="default")
+    )
+    try:
+        assert _pragmas(engine, "journal_mode", "synchronous") == {
+            "journal_mode": "delete",
+            "synchronous": 2,  # FULL
+        }
+    finally:
+        engine.dispose()
+
+
+@pytest.mark.parametrize(
+    ("overrides", "match"),
+    [
+        ({"sqlite_profile": "turbo"}, "unknown sqlite profile"),
+        ({"sqlite_synchronous": "normal; DROP TABLE job_postings"}, "invalid sqlite synchronous"),
+    ],
+)
+def test_sqlite_pragmas_rejects_unknown_values(tmp_path, overrides, match):
+    with pytest.raises(ValueError, match=match):
+        sqlite_pragmas(Settings(db_path=tmp_path / "db.sqlite3", **overrides))
+
+
+def test_read_engine_reads_committed_state_while_writer_is_mid_transaction(tmp_path):
+    settings = Settings(db_path=tmp_path / "db.sqlite3")
+    writer = create_engine_from_settings(settings)
+    reader = create_read_engine_from_settings(settings)
+    try:
+        with writer.begin() as conn:
+            conn.execute(text("CREATE TABLE t (x INTEGER)"))
+            conn.execute(text("INSERT INTO t VALUES (1)"))
+
+        with writer.connect() as wconn:
+            wconn.execute(text("INSERT INTO t VALUES (2)"))  # uncommitted, holds the write lock
+            with reader.connect() as rconn:
+                assert rconn.execute(text("SELECT count(*) FROM t")).scalar_one() == 1
+                assert rconn.execute(text("PRAGMA query_only")).scalar_one() == 1
+                with pytest.raises(OperationalError):
+                    rconn.execute(text("INSERT INTO t VALUES (3)"))
+            wconn.commit()
+
+        with reader.connect() as rconn:
+            assert rconn.execute(text("SELECT count(*) FROM t")).scalar_one() == 2
+    finally:
+        reader.dispose()
+        writer.dispose()
+
+
+def test_writer_engine_hands_out_one_connection_at_a_time(tmp_path):
+    writer = create_engine_from_settings(Settings(db_path=tmp_path / "db.sqlite3"))
+    second_checked_out = threading.Event()
+
+    def checkout() -> None:
+        with writer.connect():
+            second_checked_out.set()
+
+    try:
+        with writer.connect():
+            t = threading.Thread(target=checkout)
+            t.start()
+            assert not second_checked_out.wait(0.3)
+        assert second_checked_out.wait(5)
+        t.join()
+    finally:
+        writer.dispose()
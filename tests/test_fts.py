@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from conftest import StubConnector, stub_job
+from sqlalchemy import select
+
+from ai_job_aggregator.fts import match_terms, plain_query, search_jobs
+from ai_job_aggregator.ingest import run_ingestion
+from ai_job_aggregator.models import CandidateProfile, JobPosting
+from ai_job_aggregator.models.scoring import ScoreItem, ScoringRun
+from ai_job_aggregator.scoring.service import create_scoring_run, score_run
+
+
+def test_ingestion_keeps_fts_index_in_sync(session):
+    items = [
+        stub_job(1, title="Backend Engineer", tags=["python", "postgres"], description="APIs"),
+        stub_job(2, title="Data Scientist", tags=["ml"], description="Machine learning in Rust"),
+    ]
+    run_ingestion(session=session, connector=StubConnector(items), limit=10)
+
+    assert [h.title for h in search_jobs(session, "postgres")] == ["Backend Engineer"]
+    assert [h.title for h in search_jobs(session, '"machine learning"')] == ["Data Scientist"]
+
+    # a changed posting is re-indexed, replacing its old document
+    items[1] = stub_job(2, title="Data Scientist", tags=["ml"], description="Deep learning in Go")
+    run_ingestion(session=session, connector=StubConnector(items), limit=10)
+    assert search_jobs(session, "rust") == []
+    assert [h.title for h in search_jobs(session, "deep")] == ["Data Scientist"]
+
+
+def test_plain_query_matches_punctuation_and_operators_as_text(session):
+    items = [
+        stub_job(1, title="C++ Developer", tags=["c++"], description="Systems AND embedded"),
+        stub_job(2, title="Python Developer", tags=["python"], description="Web"),
+    ]
+    run_ingestion(session=session, connector=StubConnector(items), limit=10)
+
+    assert plain_query("c++ systems") == '"c++" "systems"'
+    assert [h.title for h in search_jobs(session, plain_query("c++ developer"))] == [
+        "C++ Developer"
+    ]
+    assert [h.title for h in search_jobs(session, plain_query("AND"))] == ["C++ Developer"]
+    assert plain_query("++ --") is None
+
+
+def test_match_terms_restricts_to_selected_jobs(session):
+    items = [stub_job(i, title="Python Engineer", tags=[], description="") for i in range(3)]
+    run_ingestion(session=session, connector=StubConnector(items), limit=10)
+    ids = session.execute(select(JobPosting.id).order_by(JobPosting.id)).scalars().all()
+
+    assert match_terms(session, ["python", "c++", "!!"]) == {
+        "python": set(ids),
+        "c++": set(),
+        "!!": set(),
+    }
+    only_first = select(JobPosting.id).where(JobPosting.id == ids[0])
+    assert match_terms(session, ["python"], job_ids=only_first) == {"python": {ids[0]}}
+
+
+def test_fts_scorer_matches_whole_tokens(session):
+    items = [
+        stub_job(1, title="Senior Python Engineer", tags=["sql"], description="JavaScript SPA"),
+        stub_job(2, title="Java Developer", tags=[], description="Spring"),
+    ]
+    run_ingestion(session=session, connector=StubConnector(items), limit=10)
+    prof = CandidateProfile(label="me", skills=["Python", "SQL", "Java"])
+    session.add(prof)
+    session.flush()
+    run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+
+    score_run(session=session, run_id=run.id, scorer="fts")
+
+    rows = session.execute(
+        select(JobPosting.source_item_id, ScoreItem.skills_matched, ScoreItem.score)
+        .join(JobPosting, JobPosting.id == ScoreItem.job_id)
+        .order_by(JobPosting.source_item_id)
+    ).all()
+    # unlike a substring scan, "java" does not match inside "javascript"
+    assert [(r.source_item_id, r.skills_matched) for r in rows] == [
+        ("1", ["python", "sql"]),
+        ("2", ["java"]),
+    ]
+    assert rows[0].score == 2 / 3 * 100 - 5  # senior title penalty still applies
+    assert session.get(ScoringRun, run.id).meta["scorer"] == "fts"
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import Counter
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+import pytest
+from conftest import StubConnector
+from sqlalchemy import event, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
-from ai_job_aggregator.ingest import run_ingestion
+from ai_job_aggregator.ingest import run_ingestion, run_ingestion_many
+from ai_job_aggregator.models.candidate_profile import CandidateProfile
 from ai_job_aggregator.models.ingestion import (
     IngestionItem,
     IngestionRun,
@@ -15,16 +23,6 @@ from ai_job_aggregator.models.job import JobPosting
 from ai_job_aggregator.schemas.job import JobPostingIn
 
 
-class _StubConnector:
-    source = "stub"
-
-    def __init__(self, items):
-        self._items = items
-
-    def fetch(self):
-        yield from self._items
-
-
 def test_run_ingestion_dedups_and_tracks_statuses(session):
     now = datetime(2025, 1, 1, tzinfo=UTC)
 
@@ -49,7 +47,7 @@ def test_run_ingestion_dedups_and_tracks_statuses(session):
         ),
     ]
 
-    rc = run_ingestion(session=session, connector=_StubConnector(items), limit=10)
+    rc = run_ingestion(session=session, connector=StubConnector(items), limit=10)
     assert rc == 0
 
     run = session.execute(select(IngestionRun)).scalar_one()
@@ -82,7 +80,7 @@ def test_run_ingestion_captures_error_for_malformed_item(session):
         url = "U"
         published_at = None
 
-    rc = run_ingestion(session=session, connector=_StubConnector([_Bad()]), limit=10)
+    rc = run_ingestion(session=session, connector=StubConnector([_Bad()]), limit=10)
     assert rc == 2
 
     run = session.execute(select(IngestionRun)).scalar_one()
@@ -94,9 +92,318 @@ def test_run_ingestion_captures_error_for_malformed_item(session):
 
 
 def test_run_ingestion_noop_on_zero_limit(session):
-    rc = run_ingestion(session=session, connector=_StubConnector([]), limit=0)
+    rc = run_ingestion(session=session, connector=StubConnector([]), limit=0)
     assert rc == 0
 
     run = session.execute(select(IngestionRun)).scalar_one()
     assert run.status == RunStatus.finished
     assert run.meta["limit"] == 0
+
+
+def test_run_ingestion_batches_commit_per_chunk(session):
+    items = [
+        JobPostingIn(source="stub", source_item_id=sid, title=f"T{sid}", raw={"id": sid})
+        for sid in ["1", "2", "2", "3", "1"]
+    ]
+
+    commits: list[int] = []
+    event.listen(session, "after_commit", lambda s: commits.append(1))
+
+    rc = run_ingestion(session=session, connector=StubConnector(items), limit=10, batch_size=2)
+    assert rc == 0
+
+    # start + 3 chunks + finish
+    assert len(commits) == 5
+
+    run = session.execute(select(IngestionRun)).scalar_one()
+    assert run.meta["ok"] == 3
+    assert run.meta["skipped"] == 2
+    assert run.meta["error"] == 0
+
+    jobs = {j.source_item_id: j.id for j in session.execute(select(JobPosting)).scalars()}
+    assert len(jobs) == 3
+
+    ing_items = session.execute(select(IngestionItem).order_by(IngestionItem.id)).scalars().all()
+    assert [it.status for it in ing_items] == [
+        ItemStatus.ok,
+        ItemStatus.ok,
+        ItemStatus.skipped,
+        ItemStatus.ok,
+        ItemStatus.skipped,
+    ]
+    assert [it.job_id for it in ing_items] == [jobs[it.source_item_id] for it in ing_items]
+
+
+@pytest.mark.parametrize("pipeline", ["true", "false"])
+def test_run_ingestion_pipeline_dedups_across_chunks_like_lockstep(session, monkeypatch, pipeline):
+    monkeypatch.setenv("AJA_INGEST_PIPELINE", pipeline)
+    items = [
+        JobPostingIn(source="stub", source_item_id="1", title="A", raw={"v": 1}),
+        JobPostingIn(source="stub", source_item_id="2", title="B", raw={"v": 1}),
+        JobPostingIn(source="stub", source_item_id="1", title="A", raw={"v": 2}),
+        JobPostingIn(source="stub", source_item_id="1", title="A", raw={"v": 2}),
+        JobPostingIn(source="stub", source_item_id="2", title="B", raw={"v": 1}),
+    ]
+
+    rc = run_ingestion(session=session, connector=StubConnector(items), limit=10, batch_size=1)
+    assert rc == 0
+
+    jobs = {j.source_item_id: j for j in session.execute(select(JobPosting)).scalars()}
+    assert jobs["1"].raw == {"v": 2}
+    ing_items = session.execute(select(IngestionItem).order_by(IngestionItem.id)).scalars().all()
+    assert [(it.status, it.job_id) for it in ing_items] == [
+        (ItemStatus.ok, jobs["1"].id),
+        (ItemStatus.ok, jobs["2"].id),
+        (ItemStatus.updated, jobs["1"].id),
+        (ItemStatus.skipped, jobs["1"].id),
+        (ItemStatus.skipped, jobs["2"].id),
+    ]
+
+    run = session.execute(select(IngestionRun)).scalar_one()
+    if pipeline == "true":
+        assert list(run.meta["stages"]) == ["fetch", "parse", "dedup", "persist"]
+        assert {st["items"] for st in run.meta["stages"].values()} == {5}
+    else:
+        assert "stages" not in run.meta
+
+
+def test_run_ingestion_pipeline_falls_back_to_lockstep_on_a_connection_bind(migrated_db):
+    items = [
+        JobPostingIn(source="stub", source_item_id="1", title="A", raw={"v": 1}),
+        JobPostingIn(source="stub", source_item_id="1", title="A", raw={"v": 2}),
+    ]
+    with migrated_db.connect() as conn, Session(bind=conn) as session:
+        rc = run_ingestion(session=session, connector=StubConnector(items), limit=10, batch_size=1)
+        assert rc == 0
+
+        run = session.execute(select(IngestionRun)).scalar_one()
+        assert "stages" not in run.meta
+        statuses = session.execute(select(IngestionItem.status).order_by(IngestionItem.id))
+        assert statuses.scalars().all() == [ItemStatus.ok, ItemStatus.updated]
+
+
+def test_run_ingestion_pipeline_bounds_fetching_ahead_of_slow_writes(session, monkeypatch):
+    monkeypatch.setenv("AJA_INGEST_QUEUE_CHUNKS", "1")
+    commits: list[int] = []
+    leads: list[int] = []
+
+    def _slow_commit(s):
+        time.sleep(0.01)
+        commits.append(1)
+
+    class _CountingConnector:
+        source = "stub"
+
+        def fetch(self):
+            for i in range(40):
+                leads.append(i - len(commits))
+                yield JobPostingIn(source="stub", source_item_id=str(i), title="T")
+
+    event.listen(session, "after_commit", _slow_commit)
+    rc = run_ingestion(session=session, connector=_CountingConnector(), limit=40, batch_size=1)
+    assert rc == 0
+
+    # 3 queues of one chunk plus one chunk in hand per stage, whatever the fetch rate
+    assert max(leads) <= 8
+    run = session.execute(select(IngestionRun)).scalar_one()
+    assert run.meta["ok"] == 40
+    assert run.meta["stages"]["fetch"]["blocked_s"] > 0
+
+
+def test_run_ingestion_pipeline_keeps_committed_chunks_when_fetch_fails(session):
+    class _FailingConnector:
+        source = "stub"
+
+        def fetch(self):
+            yield JobPostingIn(source="stub", source_item_id="1", title="A")
+            yield JobPostingIn(source="stub", source_item_id="2", title="B")
+            raise RuntimeError("connection reset")
+
+    rc = run_ingestion(session=session, connector=_FailingConnector(), limit=10, batch_size=1)
+    assert rc == 2
+
+    run = session.execute(select(IngestionRun)).scalar_one()
+    assert run.status == RunStatus.failed
+    assert run.meta["fatal"] == {"error_type": "RuntimeError", "message": "connection reset"}
+    assert run.meta["ok"] == 2
+    assert run.meta["stages"]["fetch"]["items"] == 2
+    assert len(session.execute(select(JobPosting)).scalars().all()) == 2
+
+
+def test_run_ingestion_upsert_links_postings_from_earlier_runs(session):
+    first = [JobPostingIn(source="stub", source_item_id="1", title="A", raw={"id": 1})]
+    assert run_ingestion(session=session, connector=StubConnector(first), limit=10) == 0
+
+    second = [
+        JobPostingIn(source="stub", source_item_id="1", title="A", raw={"id": 1}),
+        JobPostingIn(source="stub", source_item_id="2", title="B", raw={"id": 2}),
+    ]
+    assert run_ingestion(session=session, connector=StubConnector(second), limit=10) == 0
+
+    run = session.execute(select(IngestionRun).order_by(IngestionRun.id.desc())).scalars().first()
+    assert run.meta["ok"] == 1
+    assert run.meta["skipped"] == 1
+
+    jobs = {j.source_item_id: j.id for j in session.execute(select(JobPosting)).scalars()}
+    items = session.execute(
+        select(IngestionItem).where(IngestionItem.run_id == run.id).order_by(IngestionItem.id)
+    ).scalars()
+    assert [(it.status, it.job_id) for it in items] == [
+        (ItemStatus.skipped, jobs["1"]),
+        (ItemStatus.ok, jobs["2"]),
+    ]
+
+
+def test_job_postings_source_item_is_unique(session):
+    session.add(JobPosting(source="stub", source_item_id="1", raw={}))
+    session.add(JobPosting(source="stub", source_item_id="1", raw={}))
+    with pytest.raises(IntegrityError):
+        session.flush()
+
+
+def test_run_ingestion_rewrites_only_changed_postings(session):
+    first = [
+        JobPostingIn(source="stub", source_item_id="1", title="A", raw={"id": 1, "salary": 1}),
+        JobPostingIn(source="stub", source_item_id="2", title="B", raw={"id": 2}),
+    ]
+    assert run_ingestion(session=session, connector=StubConnector(first), limit=10) == 0
+    before = {
+        j.source_item_id: j.content_updated_at
+        for j in session.execute(select(JobPosting)).scalars()
+    }
+
+    second = [
+        JobPostingIn(source="stub", source_item_id="1", title="A", raw={"salary": 2, "id": 1}),
+        JobPostingIn(source="stub", source_item_id="2", title="B", raw={"id": 2}),
+    ]
+    assert run_ingestion(session=session, connector=StubConnector(second), limit=10) == 0
+
+    run = session.execute(select(IngestionRun).order_by(IngestionRun.id.desc())).scalars().first()
+    assert (run.meta["ok"], run.meta["updated"], run.meta["skipped"]) == (0, 1, 1)
+
+    session.expire_all()
+    jobs = {j.source_item_id: j for j in session.execute(select(JobPosting)).scalars()}
+    assert len(jobs) == 2
+    assert jobs["1"].raw["salary"] == 2
+    assert jobs["1"].content_updated_at > before["1"]
+    assert jobs["2"].content_updated_at == before["2"]
+
+    items = session.execute(
+        select(IngestionItem).where(IngestionItem.run_id == run.id).order_by(IngestionItem.id)
+    ).scalars()
+    assert [(it.status, it.job_id) for it in items] == [
+        (ItemStatus.updated, jobs["1"].id),
+        (ItemStatus.skipped, jobs["2"].id),
+    ]
+
+
+class _SlowAsyncConnector:
+    def __init__(self, source: str, count: int, *, delay: float = 0.3, fail: bool = False):
+        self.source = source
+        self._count = count
+        self._delay = delay
+        self._fail = fail
+
+    async def afetch(self, http):
+        await asyncio.sleep(self._delay)  # one slow network round trip
+        if self._fail:
+            raise RuntimeError(f"{self.source} is down")
+        for i in range(self._count):
+            yield JobPostingIn(source=self.source, source_item_id=str(i), title=f"T{i}")
+
+
+class _SlowSyncConnector(StubConnector):
+    def fetch(self):
+        time.sleep(0.3)
+        yield from self._items
+
+
+def test_run_ingestion_many_overlaps_sources_into_one_writer(session, monkeypatch):
+    monkeypatch.setenv("AJA_INGEST_QUEUE_CHUNKS", "1")
+    connectors = [
+        _SlowAsyncConnector("a", 7),
+        _SlowAsyncConnector("b", 5),
+        _SlowSyncConnector(
+            [JobPostingIn(source="stub", source_item_id=str(i), title="S") for i in range(3)]
+        ),
+    ]
+
+    t0 = time.perf_counter()
+    rc = run_ingestion_many(session=session, connectors=connectors, limit=6, batch_size=2)
+    elapsed = time.perf_counter() - t0
+
+    assert rc == 0
+    assert elapsed < 0.6  # the three 0.3s fetches overlap
+    runs = {r.source: r for r in session.execute(select(IngestionRun)).scalars()}
+    assert {source: (r.status, r.meta["ok"]) for source, r in runs.items()} == {
+        "a": (RunStatus.finished, 6),  # clamped to the limit
+        "b": (RunStatus.finished, 5),
+        "stub": (RunStatus.finished, 3),
+    }
+    items = session.execute(select(IngestionItem)).scalars().all()
+    assert Counter(it.run_id for it in items) == {
+        runs["a"].id: 6,
+        runs["b"].id: 5,
+        runs["stub"].id: 3,
+    }
+
+
+def test_run_ingestion_many_fails_only_the_failing_source(session):
+    rc = run_ingestion_many(
+        session=session,
+        connectors=[
+            _SlowAsyncConnector("up", 2, delay=0),
+            _SlowAsyncConnector("down", 2, fail=True),
+        ],
+        limit=10,
+    )
+
+    assert rc == 2
+    runs = {r.source: r for r in session.execute(select(IngestionRun)).scalars()}
+    assert runs["up"].status == RunStatus.finished
+    assert runs["up"].meta["ok"] == 2
+    assert runs["down"].status == RunStatus.failed
+    assert runs["down"].meta["fatal"] == {"error_type": "RuntimeError", "message": "down is down"}
+
+
+def test_run_ingestion_many_fails_every_run_when_the_fetcher_cannot_start(session, monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "bogus://proxy")  # the shared HttpClient cannot open
+
+    rc = run_ingestion_many(
+        session=session,
+        connectors=[_SlowAsyncConnector("a", 2, delay=0), _SlowAsyncConnector("b", 2, delay=0)],
+        limit=10,
+    )
+
+    assert rc == 2
+    runs = session.execute(select(IngestionRun)).scalars().all()
+    assert {(r.source, r.status) for r in runs} == {
+        ("a", RunStatus.failed),
+        ("b", RunStatus.failed),
+    }
+    assert {r.meta["fatal"]["error_type"] for r in runs} == {"ValueError"}
+
+
+def test_run_ingestion_many_hands_off_scoring_after_every_source_is_written(session, monkeypatch):
+    import ai_job_aggregator.scoring.enqueue as enq
+
+    session.add(CandidateProfile(label="me", skills=["python"]))
+    session.commit()
+    seen: list[tuple[int, set[RunStatus]]] = []
+
+    def _enqueue(*, run_id, session):
+        statuses = set(session.execute(select(IngestionRun.status)).scalars())
+        seen.append((run_id, statuses))
+        return True
+
+    monkeypatch.setattr(enq, "enqueue_scoring_run", _enqueue)
+    rc = run_ingestion_many(
+        session=session,
+        connectors=[_SlowAsyncConnector("a", 2, delay=0), _SlowAsyncConnector("b", 4, delay=0)],
+        limit=10,
+        profile_selector="me",
+    )
+
+    assert rc == 0
+    assert len(seen) == 2
+    assert all(statuses == {RunStatus.finished} for _, statuses in seen)
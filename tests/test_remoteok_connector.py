@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 
+import httpx
 import pytest
 
+from ai_job_aggregator.connectors.http import HttpClient
 from ai_job_aggregator.connectors.remoteok import RemoteOkConnector
 from ai_job_aggregator.settings import Settings
 
@@ -81,3 +84,26 @@ def test_remoteok_fetch_raises_on_non_list_json(monkeypatch: pytest.MonkeyPatch)
     conn = RemoteOkConnector(Settings(remoteok_url="https://example.test/api"))
     with pytest.raises(ValueError, match="not a list"):
         list(conn.fetch())
+
+
+def test_remoteok_afetch_parses_jobs_through_shared_client():
+    payload = [{"legal": "meta"}, {"id": 7, "position": "ML Engineer", "company": "Acme"}]
+    seen: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=payload)
+
+    settings = Settings(remoteok_url="https://example.test/api")
+
+    async def _fetch():
+        async with HttpClient(settings, transport=httpx.MockTransport(_handler)) as http:
+            return [job async for job in RemoteOkConnector(settings).afetch(http)]
+
+    jobs = asyncio.run(_fetch())
+
+    assert [(j.source, j.source_item_id, j.title) for j in jobs] == [
+        ("remoteok", "7", "ML Engineer")
+    ]
+    assert str(seen[0].url) == "https://example.test/api"
+    assert "gzip" in seen[0].headers["accept-encoding"]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import pytest
+
+from ai_job_aggregator.models import CandidateProfile, JobPosting
+from ai_job_aggregator.models.scoring import ScoreItem, ScoreItemStatus, ScoringRunStatus
+from ai_job_aggregator.scoring.results import (
+    parse_cursor,
+    record_latest_scores,
+    top_results,
+    top_results_for_profile,
+)
+from ai_job_aggregator.scoring.service import create_scoring_run, score_run
+
+
+def _seed(session, scores: list[float | None]):
+    prof = CandidateProfile(label="me", skills=["python"])
+    session.add(prof)
+    jobs = [
+        JobPosting(source="stub", source_item_id=str(i), title=f"Job {i}", raw={})
+        for i in range(len(scores))
+    ]
+    session.add_all(jobs)
+    session.flush()
+
+    run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    for job, score in zip(jobs, scores, strict=True):
+        session.add(
+            ScoreItem(
+                scoring_run_id=run.id,
+                job_id=job.id,
+                status=ScoreItemStatus.finished if score is not None else ScoreItemStatus.failed,
+                score=score,
+                skills_matched=[],
+                skills_missing=[],
+                reasons={},
+            )
+        )
+    session.commit()
+    return prof, run, jobs
+
+
+def test_top_results_orders_by_score_and_pages_with_keyset(session):
+    _, run, jobs = _seed(session, [10.0, 50.0, None, 50.0, 90.0, 0.0])
+
+    first = top_results(session, run_id=run.id, limit=3)
+    assert [(r.score, r.title) for r in first] == [
+        (90.0, "Job 4"),
+        (50.0, "Job 1"),
+        (50.0, "Job 3"),
+    ]
+
+    rest = top_results(session, run_id=run.id, limit=3, after=parse_cursor(first[-1].cursor))
+    assert [(r.score, r.job_id) for r in rest] == [(10.0, jobs[0].id), (0.0, jobs[5].id)]
+
+    # a cursor in the middle of a tie continues within the tie
+    tie = top_results(session, run_id=run.id, limit=1, after=parse_cursor(first[1].cursor))
+    assert [r.title for r in tie] == ["Job 3"]
+
+
+def test_top_results_for_profile_ranks_latest_score_per_job_across_runs(session):
+    prof, full_run, jobs = _seed(session, [10.0, 50.0, 30.0])
+    full_run.status = ScoringRunStatus.finished
+    # an incremental run rescoring the changed job 0 (then failing job 1), and an
+    # unfinished one
+    runs = []
+    for status, scores in (
+        (ScoringRunStatus.finished, [70.0, None]),
+        (ScoringRunStatus.started, [99.0, 99.0]),
+    ):
+        run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+        run.status = status
+        session.flush()
+        for job, score in zip(jobs, scores, strict=False):
+            session.add(
+                ScoreItem(
+                    scoring_run_id=run.id,
+                    job_id=job.id,
+                    status=ScoreItemStatus.finished
+                    if score is not None
+                    else ScoreItemStatus.failed,
+                    score=score,
+                    skills_matched=[],
+                    skills_missing=[],
+                    reasons={},
+                )
+            )
+        runs.append(run)
+    session.flush()
+    # the incremental run finishes first: the full run must not overwrite its score
+    record_latest_scores(session, runs[0])
+    record_latest_scores(session, full_run)
+    session.commit()
+
+    first = top_results_for_profile(session, "me", limit=2)
+    assert [(r.job_id, r.score) for r in first] == [(jobs[0].id, 70.0), (jobs[1].id, 50.0)]
+    rest = top_results_for_profile(session, "me", limit=2, after=parse_cursor(first[-1].cursor))
+    assert [(r.job_id, r.score) for r in rest] == [(jobs[2].id, 30.0)]
+
+    with pytest.raises(ValueError, match="candidate_profile not found"):
+        top_results_for_profile(session, "nobody")
+
+
+def test_profile_job_scores_track_finished_scoring_runs(session):
+    prof = CandidateProfile(label="me", skills=["python"])
+    job = JobPosting(source="stub", source_item_id="1", title="Python Dev", raw={})
+    session.add_all([prof, job])
+    session.commit()
+
+    run = create_scoring_run(
+        session=session, profile_id=prof.id, ingestion_run_id=None, meta={"full_rescore": True}
+    )
+    session.commit()
+    assert top_results_for_profile(session, "me") == []
+
+    score_run(session=session, run_id=run.id)
+    assert [(r.job_id, r.score) for r in top_results_for_profile(session, "me")] == [
+        (job.id, top_results(session, run_id=run.id)[0].score)
+    ]
@@ -1,11 +1,130 @@
 from __future__ import annotations
 
+import threading
+from pathlib import Path
+
 import ai_job_aggregator.scoring.enqueue as enq
+import ai_job_aggregator.scoring.inprocess as inprocess
+from ai_job_aggregator.models import CandidateProfile, JobPosting
+from ai_job_aggregator.models.scoring import ScoreItem, ScoringRun, ScoringRunStatus
+from ai_job_aggregator.scoring.inprocess import wait_for_scoring
+from ai_job_aggregator.scoring.service import create_scoring_run
 
 
 def test_enqueue_scoring_run_redis_unavailable_does_not_crash(monkeypatch):
     monkeypatch.setattr(enq, "redis_available", lambda: False)
 
-    ok = enq.enqueue_scoring_run(run_id=1)
+    ok = enq.enqueue_scoring_run(run_id=1, backend="rq")
 
     assert ok is False
+
+
+def test_enqueue_scoring_run_falls_back_to_inprocess_without_redis(session, monkeypatch):
+    monkeypatch.setattr(enq, "redis_available", lambda: False)
+    prof = CandidateProfile(label="me", skills=["python"])
+    session.add(prof)
+    session.add(JobPosting(source="stub", source_item_id="1", title="Python Dev", raw={}))
+    session.commit()
+    run = create_scoring_run(
+        session=session, profile_id=prof.id, ingestion_run_id=None, meta={"full_rescore": True}
+    )
+    session.commit()
+
+    assert enq.enqueue_scoring_run(run_id=run.id, session=session) is True
+    wait_for_scoring()
+
+    session.expire_all()
+    assert session.get(ScoringRun, run.id).status == ScoringRunStatus.finished
+    assert session.query(ScoreItem).filter_by(scoring_run_id=run.id).count() == 1
+
+
+def test_inprocess_scoring_marks_failing_run_failed(session, monkeypatch):
+    prof = CandidateProfile(label="me", skills=["python"])
+    session.add(prof)
+    session.commit()
+    run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+
+    def _boom(**kwargs):
+        raise RuntimeError("scorer exploded")
+
+    monkeypatch.setattr(inprocess, "score_run", _boom)
+    inprocess.submit_scoring_run(run_id=run.id, db_path=Path(session.get_bind().url.database))
+    wait_for_scoring()
+
+    session.expire_all()
+    failed = session.get(ScoringRun, run.id)
+    assert failed.status == ScoringRunStatus.failed
+    assert failed.meta["fatal"]["message"] == "scorer exploded"
+
+
+def test_inprocess_scoring_does_not_block_the_submitter(monkeypatch, tmp_path):
+    release = threading.Event()
+    scored: list[int] = []
+
+    def _score_run(*, session, run_id, settings):
+        release.wait(5)
+        scored.append(run_id)
+
+    monkeypatch.setattr(inprocess, "score_run", _score_run)
+    inprocess.submit_scoring_run(run_id=1, db_path=tmp_path / "a.sqlite3")
+    assert scored == []
+
+    release.set()
+    wait_for_scoring()
+    assert scored == [1]
+
+
+def test_inprocess_scoring_uses_the_database_each_run_was_submitted_for(monkeypatch, tmp_path):
+    scored: list[tuple[int, str]] = []
+
+    def _score_run(*, session, run_id, settings):
+        scored.append((run_id, session.get_bind().url.database))
+
+    monkeypatch.setattr(inprocess, "score_run", _score_run)
+    monkeypatch.setenv("AJA_DB_PATH", str(tmp_path / "a.sqlite3"))
+    enq.enqueue_scoring_run(run_id=1, backend="inprocess")
+    inprocess.submit_scoring_run(run_id=2, db_path=tmp_path / "b.sqlite3")
+    # the database configured when the runs are scored does not matter
+    monkeypatch.setenv("AJA_DB_PATH", str(tmp_path / "c.sqlite3"))
+    wait_for_scoring()
+
+    assert scored == [(1, str(tmp_path / "a.sqlite3")), (2, str(tmp_path / "b.sqlite3"))]
+
+
+class _FakeJob:
+    def __init__(self, job_id: str):
+        self.id = job_id
+
+
+class _FakeQueue:
+    def __init__(self, name, connection=None):
+        self.name = name
+        self.enqueued: list[tuple] = []
+        _FakeQueue.last = self
+
+    def enqueue(self, func, **kwargs):
+        self.enqueued.append((func, kwargs))
+        return _FakeJob(f"job-{len(self.enqueued)}")
+
+
+def test_enqueue_scoring_run_sharded_fans_out_with_finalizer(monkeypatch):
+    monkeypatch.setattr(enq, "redis_available", lambda: True)
+    monkeypatch.setattr(enq, "redis_connection", lambda: None)
+    monkeypatch.setattr(enq, "Queue", _FakeQueue)
+    monkeypatch.setattr(enq, "_plan", lambda **kwargs: [(1, 10), (11, 20), (21, 25)])
+
+    assert enq.enqueue_scoring_run(run_id=7, shards=3) is True
+
+    calls = _FakeQueue.last.enqueued
+    assert [(f, kw["shard"]) for f, kw in calls[:3]] == [
+        (enq.score_shard_task, 0),
+        (enq.score_shard_task, 1),
+        (enq.score_shard_task, 2),
+    ]
+    func, kwargs = calls[3]
+    assert func is enq.finalize_scoring_run_task
+    assert kwargs["run_id"] == 7
+    assert kwargs["shard_job_ids"] == ["job-1", "job-2", "job-3"]
+    assert kwargs["depends_on"].allow_failure is True
+    assert kwargs["depends_on"].dependencies == kwargs["shard_job_ids"]
@@ -1,12 +1,36 @@
 from __future__ import annotations
 
+import random
+import sqlite3
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+
 import pytest
-from sqlalchemy import select
+from conftest import StubConnector
+from sqlalchemy import event, func, insert, select
 
-from ai_job_aggregator.models import CandidateProfile, JobPosting
-from ai_job_aggregator.models.scoring import ScoreItem, ScoreItemStatus
-from ai_job_aggregator.scoring.heuristic import score_job
-from ai_job_aggregator.scoring.service import create_scoring_run, score_run
+from ai_job_aggregator.ingest import run_ingestion
+from ai_job_aggregator.models import CandidateProfile, IngestionRun, JobPosting
+from ai_job_aggregator.models.scoring import (
+    ScoreCacheEntry,
+    ScoreItem,
+    ScoreItemStatus,
+    ScoringError,
+    ScoringRun,
+    ScoringRunStatus,
+)
+from ai_job_aggregator.schemas.job import JobPostingIn
+from ai_job_aggregator.schemas.scoring import ScoreResult
+from ai_job_aggregator.scoring.cache import (
+    ScoreCacheKey,
+    lookup_scores,
+    prune_score_cache,
+    store_scores,
+)
+from ai_job_aggregator.scoring.heuristic import SCORER_VERSION, SkillMatcher, score_job
+from ai_job_aggregator.scoring.service import create_scoring_run, score_run, score_runs
+from ai_job_aggregator.scoring.shards import finish_sharded_run, plan_shards, score_shard
+from ai_job_aggregator.scoring.tokens import TokenMatcher, tokenize
 
 
 def test_heuristic_score_job_basic_matching():
@@ -36,6 +60,98 @@ def test_heuristic_score_job_empty_skills_is_zero():
     assert res.skills_missing == []
 
 
+def test_skill_matcher_matches_score_job_differentially():
+    rng = random.Random(1234)
+    vocab = [
+        "python",
+        "Python ",
+        "java",
+        "javascript",
+        "script",
+        "go",
+        "c++",
+        "machine  learning",
+        "sql",
+        "postgresql",
+        "Senior",
+        "intern",
+        "",
+        "  ",
+    ]
+    words = vocab + ["lead", "junior", "staff", "remote", "Ünïcode", "data\nteam", "{", "'"]
+
+    for _ in range(300):
+        profile_skills = rng.sample(vocab, rng.randint(0, len(vocab)))
+        matcher = SkillMatcher(profile_skills)
+        for _ in range(5):
+            title = " ".join(rng.choices(words, k=rng.randint(0, 4))) or None
+            company = rng.choice([None, "Acme", "GoCo"])
+            url = rng.choice([None, "https://x/javascript-dev"])
+            raw = {"desc": " ".join(rng.choices(words, k=rng.randint(0, 30)))}
+
+            expected = score_job(
+                profile_skills=profile_skills,
+                job_title=title,
+                company=company,
+                url=url,
+                raw=raw,
+            )
+            got = matcher.score(job_title=title, company=company, url=url, raw=raw)
+            assert got == expected
+
+
+def test_tokenize_keeps_skill_symbols_and_drops_punctuation():
+    assert tokenize("Senior C++/C# dev. Node.js, .NET; machine-learning (ML) café... R&D") == [
+        "senior",
+        "c++",
+        "c#",
+        "dev",
+        "node.js",
+        "net",
+        "machine",
+        "learning",
+        "ml",
+        "café",
+        "r",
+        "d",
+    ]
+
+
+def test_token_matcher_matches_whole_tokens_only():
+    matcher = TokenMatcher(["Go", "R", "Java", "machine  learning", "C++", "node.js", "!!"])
+    matched, missing = matcher.match(
+        "google javascript; we are hiring. Machine learning with C++ and Node.js"
+    )
+    assert matched == ["machine learning", "c++", "node.js"]
+    assert missing == ["go", "r", "java", "!!"]
+
+    # phrases must be consecutive tokens
+    assert matcher.match("machine vision, deep learning")[0] == []
+    assert matcher.match("Go, R and java")[0] == ["go", "r", "java"]
+
+
+def test_score_run_with_tokens_scorer(session):
+    job = JobPosting(
+        source="stub",
+        source_item_id="1",
+        title="Senior Engineer",
+        raw={"desc": "Python at Google, some R"},
+    )
+    prof = CandidateProfile(label="me", skills=["python", "go", "r"])
+    session.add_all([job, prof])
+    session.flush()
+    run = create_scoring_run(
+        session=session, profile_id=prof.id, ingestion_run_id=None, meta={"scorer": "tokens"}
+    )
+    session.commit()
+
+    score_run(session=session, run_id=run.id)
+
+    item = session.execute(select(ScoreItem).where(ScoreItem.scoring_run_id == run.id)).scalar_one()
+    assert item.skills_matched == ["python", "r"]
+    assert item.score == pytest.approx(2 / 3 * 100 - 5)
+
+
 def test_score_run_profile_not_found_raises(session):
     run = create_scoring_run(session=session, profile_id=9999, ingestion_run_id=None)
     session.commit()
@@ -78,3 +194,519 @@ def test_score_run_creates_items_and_finishes(session):
     assert items[0].status == ScoreItemStatus.finished
     assert items[0].score is not None
     assert "python" in items[0].skills_matched
+
+
+def _scored_job_ids(session, run_id: int) -> set[int]:
+    return set(
+        session.execute(select(ScoreItem.job_id).where(ScoreItem.scoring_run_id == run_id))
+        .scalars()
+        .all()
+    )
+
+
+def test_score_run_incremental_scores_only_ingestion_run_jobs(session):
+    prof = CandidateProfile(label="me", skills=["python"])
+    old = JobPosting(source="stub", source_item_id="old", title="Old", raw={})
+    session.add_all([prof, old])
+    session.commit()
+
+    connector = StubConnector(
+        [JobPostingIn(source="stub", source_item_id="new", title="Python Dev", raw={})]
+    )
+    assert run_ingestion(session=session, connector=connector, limit=10) == 0
+    ing_run = session.execute(select(IngestionRun)).scalar_one()
+    new = session.execute(select(JobPosting).where(JobPosting.source_item_id == "new")).scalar_one()
+
+    run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=ing_run.id)
+    session.commit()
+    score_run(session=session, run_id=run.id)
+
+    assert _scored_job_ids(session, run.id) == {new.id}
+    assert run.meta["selection"]["mode"] == "ingestion_run"
+
+    full = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=ing_run.id)
+    session.commit()
+    score_run(session=session, run_id=full.id, full_rescore=True)
+
+    assert _scored_job_ids(session, full.id) == {old.id, new.id}
+    assert full.meta["selection"]["mode"] == "full"
+
+
+def test_score_run_incremental_scores_jobs_changed_since_last_run(session):
+    prof = CandidateProfile(label="me", skills=["python"])
+    seen = JobPosting(
+        source="stub",
+        source_item_id="1",
+        raw={},
+        content_updated_at=datetime(2025, 1, 1),
+    )
+    session.add_all([prof, seen])
+    session.commit()
+
+    first = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+    score_run(session=session, run_id=first.id)
+    assert _scored_job_ids(session, first.id) == {seen.id}
+
+    changed = JobPosting(
+        source="stub",
+        source_item_id="2",
+        raw={},
+        content_updated_at=datetime.now(tz=UTC) + timedelta(seconds=1),
+    )
+    session.add(changed)
+    session.commit()
+
+    second = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+    score_run(session=session, run_id=second.id)
+
+    assert _scored_job_ids(session, second.id) == {changed.id}
+    assert second.meta["selection"]["mode"] == "changed_since"
+
+
+def test_score_run_incremental_ignores_ingestion_bound_runs_as_watermark(session):
+    prof = CandidateProfile(label="me", skills=["python"])
+    session.add(prof)
+    session.commit()
+
+    a = StubConnector(
+        [JobPostingIn(source="a", source_item_id=f"a{i}", title="Python") for i in (1, 2)],
+        source="a",
+    )
+    assert run_ingestion(session=session, connector=a, limit=10) == 0
+    b = StubConnector([JobPostingIn(source="b", source_item_id="b1", title="Python")], source="b")
+    assert run_ingestion(session=session, connector=b, limit=10) == 0
+    b_run = session.execute(select(IngestionRun).where(IngestionRun.source == "b")).scalar_one()
+
+    bound = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=b_run.id)
+    session.commit()
+    score_run(session=session, run_id=bound.id)
+
+    plain = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+    score_run(session=session, run_id=plain.id)
+
+    # the bound run only scored b1: a1 and a2 must not fall behind its watermark
+    assert plain.meta["selection"]["mode"] == "full"
+    assert _scored_job_ids(session, plain.id) == set(
+        session.execute(select(JobPosting.id)).scalars()
+    )
+
+
+def test_score_run_reads_search_text_not_raw(session):
+    prof = CandidateProfile(label="me", skills=["python", "sql"])
+    job = JobPosting(
+        source="stub",
+        source_item_id="1",
+        title="Data Engineer",
+        raw={"tags": ["Python"]},
+    )
+    session.add_all([prof, job])
+    session.commit()
+    assert job.search_text == "data engineer\n{'tags': ['python']}"
+
+    run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+
+    statements: list[str] = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    score_run(session=session, run_id=run.id)
+
+    job_selects = [s for s in statements if s.startswith("SELECT") and "job_postings" in s]
+    assert job_selects
+    assert not any("job_postings.raw" in s for s in job_selects)
+
+    item = session.execute(select(ScoreItem)).scalar_one()
+    assert item.skills_matched == ["python"]
+
+
+def test_score_run_memory_stays_bounded_on_large_table(session):
+    n_jobs = 1000
+    text = "lorem ipsum dolor sit amet python " * 750  # ~25KB per posting, ~25MB in total
+    prof = CandidateProfile(label="me", skills=["python", "rust"])
+    session.add(prof)
+    session.execute(
+        insert(JobPosting),
+        [
+            {
+                "source": "synthetic",
+                "source_item_id": str(i),
+                "title": f"Job {i}",
+                "raw": {},
+                "search_text": text,
+            }
+            for i in range(n_jobs)
+        ],
+    )
+    session.commit()
+
+    run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+
+    tracemalloc.start()
+    try:
+        score_run(session=session, run_id=run.id, chunk_size=50)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert run.meta["jobs"] == n_jobs
+    # Loading the whole table at once would hold every search_text (~25MB) plus the
+    # ScoreItems; streaming keeps roughly one chunk alive. Measured as traced Python
+    # allocations: the process's peak RSS cannot be reset between tests.
+    assert peak < 8 * 1024 * 1024
+
+
+def test_score_run_clamps_non_positive_batch_size(session, monkeypatch):
+    monkeypatch.setenv("AJA_SCORING_BATCH_SIZE", "0")
+    prof = CandidateProfile(label="me", skills=["python"])
+    session.add(prof)
+    session.add_all(
+        JobPosting(source="synthetic", source_item_id=str(i), title="python dev", raw={})
+        for i in range(3)
+    )
+    session.commit()
+
+    run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+    score_run(session=session, run_id=run.id)
+
+    assert run.meta["jobs"] == 3
+
+
+@pytest.mark.parametrize("trace_items", [False, True])
+def test_score_run_bulk_persists_results_and_links_errors(session, monkeypatch, trace_items):
+    prof = CandidateProfile(label="me", skills=["python"])
+    session.add(prof)
+    jobs = [
+        JobPosting(source="stub", source_item_id=str(i), title=f"Python {i}", raw={})
+        for i in range(5)
+    ]
+    session.add_all(jobs)
+    session.commit()
+    bad_id = jobs[2].id
+
+    original = SkillMatcher.score_text
+
+    def _flaky(self, *, job_title, company, search_text):
+        if job_title == "Python 2":
+            raise RuntimeError("boom")
+        return original(self, job_title=job_title, company=company, search_text=search_text)
+
+    monkeypatch.setattr(SkillMatcher, "score_text", _flaky)
+
+    commits: list[int] = []
+    event.listen(session, "after_commit", lambda s: commits.append(1))
+
+    run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+    commits.clear()
+    score_run(session=session, run_id=run.id, chunk_size=2, trace_items=trace_items)
+
+    # one commit per chunk (plus one per chunk for the traced started rows) + finish
+    assert len(commits) == (7 if trace_items else 4)
+    assert run.meta["jobs"] == 5
+    assert run.meta["failed"] == 1
+
+    items = {
+        it.job_id: it
+        for it in session.execute(
+            select(ScoreItem).where(ScoreItem.scoring_run_id == run.id)
+        ).scalars()
+    }
+    assert len(items) == 5
+    assert items[bad_id].status == ScoreItemStatus.failed
+    err = session.get(ScoringError, items[bad_id].error_id)
+    assert err.item_id == items[bad_id].id
+    assert err.error_type == "RuntimeError"
+    assert err.data == {"job_id": bad_id, "run_id": run.id}
+    others = [it for job_id, it in items.items() if job_id != bad_id]
+    assert all(it.status == ScoreItemStatus.finished and it.error_id is None for it in others)
+    assert all(it.skills_matched == ["python"] for it in others)
+
+
+def test_score_run_parallel_matches_sequential(session):
+    prof = CandidateProfile(label="me", skills=["python", "sql", "rust"])
+    session.add(prof)
+    session.add_all(
+        [
+            JobPosting(
+                source="stub",
+                source_item_id=str(i),
+                title=["Python Dev", "Senior SQL Engineer", "Rust Intern"][i % 3],
+                raw={"i": i},
+            )
+            for i in range(25)
+        ]
+    )
+    session.commit()
+
+    def _results(run_id: int) -> dict[int, tuple]:
+        return {
+            it.job_id: (it.status, it.score, it.skills_matched, it.skills_missing)
+            for it in session.execute(
+                select(ScoreItem).where(ScoreItem.scoring_run_id == run_id)
+            ).scalars()
+        }
+
+    seq = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+    score_run(session=session, run_id=seq.id, full_rescore=True, chunk_size=4, workers=1)
+
+    par = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+    score_run(session=session, run_id=par.id, full_rescore=True, chunk_size=4, workers=2)
+
+    assert par.meta["workers"] == 2
+    assert par.meta["jobs"] == 25
+    assert _results(par.id) == _results(seq.id)
+
+
+def test_sharded_run_matches_score_run(session):
+    prof = CandidateProfile(label="me", skills=["python", "sql", "rust"])
+    session.add(prof)
+    session.add_all(
+        [
+            JobPosting(
+                source="stub",
+                source_item_id=str(i),
+                title=["Python Dev", "Senior SQL Engineer", "Rust Intern"][i % 3],
+                raw={"i": i},
+            )
+            for i in range(25)
+        ]
+    )
+    session.commit()
+
+    def _results(run_id: int) -> dict[int, tuple]:
+        return {
+            it.job_id: (it.status, it.score, it.skills_matched, it.skills_missing)
+            for it in session.execute(
+                select(ScoreItem).where(ScoreItem.scoring_run_id == run_id)
+            ).scalars()
+        }
+
+    whole = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+    score_run(session=session, run_id=whole.id, full_rescore=True)
+
+    sharded = create_scoring_run(
+        session=session, profile_id=prof.id, ingestion_run_id=None, meta={"full_rescore": True}
+    )
+    session.commit()
+    ranges = plan_shards(session=session, run_id=sharded.id, shards=4)
+    assert len(ranges) == 4
+    assert all(
+        lo <= hi < next_lo for (lo, hi), (next_lo, _) in zip(ranges, ranges[1:], strict=False)
+    )
+
+    # shards may complete in any order
+    results = {i: score_shard(session=session, run_id=sharded.id, shard=i) for i in (2, 0, 3, 1)}
+    assert session.get(ScoringRun, sharded.id).status == ScoringRunStatus.started
+    finish_sharded_run(
+        session=session, run_id=sharded.id, shard_results=[results[i] for i in range(4)]
+    )
+
+    run = session.get(ScoringRun, sharded.id)
+    assert run.status == ScoringRunStatus.finished
+    assert run.meta["jobs"] == 25
+    assert [s["jobs"] for s in run.meta["shards"]] == [7, 7, 7, 4]
+    assert _results(sharded.id) == _results(whole.id)
+
+
+def test_sharded_run_fails_when_a_shard_fails(session):
+    prof = CandidateProfile(label="me", skills=["python"])
+    session.add(prof)
+    session.add_all([JobPosting(source="stub", source_item_id=str(i), raw={}) for i in range(4)])
+    session.commit()
+    run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+
+    plan_shards(session=session, run_id=run.id, shards=2)
+    first = score_shard(session=session, run_id=run.id, shard=0)
+    finish_sharded_run(session=session, run_id=run.id, shard_results=[first, None])
+
+    run = session.get(ScoringRun, run.id)
+    assert run.status == ScoringRunStatus.failed
+    assert run.meta["failed_shards"] == [1]
+    assert run.finished_at is not None
+
+
+def test_score_runs_scores_all_profiles_in_one_pass(session):
+    profiles = [
+        CandidateProfile(label="py", skills=["Python", "SQL"]),
+        CandidateProfile(label="web", skills=["javascript", "java", "react"]),
+        CandidateProfile(label="none", skills=[]),
+    ]
+    session.add_all(profiles)
+    session.add_all(
+        [
+            JobPosting(
+                source="stub",
+                source_item_id=str(i),
+                title=["Senior Python Dev", "JavaScript Intern", "SQL Analyst"][i % 3],
+                raw={"i": i},
+            )
+            for i in range(7)
+        ]
+    )
+    session.commit()
+
+    runs = [
+        create_scoring_run(session=session, profile_id=p.id, ingestion_run_id=None)
+        for p in profiles
+    ]
+    session.commit()
+
+    statements: list[str] = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    score_runs(session=session, run_ids=[r.id for r in runs], chunk_size=100)
+
+    # one chunk + the empty terminating chunk, shared by all three profiles
+    assert len([s for s in statements if s.startswith("SELECT job_postings.id")]) == 2
+
+    jobs = session.execute(select(JobPosting)).scalars().all()
+    for run, prof in zip(runs, profiles, strict=True):
+        assert run.status == ScoringRunStatus.finished
+        assert run.meta["jobs"] == 7
+        items = {
+            it.job_id: it
+            for it in session.execute(
+                select(ScoreItem).where(ScoreItem.scoring_run_id == run.id)
+            ).scalars()
+        }
+        for job in jobs:
+            expected = score_job(
+                profile_skills=prof.skills,
+                job_title=job.title,
+                company=job.company,
+                url=job.url,
+                raw=job.raw,
+            )
+            got = items[job.id]
+            assert (got.score, got.skills_matched, got.skills_missing, got.reasons) == (
+                expected.score,
+                expected.skills_matched,
+                expected.skills_missing,
+                expected.reasons,
+            )
+
+
+def test_score_runs_keeps_each_runs_own_scorer(session):
+    profiles = [
+        CandidateProfile(label="a", skills=["go"]),
+        CandidateProfile(label="b", skills=["go"]),
+    ]
+    session.add_all(profiles)
+    session.add(JobPosting(source="stub", source_item_id="1", title="Google Designer", raw={}))
+    session.commit()
+    heuristic = create_scoring_run(
+        session=session, profile_id=profiles[0].id, ingestion_run_id=None
+    )
+    tokens = create_scoring_run(
+        session=session, profile_id=profiles[1].id, ingestion_run_id=None, meta={"scorer": "tokens"}
+    )
+    session.commit()
+
+    score_runs(session=session, run_ids=[heuristic.id, tokens.id])
+
+    assert (heuristic.meta["scorer"], tokens.meta["scorer"]) == ("heuristic", "tokens")
+    matched = {
+        it.scoring_run_id: it.skills_matched for it in session.execute(select(ScoreItem)).scalars()
+    }
+    # "go" is a substring of "google" but not one of its tokens
+    assert matched == {heuristic.id: ["go"], tokens.id: []}
+
+
+def test_score_run_serves_unchanged_jobs_from_score_cache(session):
+    prof = CandidateProfile(label="me", skills=["python", "sql"])
+    session.add(prof)
+    session.commit()
+    connector = StubConnector(
+        [
+            JobPostingIn(source="stub", source_item_id=str(i), title=title, raw={"i": i})
+            for i, title in enumerate(["Python Dev", "SQL Intern", "Designer"])
+        ]
+    )
+    assert run_ingestion(session=session, connector=connector, limit=10) == 0
+
+    def _run() -> ScoringRun:
+        run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+        session.commit()
+        score_run(session=session, run_id=run.id, full_rescore=True)
+        return run
+
+    def _results(run_id: int) -> list[tuple]:
+        return [
+            (it.job_id, it.score, it.skills_matched, it.skills_missing, it.reasons)
+            for it in session.execute(
+                select(ScoreItem)
+                .where(ScoreItem.scoring_run_id == run_id)
+                .order_by(ScoreItem.job_id)
+            ).scalars()
+        ]
+
+    cold = _run()
+    assert cold.meta["cache"] == {"enabled": True, "hits": 0, "misses": 3}
+    warm = _run()
+    assert warm.meta["cache"] == {"enabled": True, "hits": 3, "misses": 0}
+    assert _results(warm.id) == _results(cold.id)
+
+    # a different skill list is a different profile fingerprint
+    prof.skills = ["python"]
+    session.commit()
+    changed = _run()
+    assert changed.meta["cache"]["hits"] == 0
+
+    assert session.execute(select(func.count(ScoreCacheEntry.id))).scalar_one() == 6
+
+
+def test_store_scores_binds_a_fixed_number_of_variables(session):
+    # 9 columns per row: one multi-row VALUES for 5,000 rows would need 45,000
+    # variables, past SQLite's default limit of 32,766 (this build may allow more)
+    dbapi_conn = session.connection().connection.dbapi_connection
+    dbapi_conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 32766)
+    key = ScoreCacheKey(scorer_version=SCORER_VERSION, profile_fingerprint="p")
+    results = {
+        f"job-{i}": ScoreResult(
+            score=float(i % 100), skills_matched=["python"], skills_missing=[], reasons={}
+        )
+        for i in range(5000)
+    }
+    store_scores(session, key, results)
+    # a second write of an existing entry is a no-op
+    store_scores(session, key, {"job-0": results["job-4999"]})
+    session.commit()
+
+    assert session.execute(select(func.count(ScoreCacheEntry.id))).scalar_one() == 5000
+    cached = lookup_scores(session, key, ["job-0", "job-4999"])
+    assert cached == {"job-0": results["job-0"], "job-4999": results["job-4999"]}
+
+
+def test_prune_score_cache_evicts_unused_entries(session):
+    now = datetime.now(tz=UTC)
+    for fp, last_used in [("old", now - timedelta(days=40)), ("recent", now)]:
+        session.add(
+            ScoreCacheEntry(
+                scorer_version=SCORER_VERSION,
+                profile_fingerprint="p",
+                job_fingerprint=fp,
+                score=1.0,
+                created_at=last_used,
+                last_used_at=last_used,
+            )
+        )
+    session.commit()
+
+    assert prune_score_cache(session, older_than=now - timedelta(days=30)) == 1
+    remaining = session.execute(select(ScoreCacheEntry.job_fingerprint)).scalars().all()
+    assert remaining == ["recent"]
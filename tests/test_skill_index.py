@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from conftest import StubConnector, stub_job
+from sqlalchemy import event, select
+
+from ai_job_aggregator.ingest import run_ingestion
+from ai_job_aggregator.models import CandidateProfile, JobPosting
+from ai_job_aggregator.models.scoring import ScoreItem
+from ai_job_aggregator.models.skill_index import SkillPosting, SkillTerm
+from ai_job_aggregator.scoring.service import create_scoring_run, score_run
+from ai_job_aggregator.skill_index import ensure_terms, term_postings
+
+
+def _postings(session) -> set[tuple[str, str]]:
+    return set(
+        session.execute(
+            select(SkillTerm.term, JobPosting.source_item_id)
+            .join(SkillPosting, SkillPosting.term_id == SkillTerm.id)
+            .join(JobPosting, JobPosting.id == SkillPosting.job_id)
+        ).all()
+    )
+
+
+def test_ensure_terms_backfills_and_ingestion_maintains_postings(session):
+    items = [stub_job(1, "python and sql"), stub_job(2, "javascript")]
+    run_ingestion(session=session, connector=StubConnector(items), limit=10)
+
+    vocab = ensure_terms(session, ["python", "java"])
+    session.commit()
+    assert _postings(session) == {("python", "1"), ("java", "2")}
+    assert term_postings(session, vocab)["java"] == {
+        session.execute(select(JobPosting.id).where(JobPosting.source_item_id == "2")).scalar()
+    }
+
+    # known terms are indexed at ingest: for new postings and changed ones only
+    items = [stub_job(1, "rust"), stub_job(2, "javascript"), stub_job(3, "python, java")]
+    run_ingestion(session=session, connector=StubConnector(items), limit=10)
+    assert _postings(session) == {("java", "2"), ("python", "3"), ("java", "3")}
+
+    # an existing term is not backfilled again
+    assert ensure_terms(session, ["python"]) == {"python": vocab["python"]}
+
+
+def test_index_scorer_matches_heuristic(session):
+    texts = ["Python, SQL", "javascript", "go and machine  learning", "", "c++ / postgresql"]
+    items = [stub_job(i, t) for i, t in enumerate(texts)]
+    run_ingestion(session=session, connector=StubConnector(items), limit=10)
+    prof = CandidateProfile(
+        label="me", skills=["python", "Java", "script", "SQL", "machine learning", "c++"]
+    )
+    session.add(prof)
+    session.flush()
+
+    results = {}
+    for scorer in ("heuristic", "index"):
+        run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+        session.commit()
+        score_run(session=session, run_id=run.id, full_rescore=True, scorer=scorer)
+        results[scorer] = session.execute(
+            select(ScoreItem.job_id, ScoreItem.score, ScoreItem.skills_matched)
+            .where(ScoreItem.scoring_run_id == run.id)
+            .order_by(ScoreItem.job_id)
+        ).all()
+
+    assert results["index"] == results["heuristic"]
+    assert any(r.skills_matched for r in results["index"])
+
+
+def test_index_scorer_reads_no_job_text(session):
+    run_ingestion(session=session, connector=StubConnector([stub_job(1, "python")]), limit=10)
+    prof = CandidateProfile(label="me", skills=["python"])
+    session.add(prof)
+    session.flush()
+    ensure_terms(session, prof.skills)
+    run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        score_run(session=session, run_id=run.id, full_rescore=True, scorer="index")
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert any("FROM job_postings" in s for s in statements)
+    assert not [s for s in statements if "search_text" in s]
+    assert session.execute(select(ScoreItem.score)).scalar_one() > 0
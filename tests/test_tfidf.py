@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from conftest import StubConnector, stub_job
+from sqlalchemy import delete, select
+
+from ai_job_aggregator.ingest import run_ingestion
+from ai_job_aggregator.models import CandidateProfile, JobPosting
+from ai_job_aggregator.models.scoring import ScoreItem, ScoringRun
+from ai_job_aggregator.scoring.service import create_scoring_run, score_run
+from ai_job_aggregator.scoring.shards import finish_sharded_run, plan_shards, score_shard
+from ai_job_aggregator.settings import Settings
+
+np = pytest.importorskip("numpy")
+
+from ai_job_aggregator.scoring.tfidf import TfidfIndex, TfidfMatcher, synced_index  # noqa: E402
+
+
+def _ingest(session, texts: dict[int, str]) -> None:
+    items = [stub_job(i, t) for i, t in texts.items()]
+    run_ingestion(session=session, connector=StubConnector(items), limit=100)
+
+
+def _job_id(session, source_item_id: str) -> int:
+    return session.execute(
+        select(JobPosting.id).where(JobPosting.source_item_id == source_item_id)
+    ).scalar_one()
+
+
+def test_index_syncs_incrementally_and_round_trips(session, tmp_path):
+    path = tmp_path / "tfidf.npz"
+    _ingest(session, {1: "python sql", 2: "python rust", 3: "go"})
+    index = synced_index(session, path)
+    assert index.live_rows == 3 and path.exists()
+
+    # unchanged postings are not re-vectorized; changed ones replace their row
+    _ingest(session, {1: "python sql", 2: "python haskell", 3: "go", 4: "python"})
+    stats = TfidfIndex.load(path).sync(session)
+    assert stats == {"added": 2, "removed": 1}
+
+    session.execute(delete(JobPosting).where(JobPosting.source_item_id == "3"))
+    session.commit()
+    index = synced_index(session, path)
+    assert sorted(index.rows_by_job()) == sorted(_job_id(session, str(i)) for i in (1, 2, 4))
+
+    # document frequencies equal those of a fresh build
+    fresh = TfidfIndex.empty()
+    fresh.sync(session)
+    assert np.array_equal(index.df, fresh.df)
+    assert np.array_equal(TfidfIndex.load(path).df, fresh.df)
+
+
+def test_tfidf_weighs_distinctive_skills_higher(session, tmp_path):
+    # "python" is everywhere, "rust" is rare
+    texts = {i: "python developer" for i in range(1, 9)}
+    texts[9] = "rust developer"
+    texts[10] = "python rust developer"
+    _ingest(session, texts)
+    matcher = TfidfMatcher(synced_index(session, tmp_path / "tfidf.npz"), ["Python", "Rust"])
+
+    rows = session.execute(
+        select(
+            JobPosting.id,
+            JobPosting.title,
+            JobPosting.company,
+            JobPosting.search_text,
+            JobPosting.content_hash,
+        )
+    ).all()
+    by_item = {}
+    for row in rows:
+        item = session.get(JobPosting, row.id).source_item_id
+        by_item[item] = matcher.score_row(row)
+
+    assert by_item["9"].score > by_item["1"].score
+    assert by_item["10"].score > by_item["9"].score
+    assert by_item["10"].skills_matched == ["python", "rust"]
+    assert by_item["1"].skills_missing == ["rust"]
+
+
+def test_score_run_with_tfidf_scorer_bypasses_cache(session, tmp_path, monkeypatch):
+    monkeypatch.setenv("AJA_TFIDF_INDEX_PATH", str(tmp_path / "tfidf.npz"))
+    _ingest(session, {1: "python and rust", 2: "cobol"})
+    prof = CandidateProfile(label="me", skills=["python", "rust"])
+    session.add(prof)
+    session.flush()
+    run = create_scoring_run(session=session, profile_id=prof.id, ingestion_run_id=None)
+    session.commit()
+
+    score_run(session=session, run_id=run.id, scorer="tfidf")
+
+    scores = dict(
+        session.execute(
+            select(JobPosting.source_item_id, ScoreItem.score).join(
+                JobPosting, JobPosting.id == ScoreItem.job_id
+            )
+        ).all()
+    )
+    assert scores["1"] > 50.0
+    assert scores["2"] == 0.0
+    meta = session.get(ScoringRun, run.id).meta
+    assert meta["scorer"] == "tfidf"
+    assert meta["cache"]["enabled"] is False
+
+
+def test_default_index_path_is_per_database(tmp_path):
+    a = Settings(storage_dir=tmp_path, db_path=tmp_path / "a.sqlite3")
+    b = Settings(storage_dir=tmp_path, db_path=tmp_path / "b.sqlite3")
+    assert a.resolved_tfidf_index_path() == tmp_path / "a.tfidf.npz"
+    assert b.resolved_tfidf_index_path() == tmp_path / "b.tfidf.npz"
+    assert Settings(storage_dir=tmp_path, db_path=None).resolved_tfidf_index_path() == (
+        tmp_path / "data" / "jobs.tfidf.npz"
+    )
+
+
+def test_concurrent_saves_each_write_their_own_temporary_file(session, tmp_path):
+    path = tmp_path / "tfidf.npz"
+    _ingest(session, {1: "python sql", 2: "go"})
+    index = TfidfIndex.empty()
+    index.sync(session)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: index.save(path), range(16)))
+
+    assert TfidfIndex.load(path).live_rows == 2
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
+def test_sharded_tfidf_run_syncs_the_index_once_when_planned(session, tmp_path, monkeypatch):
+    monkeypatch.setenv("AJA_TFIDF_INDEX_PATH", str(tmp_path / "tfidf.npz"))
+    _ingest(session, {1: "python and rust", 2: "cobol", 3: "python"})
+    prof = CandidateProfile(label="me", skills=["python"])
+    session.add(prof)
+    session.flush()
+    run = create_scoring_run(
+        session=session,
+        profile_id=prof.id,
+        ingestion_run_id=None,
+        meta={"scorer": "tfidf", "full_rescore": True},
+    )
+    session.commit()
+
+    ranges = plan_shards(session=session, run_id=run.id, shards=2)
+    assert (tmp_path / "tfidf.npz").exists()
+    # changed after planning: shards vectorize it, the index is left as synced
+    _ingest(session, {2: "python"})
+
+    def _no_sync(self, session):
+        raise AssertionError("shards must not sync the index")
+
+    monkeypatch.setattr(TfidfIndex, "sync", _no_sync)
+    results = [score_shard(session=session, run_id=run.id, shard=i) for i in range(len(ranges))]
+    finish_sharded_run(session=session, run_id=run.id, shard_results=results)
+
+    run = session.get(ScoringRun, run.id)
+    assert run.meta["jobs"] == 3
+    assert run.meta["failed"] == 0
+    score = session.execute(
+        select(ScoreItem.score).where(ScoreItem.job_id == _job_id(session, "2"))
+    ).scalar_one()
+    assert score > 0.0
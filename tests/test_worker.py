@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import functools
+import os
+import signal
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import ai_job_aggregator.scoring.tasks as tasks
+import ai_job_aggregator.worker as worker_module
+from ai_job_aggregator.models import CandidateProfile, JobPosting
+from ai_job_aggregator.models.scoring import ScoringRun, ScoringRunStatus
+from ai_job_aggregator.scoring.service import create_scoring_run
+from ai_job_aggregator.worker import WorkerPool
+
+
+def test_score_run_task_reuses_per_process_state(session):
+    prof = CandidateProfile(label="me", skills=["python"])
+    session.add(prof)
+    session.add(JobPosting(source="stub", source_item_id="1", title="Python Dev", raw={}))
+    session.commit()
+    run_ids = [
+        create_scoring_run(
+            session=session, profile_id=prof.id, ingestion_run_id=None, meta={"full_rescore": True}
+        ).id
+        for _ in range(2)
+    ]
+    session.commit()
+
+    tasks.dispose_worker_state()
+    state = tasks.warm_worker_state()
+    try:
+        assert state.engine.pool.checkedin() == 0  # nothing pooled to leak into a fork
+        for run_id in run_ids:
+            tasks.score_run_task(run_id=run_id)
+            assert tasks.worker_state() is state
+
+        tasks._reset_pool_after_fork()
+        assert state.engine.pool.checkedin() == 0
+    finally:
+        tasks.dispose_worker_state()
+
+    session.expire_all()
+    assert all(
+        session.get(ScoringRun, run_id).status == ScoringRunStatus.finished for run_id in run_ids
+    )
+    assert tasks._state is None
+
+
+def _crash_once(tmp_path, name: str) -> None:
+    slot = name.split(".")[-2]
+    marker = tmp_path / f"crashed-{slot}"
+    if not marker.exists():
+        marker.touch()
+        os._exit(1)
+    (tmp_path / f"done-{slot}").touch()
+
+
+def _drain_on_sigterm(tmp_path, name: str) -> None:
+    slot = name.split(".")[-2]
+    stop = []
+    signal.signal(signal.SIGTERM, lambda *_: stop.append(True))
+    (tmp_path / f"started-{slot}").touch()
+    if slot == "1":
+        # the last child to start asks the supervisor to shut down
+        while not (tmp_path / "started-0").exists():
+            time.sleep(0.01)
+        os.kill(os.getppid(), signal.SIGTERM)
+    while not stop:
+        time.sleep(0.01)
+    (tmp_path / f"drained-{slot}").touch()
+
+
+def _pool(target) -> WorkerPool:
+    return WorkerPool(
+        concurrency=2, target=target, report_interval=None, restart_backoff=0, poll_interval=0.05
+    )
+
+
+def test_worker_pool_restarts_crashed_children(tmp_path):
+    pool = _pool(functools.partial(_crash_once, tmp_path))
+    pool.run()
+
+    assert pool.restarts == 2
+    assert sorted(p.name for p in tmp_path.glob("done-*")) == ["done-0", "done-1"]
+
+
+def test_worker_pool_forwards_sigterm_and_waits_for_children(tmp_path):
+    pool = _pool(functools.partial(_drain_on_sigterm, tmp_path))
+    pool.run()
+
+    assert pool.restarts == 0
+    assert sorted(p.name for p in tmp_path.glob("drained-*")) == ["drained-0", "drained-1"]
+    assert signal.getsignal(signal.SIGTERM) is not pool.stop
+
+
+def test_worker_pool_reports_throughput_of_its_workers(monkeypatch):
+    pool = _pool(lambda name: None)
+    born = datetime.now(UTC) - timedelta(seconds=10)
+    workers = [
+        SimpleNamespace(
+            name=f"{name}.{i}.1",
+            birth_date=born,
+            successful_job_count=20,
+            failed_job_count=1,
+            total_working_time=4.0,
+        )
+        for i, name in enumerate([pool.name, "someone-else"])
+    ]
+    monkeypatch.setattr(worker_module, "redis_connection", lambda: None)
+    monkeypatch.setattr(worker_module.Worker, "all", lambda connection: workers)
+
+    (stat,) = pool.report()
+
+    assert stat["worker"] == f"{pool.name}.0.1"
+    assert stat["jobs"] == 20
+    assert stat["failed"] == 1
+    assert stat["jobs_per_s"] == pytest.approx(2.0, rel=0.05)